@@ -4,11 +4,18 @@
 from fastapi import FastAPI, Request, Depends, HTTPException, status
 from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
-from typing import Optional
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
+from typing import List, Optional
 import uvicorn
 import os
+import queue
+import logging
 import secrets
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from src.crawl_naver_api import NaverNewsAPICrawler
 from src.sentiment_analyzer import SentimentAnalyzer
@@ -20,25 +27,37 @@ sessions = {}
 
 # 감정 분석기 초기화 (지연 로딩)
 sentiment_analyzer = None
-sentiment_analyzer_openai = None  # OpenAI API를 사용하는 감정 분석기
+# OpenAI API를 사용하는 감정 분석기 (API 키별로 따로 만들어 각 사용자의 키로 요청하도록 함)
+sentiment_analyzers_openai = OrderedDict()  # API 키 -> 감정 분석기 (오래 안 쓴 것부터 제거)
+sentiment_analyzers_openai_lock = threading.Lock()
+# API 키별 OpenAI 감정 분석기를 최대 몇 개까지 보관할지
+_OPENAI_ANALYZER_CACHE_SIZE = 32
 
 def get_sentiment_analyzer(openai_api_key: Optional[str] = None, use_openai: bool = False):
     """감정 분석기 인스턴스를 가져옵니다 (지연 로딩)"""
-    global sentiment_analyzer, sentiment_analyzer_openai
+    global sentiment_analyzer
     
     if use_openai and openai_api_key:
-        # OpenAI API 사용
-        if sentiment_analyzer_openai is None:
-            try:
-                sentiment_analyzer_openai = SentimentAnalyzer(
-                    openai_api_key=openai_api_key,
-                    use_openai=True
-                )
-                print("OpenAI API 감정 분석기 초기화 완료")
-            except Exception as e:
-                print(f"OpenAI API 감정 분석기 초기화 실패: {e}")
-                sentiment_analyzer_openai = None
-        return sentiment_analyzer_openai
+        # OpenAI API 사용 (요청한 사용자의 API 키로 만든 분석기)
+        with sentiment_analyzers_openai_lock:
+            analyzer = sentiment_analyzers_openai.get(openai_api_key)
+            if analyzer is not None:
+                sentiment_analyzers_openai.move_to_end(openai_api_key)
+                return analyzer
+        try:
+            analyzer = SentimentAnalyzer(
+                openai_api_key=openai_api_key,
+                use_openai=True
+            )
+            print("OpenAI API 감정 분석기 초기화 완료")
+        except Exception as e:
+            print(f"OpenAI API 감정 분석기 초기화 실패: {e}")
+            return None
+        with sentiment_analyzers_openai_lock:
+            sentiment_analyzers_openai[openai_api_key] = analyzer
+            if len(sentiment_analyzers_openai) > _OPENAI_ANALYZER_CACHE_SIZE:
+                sentiment_analyzers_openai.popitem(last=False)
+        return analyzer
     else:
         # 로컬 모델 사용
         if sentiment_analyzer is None:
@@ -50,6 +69,38 @@ def get_sentiment_analyzer(openai_api_key: Optional[str] = None, use_openai: boo
                 sentiment_analyzer = None
         return sentiment_analyzer
 
+
+@app.on_event("startup")
+async def start_sentiment_logging():
+    """감정 분석 모듈의 로그를 큐에 넣고 별도 스레드에서 출력 (요청 처리 스레드가 로그 출력에 막히지 않도록)"""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, handler)
+    sentiment_logger = logging.getLogger("src.sentiment_analyzer")
+    sentiment_logger.addHandler(QueueHandler(log_queue))
+    sentiment_logger.propagate = False
+    listener.start()
+    app.state.sentiment_log_listener = listener
+
+
+@app.on_event("shutdown")
+async def stop_sentiment_logging():
+    """남은 로그를 모두 출력한 뒤 로그 스레드 종료"""
+    listener = getattr(app.state, "sentiment_log_listener", None)
+    if listener:
+        listener.stop()
+
+
+@app.on_event("startup")
+async def load_sentiment_analyzer():
+    """서버 시작 시 로컬 감정 분석기를 한 번만 만들어 모든 요청에서 재사용 (모델은 백그라운드에서 미리 로드)"""
+    analyzer = get_sentiment_analyzer()
+    app.state.sentiment_analyzer = analyzer
+    if analyzer:
+        # 모델 로드가 끝나기 전에 들어온 요청은 로드가 끝날 때까지 기다렸다가 같은 모델을 사용
+        threading.Thread(target=analyzer.preload, daemon=True).start()
+
 # temp 폴더 생성
 os.makedirs('temp', exist_ok=True)
 
@@ -77,6 +128,17 @@ class TestRequest(BaseModel):
     openai_api_key: Optional[str] = None  # OpenAI API 키 (model_mode가 'openai'일 때 필요)
 
 
+# 감정 분석 API 한 번에 받을 최대 텍스트 수 (넘으면 422)
+_MAX_SENTIMENT_TEXTS = 100
+
+
+class SentimentRequest(BaseModel):
+    """감정 분석 요청 모델 (여러 텍스트를 한 번에 분석)"""
+    texts: List[str] = Field(..., max_length=_MAX_SENTIMENT_TEXTS)
+    model_mode: str = 'local'  # 'local': 로컬 모델 사용, 'openai': OpenAI API 사용
+    openai_api_key: Optional[str] = None  # OpenAI API 키 (model_mode가 'openai'일 때 필요)
+
+
 def get_session(request: Request) -> Optional[dict]:
     """세션 정보를 가져옵니다"""
     session_id = request.cookies.get("session_id")
@@ -102,6 +164,11 @@ def require_login(request: Request) -> dict:
     return session
 
 
+def get_local_sentiment_analyzer(request: Request) -> Optional[SentimentAnalyzer]:
+    """서버 시작 시 만들어 둔 로컬 감정 분석기를 가져오는 의존성 (app.state에 저장됨)"""
+    return request.app.state.sentiment_analyzer
+
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """메인 페이지 - 로그인 체크 후 테스트 인터페이스"""
@@ -2057,7 +2124,11 @@ async def logout(request: Request):
 
 
 @app.post("/api/test")
-async def test_api(request: TestRequest, session: dict = Depends(require_login)):
+async def test_api(
+    request: TestRequest,
+    session: dict = Depends(require_login),
+    local_analyzer: Optional[SentimentAnalyzer] = Depends(get_local_sentiment_analyzer)
+):
     """뉴스 검색 및 분석 API 엔드포인트"""
     try:
         print(f"[API] ===== /api/test 요청 시작 =====")
@@ -2144,11 +2215,7 @@ async def test_api(request: TestRequest, session: dict = Depends(require_login))
                     if not result.get('text'):
                         result['text'] = description or ''
                     
-                    # full_text 설정 (감정 분석용)
-                    # 요약본(text)을 full_text로 사용하거나 description 사용
-                    if not result.get('full_text'):
-                        result['full_text'] = result.get('text', '') or description or ''
-                    
+                    # full_text는 본문 추출에 성공한 기사에만 있음 (감정 분석은 없으면 description 사용)
                     print(f"[API] 기사 {len(filtered_results)+1}: text={bool(result.get('text'))}, full_text={bool(result.get('full_text'))}")
                     
                     filtered_results.append(result)
@@ -2177,33 +2244,49 @@ async def test_api(request: TestRequest, session: dict = Depends(require_login))
                 )
                 analyzer_type = "OpenAI"
             else:
-                # 로컬 모델 모드
-                analyzer = get_sentiment_analyzer(
-                    openai_api_key=None,
-                    use_openai=False
-                )
+                # 로컬 모델 모드 (서버 시작 시 만들어 둔 분석기 재사용)
+                analyzer = local_analyzer
                 analyzer_type = "로컬"
             
             if analyzer:
                 print(f"[API] {analyzer_type} 감정 분석기 준비 완료 (8GB 플랜: 모든 기사 처리)")
                 # 8GB 플랜이므로 모든 기사에 대해 감정 분석 수행
+                pending = []  # (기사 인덱스, 분석할 텍스트)
                 for idx, result in enumerate(results):
-                    # 전체 본문이 있으면 전체 본문 사용, 없으면 요약본 사용
-                    text_for_analysis = result.get('full_text') or result.get('text', '') or result.get('description', '')
+                    # 전체 본문이 있으면 전체 본문 사용, 없으면 description, 요약본 순으로 사용
+                    text_for_analysis = result.get('full_text') or result.get('description', '') or result.get('text', '')
                     if text_for_analysis:
                         print(f"[API] 감정 분석 시작 (기사 {idx + 1}/{len(results)}): 텍스트 길이={len(text_for_analysis)}자")
-                        try:
-                            # 감정 분석 수행 (로컬 또는 OpenAI)
-                            sentiment_result = analyzer.analyze(text_for_analysis, article_id=idx + 1)
-                            result['sentiment'] = sentiment_result
-                            print(f"[API] ✅ 감정 분석 완료 (기사 {idx + 1}): {sentiment_result.get('label', 'N/A')}, 온도={sentiment_result.get('temperature', 'N/A')}도")
-                        except Exception as e:
-                            print(f"[API] ❌ 감정 분석 오류 (기사 {idx + 1}): {e}")
-                            import traceback
-                            traceback.print_exc()
-                            # 감정 분석 실패 시 sentiment 필드 없이 진행
+                        pending.append((idx, text_for_analysis))
                     else:
                         print(f"[API] ⚠️ 감정 분석 생략 (기사 {idx + 1}): 분석할 텍스트 없음")
+                
+                if pending:
+                    try:
+                        # 감정 분석 수행 (로컬 모델은 여러 기사를 묶어 한 번에 추론)
+                        # 분석은 블로킹 호출이므로 스레드 풀에서 실행 (이벤트 루프가 다른 요청을 계속 처리하도록)
+                        sentiment_results = await run_in_threadpool(analyzer.analyze_batch, [text for _, text in pending])
+                    except Exception as e:
+                        # 일괄 분석 실패 시 기사별로 다시 분석 (실패한 기사만 sentiment 없이 진행)
+                        print(f"[API] ❌ 일괄 감정 분석 오류, 기사별 분석으로 전환: {e}")
+                        import traceback
+                        traceback.print_exc()
+                        sentiment_results = None
+                    
+                    for i, (idx, text_for_analysis) in enumerate(pending):
+                        if sentiment_results is not None:
+                            sentiment_result = sentiment_results[i]
+                        else:
+                            try:
+                                sentiment_result = await run_in_threadpool(analyzer.analyze, text_for_analysis, article_id=idx + 1)
+                            except Exception as e:
+                                print(f"[API] ❌ 감정 분석 오류 (기사 {idx + 1}): {e}")
+                                import traceback
+                                traceback.print_exc()
+                                # 감정 분석 실패 시 sentiment 필드 없이 진행
+                                continue
+                        results[idx]['sentiment'] = asdict(sentiment_result)
+                        print(f"[API] ✅ 감정 분석 완료 (기사 {idx + 1}): {sentiment_result.label}, 온도={sentiment_result.temperature}도")
             else:
                 print(f"[API] 감정 분석기 사용 불가 (None 반환, 모드: {analyzer_type})")
         except Exception as e:
@@ -2241,6 +2324,42 @@ async def test_api(request: TestRequest, session: dict = Depends(require_login))
         print(f"[API] ===== /api/test 요청 종료 =====")
 
 
+@app.post("/api/sentiment")
+def sentiment_api(
+    request: SentimentRequest,
+    session: dict = Depends(require_login),
+    local_analyzer: Optional[SentimentAnalyzer] = Depends(get_local_sentiment_analyzer)
+):
+    """여러 텍스트의 감정을 한 번에 분석하는 API 엔드포인트 (로컬 모델은 묶어서 한 번에 추론)"""
+    if request.model_mode == 'openai' and request.openai_api_key:
+        analyzer = get_sentiment_analyzer(openai_api_key=request.openai_api_key, use_openai=True)
+    else:
+        # 서버 시작 시 만들어 둔 로컬 분석기 재사용
+        analyzer = local_analyzer
+    if not analyzer:
+        return JSONResponse({
+            "success": False,
+            "error": "감정 분석기를 사용할 수 없습니다"
+        }, status_code=503)
+    
+    try:
+        sentiment_results = analyzer.analyze_batch(request.texts)
+    except Exception as e:
+        print(f"[API] ❌ 감정 분석 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return JSONResponse({
+            "success": False,
+            "error": f"감정 분석 실패: {str(e)}"
+        }, status_code=500)
+    
+    return JSONResponse({
+        "success": True,
+        "data": [asdict(sentiment_result) for sentiment_result in sentiment_results],
+        "count": len(sentiment_results)
+    })
+
+
 @app.get("/api/health")
 async def health_check():
     """헬스 체크 엔드포인트"""
@@ -4,12 +4,26 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
 import time
 import re
+import traceback
+import string
+from html import unescape
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
+from lxml import etree
+
+from src.http_utils import _STREAM_CHUNK_SIZE, _HostRateLimiter, _sniff_charset
 
 try:
     from openai import OpenAI
@@ -25,6 +39,469 @@ except ImportError:
     TRANSFORMERS_AVAILABLE = False
 
 
+# 기사 페이지 요청 시 사용하는 브라우저 헤더
+_BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# 인스턴스별로 캐시할 기사 페이지 HTML 개수 (페이지당 수백 KB이므로 작게 유지)
+_HTML_CACHE_SIZE = 128
+
+# 기사 페이지 동시 다운로드 수 (스레드 수이자 동시 연결 수 상한, 호스트별 요청 간격은 _HostRateLimiter가 지킴)
+_FETCH_WORKERS = 8
+# 한 번에 미리 받아 둘 기사 수 (HTML 캐시 크기보다 작아야 함)
+_FETCH_BATCH_SIZE = 16
+
+# 기사 본문 컨테이너 선택자 - 네이버 뉴스 및 주요 언론사 특화 선택자 (우선순위 순)
+_BODY_SELECTORS = (
+    # 네이버 뉴스
+    '#newsct_article',
+    '#newsEndContents',
+    '.news_end_body_body',
+    '._article_body_contents',
+    '#articleBodyContents',
+    # 주요 언론사
+    '#article-view-content-div',
+    '.article-view-content',
+    '.article-body',
+    '.article_content',
+    '#article_content',
+    '.article-body-content',
+    '#article-body',
+    '.article-body-text',
+    # 일반적인 선택자
+    'article .content',
+    'article .body',
+    'div[id*="article" i][id*="body" i]',
+    'div[id*="article" i][id*="content" i]',
+    'div[class*="article" i][class*="body" i]',
+    'div[class*="article" i][class*="content" i]',
+    'article',
+    # 마지막 수단
+    'div[id*="article" i]',
+    'div[class*="article-body" i]',
+    'div[class*="article-content" i]',
+)
+# 고정 id/클래스 선택자 (우선순위 순)와 이를 하나로 합친 선택자 (DOM을 한 번만 탐색)
+_BODY_FAST_SELECTORS = tuple(s for s in _BODY_SELECTORS if s[0] in '#.')
+_BODY_FAST_SELECTOR = ', '.join(_BODY_FAST_SELECTORS)
+# id/클래스 이름 -> 고정 선택자 (탐색으로 찾은 요소가 어떤 선택자에 일치했는지 확인용)
+_BODY_ID_SELECTORS = {s[1:]: s for s in _BODY_FAST_SELECTORS if s[0] == '#'}
+_BODY_CLASS_SELECTORS = {s[1:]: s for s in _BODY_FAST_SELECTORS if s[0] == '.'}
+
+# <head>의 og:title 메타 태그 (DOM 없이 제목을 바로 읽기 위함)
+_OG_TITLE_RE = re.compile(
+    rb'<meta[^>]+property=["\']og:title["\'][^>]+content=(["\'])(.+?)\1', re.IGNORECASE
+)
+# og:title을 찾을 HTML 앞부분 길이 (바이트)
+_OG_TITLE_SCAN_SIZE = 16384
+
+def _words_to_regex(words) -> str:
+    """
+    문자열 목록을 공통 접두사끼리 묶은 정규식 대안으로 만듭니다.
+    예: ('로이터', '로이터통신', '뉴시스', '뉴스1') -> '(?:뉴(?:스1|시스)|로이터(?:통신)?)'
+    (긴 대안 목록을 앞 글자부터 하나씩 다시 비교하지 않도록 트라이 형태로 구성)
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    
+    def build(node) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        optional = '' in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')' + ('?' if optional else '')
+    
+    return build(trie)
+
+
+# 본문/요약 정제용 정규식 (모듈 로드 시 한 번만 컴파일)
+_NEWS_OUTLETS = _words_to_regex((
+    '뉴시스', '연합뉴스', '조선일보', '중앙일보', '동아일보', '한겨레', '경향신문', '매일경제', '한국경제',
+    '서울신문', '세계일보', '문화일보', '국민일보', '내일신문', '헤럴드경제', '아시아경제', '이데일리',
+    '뉴스1', 'YTN', 'SBS', 'KBS', 'MBC', 'JTBC', '채널A', 'TV조선', 'MBN', '기자협회', 'AP', 'AFP',
+    '로이터', '로이터통신', 'Reuters', 'AP통신',
+))
+_JOB_TITLES = _words_to_regex((
+    'CEO', '대표', '회장', '사장', '이사', '부장', '차장', '과장', '팀장', '실장', '본부장', '그룹장',
+    '총괄', '책임', '담당',
+))
+
+_HASHTAG_RE = re.compile(r'#\S+')
+_PHOTO_EQ_RE = re.compile(r'사진\s*[=:]\s*[가-힣a-zA-Z\s]+', re.IGNORECASE)
+_FIGURE_EQ_RE = re.compile(r'그림\s*[=:]\s*[가-힣a-zA-Z\s]+', re.IGNORECASE)
+_TABLE_EQ_RE = re.compile(r'표\s*[=:]\s*[가-힣a-zA-Z\s]+', re.IGNORECASE)
+_PHOTO_PAREN_RE = re.compile(r'\(사진\s*[=:]\s*[^)]+\)', re.IGNORECASE)
+_FIGURE_PAREN_RE = re.compile(r'\(그림\s*[=:]\s*[^)]+\)', re.IGNORECASE)
+_TABLE_PAREN_RE = re.compile(r'\(표\s*[=:]\s*[^)]+\)', re.IGNORECASE)
+_CAPTION_BRACKET_RE = re.compile(r'\[(사진|그림|표|캡션|포토|이미지)[=:][^\]]*\]', re.IGNORECASE)
+_SOURCE_BRACKET_RE = re.compile(r'\[(' + _NEWS_OUTLETS + r')\]\s*', re.IGNORECASE)
+_SOURCE_PHOTO_RE = re.compile(r'\[.*\]\s*.*\(사진\s*[=:]\s*[^)]+\)', re.IGNORECASE)
+_PHOTO_CREDIT_TAIL_RE = re.compile(r'[/]?\s*사진\s*제공\s*[=:][^\n]*', re.IGNORECASE)
+_CREDIT_RE = re.compile(r'[/]?\s*제공\s*[=:]', re.IGNORECASE)
+_CREDIT_TAIL_RE = re.compile(r'[/]?\s*제공\s*[=:][^\n]*', re.IGNORECASE)
+_PROVIDER_RE = re.compile(r'[/]\s*[가-힣a-zA-Z\s]+\s*제공', re.IGNORECASE)
+_JOB_TITLE_CREDIT_RE = re.compile(
+    r'[가-힣a-zA-Z\s]+\s+(' + _JOB_TITLES + r')\s*[/]?\s*사진\s*제공\s*[=:][^\n]*', re.IGNORECASE
+)
+_IMAGE_CREDIT_RE = re.compile(
+    r'[가-힣\s]+(조감도|사진|그림|표|이미지)[\.]?\s*[/]\s*[가-힣a-zA-Z\s]+\s*제공', re.IGNORECASE
+)
+_IMAGE_SOURCE_RE = re.compile(r'[가-힣\s]+(조감도|사진|그림|표|이미지)[\.]?\s*[/]\s*[가-힣a-zA-Z\s]+', re.IGNORECASE)
+_CAPTION_HINT_RE = re.compile(r'[/]?\s*제공|조감도|사진\s*제공', re.IGNORECASE)
+_REPORTER_RE = re.compile(r'[가-힣]+\s*[=:]?\s*[가-힣]*\s*기자')
+# 기자 정보가 포함된 50자 미만의 줄 (_REPORTER_RE를 한 줄 안에서만 적용)
+_REPORTER_LINE_RE = re.compile(
+    r'^(?=.{0,49}$).*?[가-힣]+[^\S\n]*[=:]?[^\S\n]*[가-힣]*[^\S\n]*기자', re.MULTILINE
+)
+_REPORTER_TAG_RE = re.compile(r'[가-힣]+\s*[=:]?\s*[가-힣]*\s*기자\s*[=:]')
+_REPORTER_CONTEXT_RE = re.compile(r'기자.*(?:말|보고|전망|분석|설명|밝혀|발표)')
+_URL_RE = re.compile(r'https?://[^\s]+')
+_UI_VERB_LINE_RE = re.compile(r'^.*(보기|클릭|읽기|확인|이동|더보기|전체보기|관련보기)$', re.IGNORECASE | re.MULTILINE)
+_RELATED_VIEW_RE = re.compile(r'관련(사진|기사|영상|뉴스)보기', re.IGNORECASE)
+_BRACKET_LINE_RE = re.compile(r'^\[.*\]$')
+_JOB_TITLE_RE = re.compile(r'\b(' + _JOB_TITLES + r')\b')
+_HANGUL_3_RE = re.compile(r'[가-힣]{3,}')
+_HANGUL_5_RE = re.compile(r'[가-힣]{5,}')
+_HANGUL_10_RE = re.compile(r'[가-힣]{10,}')
+# 빈 줄이 섞인 줄바꿈 묶음은 줄바꿈 1개로, 연속 공백은 공백 1개로 (한 번의 치환)
+_BLANK_RUN_RE = re.compile(r'(\n)\s*\n+|( ) +')
+_WHITESPACE_RE = re.compile(r'\s+')
+# 검색 API가 검색어를 감싸는 <b> 태그
+_BOLD_TAG_RE = re.compile(r'</?b>')
+# 제목에서 지울 <b> 태그와 해시태그 (한 번의 치환)
+_TITLE_CLEAN_RE = re.compile(r'</?b>|#\S+')
+
+# 본문/요약 정제에서 공통으로 쓰는 (패턴, 치환 문자열) 표 - 순서대로 적용
+# 해시태그, 사진 = 연합뉴스 같은 인라인 잡음
+_INLINE_NOISE_SUBS = (
+    (_HASHTAG_RE, ''),
+    (_PHOTO_EQ_RE, ''),
+    (_FIGURE_EQ_RE, ''),
+    (_TABLE_EQ_RE, ''),
+)
+# [사진=...], (사진=...), [연합뉴스], /사진 제공=, /... 제공, 조감도 설명 같은 캡션·출처 표기
+_CAPTION_SUBS = (
+    (_CAPTION_BRACKET_RE, ''),
+    (_PHOTO_PAREN_RE, ''),
+    (_FIGURE_PAREN_RE, ''),
+    (_TABLE_PAREN_RE, ''),
+    (_SOURCE_BRACKET_RE, ''),
+    (_SOURCE_PHOTO_RE, ''),
+    (_PHOTO_CREDIT_TAIL_RE, ''),
+    (_PROVIDER_RE, ''),
+    (_CREDIT_TAIL_RE, ''),
+    (_JOB_TITLE_CREDIT_RE, ''),
+    (_IMAGE_CREDIT_RE, ''),
+    (_IMAGE_SOURCE_RE, ''),
+)
+# 요약용 캡션·출처 표 (요약은 한 줄이므로 /... 제공을 사진 제공= 꼬리보다 먼저 지워야 뒤 문장이 남음)
+_SUMMARY_CAPTION_SUBS = (
+    (_SOURCE_BRACKET_RE, ''),
+    (_PHOTO_PAREN_RE, ''),
+    (_FIGURE_PAREN_RE, ''),
+    (_TABLE_PAREN_RE, ''),
+    (_SOURCE_PHOTO_RE, ''),
+    (_PROVIDER_RE, ''),
+    (_PHOTO_CREDIT_TAIL_RE, ''),
+    (_CREDIT_TAIL_RE, ''),
+    (_IMAGE_CREDIT_RE, ''),
+    (_IMAGE_SOURCE_RE, ''),
+    (_CAPTION_BRACKET_RE, ''),
+    (_JOB_TITLE_CREDIT_RE, ''),
+)
+
+# 마지막 문장 부호까지 탐욕적으로 일치 (rfind 여러 번 대신 한 번의 스캔)
+_LAST_SENTENCE_END_RE = re.compile(r'.*[.!?。！？]', re.DOTALL)
+
+# 줄 어디에든 포함되면 제거할 키워드들 (UI 요소 및 불필요한 내용)
+_SKIP_KEYWORDS = frozenset((
+    '현재위치',
+    '기자명',
+    '입력',
+    '바로가기',
+    '복사하기',
+    '본문 글씨',
+    '글씨 줄이기',
+    '글씨 키우기',
+    'SNS',
+    '페이스북',
+    '트위터',
+    'URL복사',
+    '기사보내기',
+    '공유하기',
+    '관련기사',
+    '관련사진',
+    '관련사진보기',
+    '관련기사보기',
+    '관련영상',
+    '관련영상보기',
+    '추천기사',
+    '추천기사보기',
+    '댓글',
+    '댓글보기',
+    '좋아요',
+    '더보기',
+    '전체보기',
+    '클릭',
+    '보기',
+    '더 읽기',
+    '전체 읽기',
+    '본문 요약',
+    '지자체',
+    '관련 기사',
+    '추천 기사',
+    '기자 =',
+    '기자=',
+    '특파원 =',
+    '특파원=',
+    '인턴기자 =',
+    '인턴기자=',
+    'Copyright',
+    '©',
+    '무단 전재',
+    '재배포 금지',
+    '기사 제보',
+    '이 기사',
+    '기사 내용',
+))
+
+_SKIP_KEYWORDS_ALT = _words_to_regex(_SKIP_KEYWORDS)
+
+# 줄 시작에서 일치하면 제거: 캡션/출처 대괄호, 저작권·제보 문구, 기자·특파원 표기,
+# "관련 ... 보기" 같은 UI 문구
+_SKIP_LINE_PREFIXES = (
+    r'\[(?:사진|그림|표|캡션)[=:]'
+    r'|\[.*(?:사진|그림|표|캡션|기자).*\]'
+    r'|\[(?:포토|이미지)[=:].*\]'
+    r'|\[(?:' + _NEWS_OUTLETS + r')\]'
+    r'|관련[^\S\n]*기사|댓글|기자[^\S\n]*[=:]|제보|Copyright|©|무단[^\S\n]*전재|재배포[^\S\n]*금지'
+    r'|기사[^\S\n]*(?:제보|내용)|이[^\S\n]*기사'
+    r'|.*@.*\.(?:com|kr|net)'
+    r'|.*기자.*(?:=|기자|특파원|인턴)'
+    r'|.*특파원.*='
+    r'|(?:관련|추천|더|전체|기사|뉴스|사진|영상).*(?:보기|클릭|읽기|확인|이동)'
+)
+# 줄 어디에든 나타나면 제거: 해시태그, 사진=/그림=/표=, 이메일, UI 동사로 끝나는 줄,
+# 관련...보기, (사진=...) 캡션, 사진 제공=, 키워드
+_SKIP_LINE_CONTAINS = (
+    r'#\S+'
+    r'|(?:사진|그림|표)[^\S\n]*[=:](?:[가-힣a-zA-Z]|[^\S\n]+\S)'
+    r'|(?-i:[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    r'|(?:보기|클릭|읽기|확인|이동)[^\S\n]*$'
+    r'|관련(?:사진|기사|영상|뉴스)보기'
+    r'|\((?:사진|그림|표)[^\S\n]*[=:][^\S\n]*[^)\n]+\)'
+    r'|사진[^\S\n]*제공[^\S\n]*[=:]'
+    r'|(?-i:' + _SKIP_KEYWORDS_ALT + r')'
+)
+# 짧은 텍스트에서 정제 단계가 건드릴 수 있는 흔적 (하나도 없으면 정제를 건너뜀)
+# 줄 제거 패턴(_SKIP_LINE_PREFIXES, _SKIP_LINE_CONTAINS)을 그대로 포함해 정제가 반응하는 경우를 모두 덮음
+_HAS_NOISE_RE = re.compile(
+    r'^[^\S\n]*(?:' + _SKIP_LINE_PREFIXES + r')|' + _SKIP_LINE_CONTAINS
+    + r'|[#=:@/()\[\]\n]| {2}|기자|특파원|제공|제보|보기|클릭|읽기|확인|이동|' + _JOB_TITLES + r'|'
+    + _SKIP_KEYWORDS_ALT,
+    re.IGNORECASE
+)
+# 정제 없이 그대로 쓸 수 있는 텍스트 길이 범위 (이보다 짧은 줄은 정제 시 제거될 수 있음)
+_SHORT_TEXT_MIN = 10
+_SHORT_TEXT_MAX = 100
+
+# 무조건 제거할 줄 전체를 본문 버퍼에서 한 번에 지우는 패턴
+# (줄 앞뒤 공백은 무시하고, 줄바꿈을 넘어가지 않도록 [^\S\n]만 사용)
+_SKIP_LINES_RE = re.compile(
+    r'^[^\S\n]*(?:' + _SKIP_LINE_PREFIXES + r').*$'
+    r'|^(?=.*?(?:' + _SKIP_LINE_CONTAINS + r')).*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+# 본문 안에서 제거할 UI 요소 (버튼, 링크, 메뉴 등)
+_UI_TAGS = ['div', 'section', 'aside', 'span', 'a', 'button']
+# 클래스나 ID에 이 키워드가 들어 있으면 UI 요소로 간주
+_UI_KEYWORDS = (
+    'button', 'btn', 'menu', 'nav', 'header', 'footer',
+    'sidebar', 'aside', 'toolbar', 'tool-bar',
+    'share', 'sns', 'social', 'comment', 'reply',
+    'ad', 'advertisement', 'sponsor', 'promo', 'banner',
+    'related', 'recommend', 'recommended', 'more', 'more-news',
+    'current', 'location', 'breadcrumb', 'bread-crumb',
+    'font-size', 'font-size-control', 'text-size',
+    'copy', 'url-copy', 'clipboard',
+    'print', 'email', 'facebook', 'twitter', 'kakao'
+)
+_UI_ATTR_SELECTOR = ':is({}):is({})'.format(
+    ', '.join(_UI_TAGS),
+    ', '.join(f'[{attr}*="{keyword}" i]' for keyword in _UI_KEYWORDS for attr in ('class', 'id')),
+)
+# 50자 미만 태그에 이 문구가 들어 있으면 UI 요소로 간주
+_UI_TEXT_PATTERNS = (
+    '현재위치', '지자체', '기자명', '입력', '바로가기',
+    '복사하기', '본문 글씨', 'SNS', '페이스북', '트위터',
+    'URL복사', '기사보내기', '공유하기', '댓글', '좋아요',
+    '관련기사', '관련사진', '관련사진보기', '관련기사보기',
+    '관련영상', '관련영상보기', '추천기사', '추천기사보기',
+    '댓글보기', '더보기', '전체보기', '더 읽기', '전체 읽기',
+    '보기', '클릭', '확인', '이동'
+)
+_UI_TEXT_RE = re.compile(_words_to_regex(_UI_TEXT_PATTERNS))
+_UI_VERB_END_RE = re.compile(r'(보기|클릭|읽기|확인|이동|더보기|전체보기|관련보기)$', re.IGNORECASE)
+_DATE_PREFIX_RE = re.compile(r'\d{4}\.\d{2}\.\d{2}')
+
+# pubDate 형식 (네이버 API가 주는 RFC 822 형식이 대부분)
+_RFC822_DATE_FORMATS = (
+    "%a, %d %b %Y %H:%M:%S %z",  # "Thu, 11 Dec 2025 00:23:00 +0900"
+    "%a, %d %b %Y %H:%M:%S",     # "Thu, 11 Dec 2025 00:23:00"
+)
+_ISO_DATE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",         # "2025-12-11 00:23:00"
+    "%Y-%m-%d",                  # "2025-12-11"
+)
+
+# RFC 822 날짜의 영문 월 이름
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+# 날짜 변환 및 언어 판별용 정규식
+_HANGUL_RE = re.compile(r'[가-힣]')
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+
+def _matching_body_selectors(elem_id: Optional[str], elem_classes) -> List[str]:
+    """요소의 id와 클래스 목록에 일치하는 고정 본문 선택자들을 반환합니다"""
+    selectors = [_BODY_CLASS_SELECTORS[c] for c in elem_classes if c in _BODY_CLASS_SELECTORS]
+    if elem_id in _BODY_ID_SELECTORS:
+        selectors.append(_BODY_ID_SELECTORS[elem_id])
+    return selectors
+
+
+def _apply_subs(text: str, subs) -> str:
+    """(패턴, 치환 문자열) 표를 순서대로 text에 적용합니다"""
+    for pattern, replacement in subs:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _clean_title(title: str) -> str:
+    """제목에서 <b> 태그와 해시태그를 지우고 연속된 공백을 정리합니다"""
+    return _WHITESPACE_RE.sub(' ', _TITLE_CLEAN_RE.sub('', title)).strip()
+
+
+@lru_cache(maxsize=1024)
+def _source_from_link(link: str) -> str:
+    """링크의 도메인(www. 제외)을 반환합니다. 같은 링크는 다시 파싱하지 않음"""
+    try:
+        domain = urlparse(link).netloc
+        # www. 제거
+        domain = domain.replace('www.', '')
+        return domain
+    except:
+        return "알 수 없음"
+
+
+def _parse_rfc822(date_str: str) -> Optional[datetime]:
+    """
+    "Thu, 11 Dec 2025 00:23:00 +0900" 형태의 날짜를 고정 위치로 읽습니다.
+    (시간대는 표시에 쓰지 않으므로 무시) 모양이 다르면 None
+    """
+    if len(date_str) < 25 or date_str[7] != ' ' or date_str[11] != ' ' or date_str[16] != ' ' \
+            or date_str[19] != ':' or date_str[22] != ':':
+        return None
+    month = _MONTHS.get(date_str[8:11])
+    if month is None:
+        return None
+    try:
+        return datetime(
+            int(date_str[12:16]), month, int(date_str[5:7]),
+            int(date_str[17:19]), int(date_str[20:22]), int(date_str[23:25])
+        )
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=2048)
+def _format_date_korean_cached(date_str: str) -> str:
+    """NaverNewsAPICrawler._format_date_korean의 실제 구현 (같은 pubDate는 다시 파싱하지 않음)"""
+    if not date_str:
+        return "알 수 없음"
+    
+    try:
+        parsed_date = None
+        date_str_stripped = date_str.strip()
+        
+        # 문자열 모양으로 형식을 먼저 고르고, 맞는 형식만 시도 (실패 예외를 여러 번 일으키지 않음)
+        if len(date_str_stripped) >= 10 and date_str_stripped[4] == '-':
+            # ISO 형식("2025-12-11", "2025-12-11 00:23:00")은 strptime 없이 바로 변환
+            try:
+                parsed_date = datetime.fromisoformat(date_str_stripped)
+            except ValueError:
+                pass
+            date_formats = ()  # fromisoformat이 실패하면 ISO strptime 형식도 실패함
+        elif date_str_stripped[3:5] == ', ':
+            # 네이버 API의 RFC 822 형식("Thu, 11 Dec 2025 00:23:00 +0900")은 고정 위치를 바로 읽고,
+            # 모양이 다르면 email 파서로 변환
+            parsed_date = _parse_rfc822(date_str_stripped)
+            if parsed_date is None:
+                try:
+                    parsed_date = parsedate_to_datetime(date_str_stripped)
+                except (TypeError, ValueError):
+                    pass
+            date_formats = _RFC822_DATE_FORMATS
+        else:
+            date_formats = _RFC822_DATE_FORMATS + _ISO_DATE_FORMATS
+        
+        if parsed_date is None:
+            for fmt in date_formats:
+                try:
+                    parsed_date = datetime.strptime(date_str_stripped, fmt)
+                    break
+                except ValueError:
+                    continue
+        
+        if parsed_date is None and date_formats:
+            # 마지막 시도: 공백 제거 후 다시 시도 (ISO 형식은 이미 fromisoformat으로 판단함)
+            date_str_clean = date_str.strip()
+            # "+0900", "-0500" 같은 타임존이 붙어 있을 때만 제거 후 시도
+            if '+' in date_str_clean or '-0' in date_str_clean[-6:]:
+                if len(date_str_clean) >= 5 and date_str_clean[-5] in '+-' and date_str_clean[-4:].isdigit():
+                    date_str_clean = date_str_clean[:-5].rstrip()
+                try:
+                    parsed_date = datetime.strptime(date_str_clean, "%a, %d %b %Y %H:%M:%S")
+                except ValueError:
+                    pass
+        
+        if parsed_date is None:
+            return date_str
+        
+        # 한국어 형식으로 변환: "2025년 12월 11일 00:23" (월/일 앞의 0은 붙이지 않음)
+        return (
+            f"{parsed_date.year}년 {parsed_date.month}월 {parsed_date.day}일 "
+            f"{parsed_date.hour:02d}:{parsed_date.minute:02d}"
+        )
+    except Exception as e:
+        # 파싱 실패 시 원본 반환
+        print(f"날짜 파싱 오류: {e}, 원본: {date_str}")
+        return date_str
+
+
+def _last_sentence_end(text: str) -> int:
+    """text에서 마지막 문장 부호(. ! ? 。 ！ ？)의 위치를 반환합니다. 없으면 -1"""
+    match = _LAST_SENTENCE_END_RE.match(text)
+    return match.end() - 1 if match else -1
+
+
 class NaverNewsAPICrawler:
     """네이버 검색 API를 사용한 뉴스 크롤링 클래스"""
     
@@ -34,7 +511,7 @@ class NaverNewsAPICrawler:
         Args:
             client_id: 네이버 개발자 센터에서 발급받은 Client ID
             client_secret: 네이버 개발자 센터에서 발급받은 Client Secret
-            delay: API 요청 간 대기 시간(초). API 제한 방지용
+            delay: 요청 간 대기 시간(초). API 제한 방지용 (기사 페이지는 호스트별 평균 요청 간격으로 사용)
             openai_api_key: OpenAI API 키 (요약 기능 사용 시 필요, summary_mode가 'openai'일 때)
             summary_mode: 요약 모드 ('kosum-v1-fast', 'kosum-v1-tuned' 또는 'openai'), 기본값은 'kosum-v1-fast'
         """
@@ -63,6 +540,60 @@ class NaverNewsAPICrawler:
         self.kosum_tuned_model = None
         self.kosum_tuned_tokenizer = None
         self.kosum_tuned_device = None
+        
+        # 검색 API와 기사 페이지 요청이 함께 쓰는 세션 (연결 재사용, 일시적 오류 재시도)
+        # 브라우저 헤더는 기사 페이지 요청에만 붙임 (검색 API에는 인증 헤더만 보냄)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_FETCH_WORKERS,
+            pool_maxsize=_FETCH_BATCH_SIZE,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # 기사 페이지 요청 간격 제한 (동시 다운로드 작업자가 호스트별로 공유)
+        self._rate_limiter = _HostRateLimiter(delay)
+        
+        # 기사 페이지 HTML 캐시 (조회수/제목/본문 추출이 같은 링크를 다시 요청하지 않도록)
+        self._fetch_html = lru_cache(maxsize=_HTML_CACHE_SIZE)(self._download_html)
+    
+    def clear_http_cache(self):
+        """기사 페이지 HTML 캐시를 비웁니다"""
+        self._fetch_html.cache_clear()
+    
+    def _prefetch_html(self, links: List[str]):
+        """
+        여러 기사 페이지를 동시에 내려받아 HTML 캐시를 채웁니다.
+        실패한 링크는 캐시되지 않으므로 이후 추출 단계에서 다시 시도됩니다.
+        """
+        links = [link for link in dict.fromkeys(links) if link]
+        if not links:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(_FETCH_WORKERS, len(links))) as executor:
+            for link in links:
+                executor.submit(self._fetch_html, link)
+    
+    def _download_html(self, link: str) -> Tuple[bytes, str]:
+        """
+        호스트별 요청 간격을 지켜 기사 페이지 HTML을 다운로드합니다.
+        요청이 실패하면 예외를 그대로 전달하므로 실패한 결과는 캐시되지 않습니다.
+        
+        Returns:
+            (디코딩하지 않은 HTML 바이트, 인코딩) - 파서가 바이트를 직접 읽도록 response.text를 만들지 않음
+        """
+        self._rate_limiter.acquire(urlparse(link).netloc)
+        response = self._session.get(link, headers=_BROWSER_HEADERS, timeout=15, allow_redirects=True)
+        response.raise_for_status()
+        
+        # 인코딩 자동 감지 (문서 앞부분의 charset 선언을 우선 사용하고,
+        # 선언이 없을 때만 본문 전체를 훑는 apparent_encoding 사용)
+        encoding = response.encoding
+        if encoding is None or encoding == 'ISO-8859-1':
+            encoding = _sniff_charset(response.content) or response.apparent_encoding or 'utf-8'
+        
+        return response.content, encoding
     
     def search_news(
         self,
@@ -108,7 +639,7 @@ class NaverNewsAPICrawler:
         
         try:
             print(f"[검색] 검색어: '{query}', 시작 위치: {start}, 정렬: {sort}")
-            response = requests.get(
+            response = self._session.get(
                 self.api_url,
                 headers=self.headers,
                 params=params,
@@ -135,7 +666,6 @@ class NaverNewsAPICrawler:
             return None
         except Exception as e:
             print(f"검색 중 예상치 못한 오류: {e}")
-            import traceback
             traceback.print_exc()
             return None
     
@@ -223,15 +753,8 @@ class NaverNewsAPICrawler:
             조회수 (정수) 또는 None
         """
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(link, headers=headers, timeout=10)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            import re
+            content, encoding = self._fetch_html(link)
+            soup = BeautifulSoup(content, 'lxml', from_encoding=encoding)
             
             # 네이버 뉴스 조회수 추출 - 여러 패턴 시도
             view_count = None
@@ -369,15 +892,11 @@ class NaverNewsAPICrawler:
             
             # 텍스트 전처리 강화
             # 1. 불필요한 패턴 제거
-            # 해시태그 제거 (#으로 시작하는 단어들)
-            text = re.sub(r'#\S+', '', text)
-            # 사진 = 연합뉴스 같은 패턴 제거
-            text = re.sub(r'사진\s*[=:]\s*[가-힣a-zA-Z\s]+', '', text, flags=re.IGNORECASE)
-            text = re.sub(r'그림\s*[=:]\s*[가-힣a-zA-Z\s]+', '', text, flags=re.IGNORECASE)
-            text = re.sub(r'표\s*[=:]\s*[가-힣a-zA-Z\s]+', '', text, flags=re.IGNORECASE)
-            text = re.sub(r'[/]\s*[가-힣a-zA-Z\s]+\s*제공', '', text, flags=re.IGNORECASE)
-            text = re.sub(r'[/]?\s*제공\s*[=:][^\n]*', '', text, flags=re.IGNORECASE)
-            text = re.sub(r'[가-힣\s]+(조감도|사진|그림|표|이미지)[\.]?\s*[/]\s*[가-힣a-zA-Z\s]+\s*제공', '', text, flags=re.IGNORECASE)
+            # 해시태그, 사진 = 연합뉴스 같은 패턴 제거
+            text = _apply_subs(text, _INLINE_NOISE_SUBS)
+            text = _PROVIDER_RE.sub('', text)
+            text = _CREDIT_TAIL_RE.sub('', text)
+            text = _IMAGE_CREDIT_RE.sub('', text)
             
             # 2. 본문만 추출 (첫 문장부터 시작)
             lines = text.split('\n')
@@ -390,32 +909,32 @@ class NaverNewsAPICrawler:
                     continue
                 
                 # 해시태그가 포함된 줄 제거
-                if re.search(r'#\S+', line):
+                if _HASHTAG_RE.search(line):
                     continue
                 
                 # 사진 = 연합뉴스 같은 패턴이 포함된 줄 제거
-                if re.search(r'사진\s*[=:]\s*[가-힣a-zA-Z\s]+', line, re.IGNORECASE):
+                if _PHOTO_EQ_RE.search(line):
                     continue
-                if re.search(r'그림\s*[=:]\s*[가-힣a-zA-Z\s]+', line, re.IGNORECASE):
+                if _FIGURE_EQ_RE.search(line):
                     continue
-                if re.search(r'표\s*[=:]\s*[가-힣a-zA-Z\s]+', line, re.IGNORECASE):
+                if _TABLE_EQ_RE.search(line):
                     continue
                 
                 # 본문 시작 확인 (실제 내용이 있는 문장)
                 if not found_first_sentence:
                     # 문장 부호가 있고, 최소 길이가 있는 경우 본문 시작으로 간주
-                    if re.search(r'[가-힣]{5,}', line) and ('.' in line or '다' in line or '다.' in line):
+                    if _HANGUL_5_RE.search(line) and ('.' in line or '다' in line or '다.' in line):
                         found_first_sentence = True
                     else:
                         # 캡션이나 제공 정보는 건너뛰기
-                        if re.search(r'[/]?\s*제공|조감도|사진\s*제공', line, re.IGNORECASE):
+                        if _CAPTION_HINT_RE.search(line):
                             continue
                         if len(line) < 20:  # 너무 짧은 줄은 건너뛰기
                             continue
                 
                 if found_first_sentence:
                     # 기자 정보가 나오면 중단
-                    if re.search(r'[가-힣]+\s*[=:]?\s*[가-힣]*\s*기자', line) and len(line) < 50:
+                    if _REPORTER_RE.search(line) and len(line) < 50:
                         break
                     cleaned_lines.append(line)
             
@@ -471,15 +990,7 @@ class NaverNewsAPICrawler:
             # 요약이 완전한 문장으로 끝나도록 처리
             if summary and not summary.endswith(('.', '!', '?', '。', '！', '？', '다')):
                 # 마지막 문장 부호 찾기
-                last_punct = max(
-                    summary.rfind('.'),
-                    summary.rfind('!'),
-                    summary.rfind('?'),
-                    summary.rfind('。'),
-                    summary.rfind('！'),
-                    summary.rfind('？'),
-                    summary.rfind('다.')
-                )
+                last_punct = _last_sentence_end(summary)
                 if last_punct > len(summary) * 0.5:  # 중간 이후에 문장 부호가 있으면
                     summary = summary[:last_punct + 1]
                 elif summary.endswith('다') and len(summary) > 10:
@@ -489,7 +1000,6 @@ class NaverNewsAPICrawler:
             
         except Exception as e:
             print(f"kosum-v1-fast 요약 오류: {e}")
-            import traceback
             traceback.print_exc()
             return self._fallback_summarize(text, 300)
     
@@ -514,15 +1024,11 @@ class NaverNewsAPICrawler:
             
             # 텍스트 전처리 강화
             # 1. 불필요한 패턴 제거
-            # 해시태그 제거 (#으로 시작하는 단어들)
-            text = re.sub(r'#\S+', '', text)
-            # 사진 = 연합뉴스 같은 패턴 제거
-            text = re.sub(r'사진\s*[=:]\s*[가-힣a-zA-Z\s]+', '', text, flags=re.IGNORECASE)
-            text = re.sub(r'그림\s*[=:]\s*[가-힣a-zA-Z\s]+', '', text, flags=re.IGNORECASE)
-            text = re.sub(r'표\s*[=:]\s*[가-힣a-zA-Z\s]+', '', text, flags=re.IGNORECASE)
-            text = re.sub(r'[/]\s*[가-힣a-zA-Z\s]+\s*제공', '', text, flags=re.IGNORECASE)
-            text = re.sub(r'[/]?\s*제공\s*[=:][^\n]*', '', text, flags=re.IGNORECASE)
-            text = re.sub(r'[가-힣\s]+(조감도|사진|그림|표|이미지)[\.]?\s*[/]\s*[가-힣a-zA-Z\s]+\s*제공', '', text, flags=re.IGNORECASE)
+            # 해시태그, 사진 = 연합뉴스 같은 패턴 제거
+            text = _apply_subs(text, _INLINE_NOISE_SUBS)
+            text = _PROVIDER_RE.sub('', text)
+            text = _CREDIT_TAIL_RE.sub('', text)
+            text = _IMAGE_CREDIT_RE.sub('', text)
             
             # 2. 본문만 추출 (첫 문장부터 시작)
             lines = text.split('\n')
@@ -535,32 +1041,32 @@ class NaverNewsAPICrawler:
                     continue
                 
                 # 해시태그가 포함된 줄 제거
-                if re.search(r'#\S+', line):
+                if _HASHTAG_RE.search(line):
                     continue
                 
                 # 사진 = 연합뉴스 같은 패턴이 포함된 줄 제거
-                if re.search(r'사진\s*[=:]\s*[가-힣a-zA-Z\s]+', line, re.IGNORECASE):
+                if _PHOTO_EQ_RE.search(line):
                     continue
-                if re.search(r'그림\s*[=:]\s*[가-힣a-zA-Z\s]+', line, re.IGNORECASE):
+                if _FIGURE_EQ_RE.search(line):
                     continue
-                if re.search(r'표\s*[=:]\s*[가-힣a-zA-Z\s]+', line, re.IGNORECASE):
+                if _TABLE_EQ_RE.search(line):
                     continue
                 
                 # 본문 시작 확인 (실제 내용이 있는 문장)
                 if not found_first_sentence:
                     # 문장 부호가 있고, 최소 길이가 있는 경우 본문 시작으로 간주
-                    if re.search(r'[가-힣]{5,}', line) and ('.' in line or '다' in line or '다.' in line):
+                    if _HANGUL_5_RE.search(line) and ('.' in line or '다' in line or '다.' in line):
                         found_first_sentence = True
                     else:
                         # 캡션이나 제공 정보는 건너뛰기
-                        if re.search(r'[/]?\s*제공|조감도|사진\s*제공', line, re.IGNORECASE):
+                        if _CAPTION_HINT_RE.search(line):
                             continue
                         if len(line) < 20:  # 너무 짧은 줄은 건너뛰기
                             continue
                 
                 if found_first_sentence:
                     # 기자 정보가 나오면 중단
-                    if re.search(r'[가-힣]+\s*[=:]?\s*[가-힣]*\s*기자', line) and len(line) < 50:
+                    if _REPORTER_RE.search(line) and len(line) < 50:
                         break
                     cleaned_lines.append(line)
             
@@ -619,15 +1125,7 @@ class NaverNewsAPICrawler:
             # 요약이 완전한 문장으로 끝나도록 처리
             if summary and not summary.endswith(('.', '!', '?', '。', '！', '？', '다')):
                 # 마지막 문장 부호 찾기
-                last_punct = max(
-                    summary.rfind('.'),
-                    summary.rfind('!'),
-                    summary.rfind('?'),
-                    summary.rfind('。'),
-                    summary.rfind('！'),
-                    summary.rfind('？'),
-                    summary.rfind('다.')
-                )
+                last_punct = _last_sentence_end(summary)
                 if last_punct > len(summary) * 0.5:  # 중간 이후에 문장 부호가 있으면
                     summary = summary[:last_punct + 1]
                 elif summary.endswith('다') and len(summary) > 10:
@@ -638,7 +1136,6 @@ class NaverNewsAPICrawler:
             
         except Exception as e:
             print(f"kosum-v1-tuned 요약 오류: {e}")
-            import traceback
             traceback.print_exc()
             return self._fallback_summarize(text, 300)
     
@@ -664,7 +1161,9 @@ class NaverNewsAPICrawler:
         text = text.strip()
         
         # 기사 본문만 추출하도록 추가 정제
-        text = self._clean_article_text(text)
+        # (이미 짧고 잡음이 없는 한 줄 텍스트는 정제해도 그대로이므로 건너뜀)
+        if not (_SHORT_TEXT_MIN <= len(text) < _SHORT_TEXT_MAX and not _HAS_NOISE_RE.search(text)):
+            text = self._clean_article_text(text)
         
         if not text or len(text.strip()) == 0:
             print("[요약] 정제 후 텍스트가 비어있음")
@@ -735,6 +1234,27 @@ class NaverNewsAPICrawler:
             print(f"알 수 없는 요약 모드: {self.summary_mode}, 기본 요약 방식 사용")
             return self._fallback_summarize(text, max_length)
     
+    def summarize_batch(self, texts: List[str], max_length: int = 50) -> List[str]:
+        """
+        여러 텍스트를 요약합니다. 같은 텍스트는 한 번만 요약합니다.
+        
+        Args:
+            texts: 원본 본문 텍스트 리스트
+            max_length: 요약 최대 길이 (summarize_text와 동일)
+            
+        Returns:
+            texts와 같은 순서의 요약 리스트
+        """
+        summaries: Dict[str, str] = {}
+        return [self._summarize_once(text, summaries, max_length) for text in texts]
+    
+    def _summarize_once(self, text: str, summaries: Dict[str, str], max_length: int = 50) -> str:
+        """summaries에 이미 요약한 텍스트가 있으면 재사용하고, 없으면 요약하여 저장합니다"""
+        summary = summaries.get(text)
+        if summary is None:
+            summary = summaries[text] = self.summarize_text(text, max_length)
+        return summary
+    
     def _clean_article_text(self, text: str) -> str:
         """
         기사 본문에서 불필요한 내용을 제거합니다.
@@ -743,232 +1263,51 @@ class NaverNewsAPICrawler:
         if not text:
             return text
         
-        # 해시태그 제거 (#으로 시작하는 단어들)
-        text = re.sub(r'#\S+', '', text)
+        # 해시태그, 사진 = 연합뉴스 같은 패턴 제거
+        text = _apply_subs(text, _INLINE_NOISE_SUBS)
         
-        # 사진 = 연합뉴스 같은 패턴 제거
-        text = re.sub(r'사진\s*[=:]\s*[가-힣a-zA-Z\s]+', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'그림\s*[=:]\s*[가-힣a-zA-Z\s]+', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'표\s*[=:]\s*[가-힣a-zA-Z\s]+', '', text, flags=re.IGNORECASE)
+        # 캡션, 출처, 기자 표기, 이메일, UI 문구, 키워드가 포함된 줄을 한 번에 제거
+        text = _SKIP_LINES_RE.sub('', text)
         
         lines = text.split('\n')
         cleaned_lines = []
         
-        # 제거할 패턴들
-        skip_patterns = [
-            r'^\[사진[=:]',
-            r'^\[그림[=:]',
-            r'^\[표[=:]',
-            r'^\[캡션[=:]',
-            r'^\[.*사진.*\]',
-            r'^\[.*그림.*\]',
-            r'^\[.*표.*\]',
-            r'^\[.*캡션.*\]',
-            r'^관련\s*기사',
-            r'^댓글',
-            r'^기자\s*[=:]',
-            r'^제보',
-            r'^Copyright',
-            r'^©',
-            r'^무단\s*전재',
-            r'^재배포\s*금지',
-            r'^기사\s*제보',
-            r'^이\s*기사',
-            r'^기사\s*내용',
-            r'^\[.*기자.*\]',
-            r'^.*@.*\.(com|kr|net)',
-            r'^.*기자.*=',
-            r'^.*특파원.*=',
-            r'^.*인턴기자.*=',
-            r'^.*기자.*기자',
-            r'^.*기자.*특파원',
-            r'^.*기자.*인턴',
-            r'^.*기자.*=.*기자',
-            r'^.*기자.*=.*특파원',
-            r'^.*기자.*=.*인턴',
-            r'^.*기자.*=.*=',
-            r'^.*기자.*기자.*=',
-            r'^.*기자.*특파원.*=',
-            r'^.*기자.*인턴.*=',
-            r'^.*기자.*=.*=.*기자',
-            r'^.*기자.*=.*=.*특파원',
-            r'^.*기자.*=.*=.*인턴',
-            r'^.*기자.*=.*=.*=',
-            r'^.*기자.*기자.*=.*=',
-            r'^.*기자.*특파원.*=.*=',
-            r'^.*기자.*인턴.*=.*=',
-            r'^.*기자.*=.*=.*=.*기자',
-            r'^.*기자.*=.*=.*=.*특파원',
-            r'^.*기자.*=.*=.*=.*인턴',
-            r'^.*기자.*=.*=.*=.*=',
-            r'^.*기자.*기자.*=.*=.*=',
-            r'^.*기자.*특파원.*=.*=.*=',
-            r'^.*기자.*인턴.*=.*=.*=',
-            r'^.*기자.*=.*=.*=.*=.*기자',
-            r'^.*기자.*=.*=.*=.*=.*특파원',
-            r'^.*기자.*=.*=.*=.*=.*인턴',
-            r'^.*기자.*=.*=.*=.*=.*=',
-            r'^.*기자.*기자.*=.*=.*=.*=',
-            r'^.*기자.*특파원.*=.*=.*=.*=',
-            r'^.*기자.*인턴.*=.*=.*=.*=',
-        ]
-        
-        # 제거할 키워드들 (UI 요소 및 불필요한 내용)
-        skip_keywords = [
-            '본문 요약',
-            '현재위치',
-            '지자체',
-            '기자명',
-            '입력',
-            '바로가기',
-            '복사하기',
-            '본문 글씨',
-            '글씨 줄이기',
-            '글씨 키우기',
-            'SNS',
-            '페이스북',
-            '트위터',
-            'URL복사',
-            '기사보내기',
-            '공유하기',
-            '관련 기사',
-            '관련기사',
-            '관련사진',
-            '관련사진보기',
-            '관련기사보기',
-            '관련영상',
-            '관련영상보기',
-            '추천 기사',
-            '추천기사',
-            '추천기사보기',
-            '댓글',
-            '댓글보기',
-            '좋아요',
-            '더보기',
-            '전체보기',
-            '기자 =',
-            '기자=',
-            '특파원 =',
-            '특파원=',
-            '인턴기자 =',
-            '인턴기자=',
-            'Copyright',
-            '©',
-            '무단 전재',
-            '재배포 금지',
-            '기사 제보',
-            '이 기사',
-            '기사 내용',
-            '클릭',
-            '보기',
-            '더 읽기',
-            '전체 읽기',
-        ]
-        
+        # 남은 줄에는 길이/문맥에 따라 달라지는 조건만 검사
         for line in lines:
             line = line.strip()
             if not line:
                 continue
             
-            # 해시태그가 포함된 줄 제거
-            if re.search(r'#\S+', line):
-                continue
-            
-            # 사진 = 연합뉴스 같은 패턴이 포함된 줄 제거
-            if re.search(r'사진\s*[=:]\s*[가-힣a-zA-Z\s]+', line, re.IGNORECASE):
-                continue
-            if re.search(r'그림\s*[=:]\s*[가-힣a-zA-Z\s]+', line, re.IGNORECASE):
-                continue
-            if re.search(r'표\s*[=:]\s*[가-힣a-zA-Z\s]+', line, re.IGNORECASE):
-                continue
-            
-            # 패턴 체크
             skip = False
-            for pattern in skip_patterns:
-                if re.match(pattern, line, re.IGNORECASE):
-                    skip = True
-                    break
-            
-            # 키워드 체크
-            if not skip:
-                for keyword in skip_keywords:
-                    if keyword in line:
-                        skip = True
-                        break
             
             # 기자 정보가 포함된 줄 제거 (기자 이름 패턴)
-            if not skip and re.search(r'[가-힣]+\s*[=:]?\s*[가-힣]*\s*기자', line):
+            # 각 검사는 패턴에 반드시 들어가는 글자가 줄에 있을 때만 정규식을 실행
+            if '기자' in line and _REPORTER_RE.search(line):
                 # 하지만 본문에 "기자"라는 단어가 포함된 경우는 제외
-                if not re.search(r'기자.*(?:말|보고|전망|분석|설명|밝혀|발표)', line):
+                if not _REPORTER_CONTEXT_RE.search(line):
                     skip = True
             
-            # 이메일 주소가 포함된 줄 제거
-            if not skip and re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', line):
-                skip = True
-            
             # URL이 포함된 줄 제거 (본문이 아닌 링크)
-            if not skip and re.search(r'https?://[^\s]+', line) and len(line) < 100:
-                skip = True
-            
-            # "보기", "클릭" 같은 UI 동사로 끝나는 줄 제거
-            if not skip and re.search(r'(보기|클릭|읽기|확인|이동|더보기|전체보기|관련보기)$', line, re.IGNORECASE):
-                skip = True
-            
-            # "관련사진보기", "관련기사보기" 같은 UI 요소 제거
-            if not skip and re.search(r'관련(사진|기사|영상|뉴스|기사)보기', line, re.IGNORECASE):
+            if not skip and len(line) < 100 and 'http' in line and _URL_RE.search(line):
                 skip = True
             
             # 너무 짧은 줄 제거 (광고나 버튼 텍스트일 가능성)
-            if not skip and len(line) < 10 and not re.search(r'[가-힣]{3,}', line):
-                skip = True
-            
-            # 본문이 아닌 UI 요소 패턴 제거 (예: "관련사진보기", "기사 더보기" 등)
-            if not skip and re.search(r'^(관련|추천|더|전체|기사|뉴스|사진|영상).*(보기|클릭|읽기|확인|이동)', line, re.IGNORECASE):
-                skip = True
-            
-            # [사진=...], [그림=...], [표=...] 같은 캡션 제거
-            if not skip and re.match(r'^\[(사진|그림|표|캡션|포토|이미지)[=:].*\]', line, re.IGNORECASE):
+            if not skip and len(line) < 10 and not _HANGUL_3_RE.search(line):
                 skip = True
             
             # 대괄호로 둘러싸인 짧은 텍스트 제거 (캡션일 가능성)
-            if not skip and re.match(r'^\[.*\]$', line) and len(line) < 50:
-                skip = True
-            
-            # [뉴시스], [연합뉴스] 같은 출처 표시가 포함된 줄 제거 (캡션일 가능성)
-            if not skip and re.search(r'^\[(뉴시스|연합뉴스|조선일보|중앙일보|동아일보|한겨레|경향신문|매일경제|한국경제|서울신문|세계일보|문화일보|국민일보|내일신문|헤럴드경제|아시아경제|이데일리|뉴스1|YTN|SBS|KBS|MBC|JTBC|채널A|TV조선|MBN|기자협회|AP|AFP|로이터|로이터통신|Reuters|AP통신)\]\s*', line, re.IGNORECASE):
-                skip = True
-            
-            # (사진=...), (그림=...), (표=...) 같은 캡션 패턴 제거
-            if not skip and re.search(r'\(사진\s*[=:]\s*[^)]+\)', line, re.IGNORECASE):
-                skip = True
-            if not skip and re.search(r'\(그림\s*[=:]\s*[^)]+\)', line, re.IGNORECASE):
-                skip = True
-            if not skip and re.search(r'\(표\s*[=:]\s*[^)]+\)', line, re.IGNORECASE):
-                skip = True
-            
-            # 출처 + 제목 + (사진=...) 형태의 줄 제거
-            # 예: "[뉴시스] 태국에서 체포된 한국인 보이스피싱 조직원들. (사진=더네이션)"
-            if not skip and re.search(r'\[.*\]\s*.*\(사진\s*[=:]\s*[^)]+\)', line, re.IGNORECASE):
-                skip = True
-            
-            # /사진 제공=, 사진 제공=, /제공= 패턴 제거
-            if not skip and re.search(r'[/]?\s*사진\s*제공\s*[=:]', line, re.IGNORECASE):
-                skip = True
-            
-            # 인물 이름 + 직책 + /사진 제공= 패턴 제거 (예: "젠슨 황 엔비디아 CEO /사진 제공=엔비디아")
-            if not skip and re.search(r'[/]?\s*사진\s*제공\s*[=:]', line, re.IGNORECASE):
-                # 이 줄 전체를 제거
+            if not skip and len(line) < 50 and line[0] == '[' and _BRACKET_LINE_RE.match(line):
                 skip = True
             
             # 제공=, /제공= 패턴이 포함된 줄 제거
-            if not skip and re.search(r'[/]?\s*제공\s*[=:]', line, re.IGNORECASE) and len(line) < 100:
+            if not skip and len(line) < 100 and '제공' in line and _CREDIT_RE.search(line):
                 skip = True
             
             # 인물 이름만 있는 짧은 줄 (캡션일 가능성)
             # 예: "젠슨 황 엔비디아 CEO" 같은 패턴
             if not skip and len(line) < 50:
                 # CEO, 대표, 회장 등 직책만 있는 줄 제거
-                if re.search(r'\b(CEO|대표|회장|사장|이사|부장|차장|과장|팀장|실장|본부장|그룹장|총괄|책임|담당)\b', line) and not re.search(r'[가-힣]{10,}', line):
+                if _JOB_TITLE_RE.search(line) and not _HANGUL_10_RE.search(line):
                     skip = True
             
             if not skip:
@@ -977,62 +1316,27 @@ class NaverNewsAPICrawler:
         # 정제된 텍스트 합치기
         cleaned_text = '\n'.join(cleaned_lines)
         
-        # [사진=...], [그림=...] 같은 패턴을 텍스트 내에서도 제거
-        cleaned_text = re.sub(r'\[(사진|그림|표|캡션|포토|이미지)[=:][^\]]*\]', '', cleaned_text, flags=re.IGNORECASE)
-        
-        # (사진=...), (그림=...), (표=...) 같은 캡션 패턴 제거
-        cleaned_text = re.sub(r'\(사진\s*[=:]\s*[^)]+\)', '', cleaned_text, flags=re.IGNORECASE)
-        cleaned_text = re.sub(r'\(그림\s*[=:]\s*[^)]+\)', '', cleaned_text, flags=re.IGNORECASE)
-        cleaned_text = re.sub(r'\(표\s*[=:]\s*[^)]+\)', '', cleaned_text, flags=re.IGNORECASE)
-        
         # "관련사진보기", "관련기사보기" 같은 UI 요소 제거
-        cleaned_text = re.sub(r'관련(사진|기사|영상|뉴스)보기', '', cleaned_text, flags=re.IGNORECASE)
+        cleaned_text = _RELATED_VIEW_RE.sub('', cleaned_text)
         
         # "보기", "클릭" 같은 UI 동사로 끝나는 줄 제거
-        cleaned_text = re.sub(r'^.*(보기|클릭|읽기|확인|이동|더보기|전체보기|관련보기)$', '', cleaned_text, flags=re.IGNORECASE | re.MULTILINE)
-        
-        # [뉴시스], [연합뉴스] 같은 출처 표시 제거
-        cleaned_text = re.sub(r'\[(뉴시스|연합뉴스|조선일보|중앙일보|동아일보|한겨레|경향신문|매일경제|한국경제|서울신문|세계일보|문화일보|국민일보|내일신문|헤럴드경제|아시아경제|이데일리|뉴스1|YTN|SBS|KBS|MBC|JTBC|채널A|TV조선|MBN|기자협회|AP|AFP|로이터|로이터통신|Reuters|AP통신)\]\s*', '', cleaned_text, flags=re.IGNORECASE)
-        
-        # 출처 + 제목 + (사진=...) 형태 제거
-        cleaned_text = re.sub(r'\[.*\]\s*.*\(사진\s*[=:]\s*[^)]+\)', '', cleaned_text, flags=re.IGNORECASE)
-        
-        # /사진 제공=, 사진 제공= 패턴 제거
-        cleaned_text = re.sub(r'[/]?\s*사진\s*제공\s*[=:][^\n]*', '', cleaned_text, flags=re.IGNORECASE)
-        
-        # /제공= 패턴 제거 (예: /광주광역시 제공, /엔비디아 제공 등)
-        cleaned_text = re.sub(r'[/]\s*[가-힣a-zA-Z\s]+\s*제공', '', cleaned_text, flags=re.IGNORECASE)
-        cleaned_text = re.sub(r'[/]?\s*제공\s*[=:][^\n]*', '', cleaned_text, flags=re.IGNORECASE)
+        cleaned_text = _UI_VERB_LINE_RE.sub('', cleaned_text)
         
-        # 인물 이름 + 직책 + /사진 제공= 같은 패턴 제거
-        # 예: "젠슨 황 엔비디아 CEO /사진 제공=엔비디아" -> "젠슨 황 엔비디아 CEO" 부분도 제거
-        cleaned_text = re.sub(r'[가-힣a-zA-Z\s]+\s+(CEO|대표|회장|사장|이사|부장|차장|과장|팀장|실장|본부장|그룹장|총괄|책임|담당)\s*[/]?\s*사진\s*제공\s*[=:][^\n]*', '', cleaned_text, flags=re.IGNORECASE)
+        # [사진=...], (사진=...), [뉴시스], /사진 제공=, /... 제공 같은 캡션·출처 패턴을 텍스트 내에서도 제거
+        # 예: "젠슨 황 엔비디아 CEO /사진 제공=엔비디아", "광주 운전면허시험장 조성사업 조감도. /광주광역시 제공"
+        cleaned_text = _apply_subs(cleaned_text, _CAPTION_SUBS)
         
-        # 조감도, 사진 등의 설명 + /... 제공 패턴 제거
-        # 예: "광주 운전면허시험장 조성사업 조감도. /광주광역시 제공"
-        cleaned_text = re.sub(r'[가-힣\s]+(조감도|사진|그림|표|이미지)[\.]?\s*[/]\s*[가-힣a-zA-Z\s]+\s*제공', '', cleaned_text, flags=re.IGNORECASE)
-        cleaned_text = re.sub(r'[가-힣\s]+(조감도|사진|그림|표|이미지)[\.]?\s*[/]\s*[가-힣a-zA-Z\s]+', '', cleaned_text, flags=re.IGNORECASE)
-        
-        # 연속된 공백 정리 (과도한 줄바꿈 방지)
-        cleaned_text = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned_text)  # 3개 이상 연속된 줄바꿈을 2개로 제한
-        cleaned_text = re.sub(r'\n\s*\n+', '\n', cleaned_text)  # 2개 연속된 줄바꿈을 1개로
-        cleaned_text = re.sub(r' +', ' ', cleaned_text)
-        cleaned_text = cleaned_text.strip()
+        # 연속된 공백 정리 (빈 줄 제거 및 연속 공백 축소)
+        cleaned_text = _BLANK_RUN_RE.sub(r'\1\2', cleaned_text).strip()
         
         # 본문 시작 부분 찾기 (제목이나 소개 부분 제거)
         # "기자 =", "특파원 =", "인턴기자 =" 같은 패턴이 나오기 전까지만
-        lines_after_clean = cleaned_text.split('\n')
-        main_content_start = 0
-        
-        for i, line in enumerate(lines_after_clean):
-            # 기자 정보가 나오면 그 전까지가 본문
-            if re.search(r'[가-힣]+\s*[=:]?\s*[가-힣]*\s*기자', line) and len(line) < 50:
-                main_content_start = i
-                break
+        # 기자 정보가 있는 첫 짧은 줄을 다시 나누지 않고 버퍼에서 바로 찾음
+        match = _REPORTER_LINE_RE.search(cleaned_text)
         
         # 본문만 추출 (기자 정보 이전까지)
-        if main_content_start > 0:
-            cleaned_text = '\n'.join(lines_after_clean[:main_content_start])
+        if match and match.start() > 0:
+            cleaned_text = cleaned_text[:match.start()]
         
         return cleaned_text.strip()
     
@@ -1044,52 +1348,17 @@ class NaverNewsAPICrawler:
         if not summary:
             return summary
         
-        # 해시태그 제거 (#으로 시작하는 단어들)
-        summary = re.sub(r'#\S+', '', summary)
-        
-        # 사진 = 연합뉴스 같은 패턴 제거 (괄호 없이)
-        summary = re.sub(r'사진\s*[=:]\s*[가-힣a-zA-Z\s]+', '', summary, flags=re.IGNORECASE)
-        summary = re.sub(r'그림\s*[=:]\s*[가-힣a-zA-Z\s]+', '', summary, flags=re.IGNORECASE)
-        summary = re.sub(r'표\s*[=:]\s*[가-힣a-zA-Z\s]+', '', summary, flags=re.IGNORECASE)
-        
-        # [뉴시스], [연합뉴스] 같은 출처 표시 제거
-        summary = re.sub(r'\[(뉴시스|연합뉴스|조선일보|중앙일보|동아일보|한겨레|경향신문|매일경제|한국경제|서울신문|세계일보|문화일보|국민일보|내일신문|헤럴드경제|아시아경제|이데일리|뉴스1|YTN|SBS|KBS|MBC|JTBC|채널A|TV조선|MBN|기자협회|AP|AFP|로이터|로이터통신|Reuters|AP통신)\]\s*', '', summary, flags=re.IGNORECASE)
-        
-        # (사진=...), (그림=...), (표=...) 같은 캡션 패턴 제거
-        summary = re.sub(r'\(사진\s*[=:]\s*[^)]+\)', '', summary, flags=re.IGNORECASE)
-        summary = re.sub(r'\(그림\s*[=:]\s*[^)]+\)', '', summary, flags=re.IGNORECASE)
-        summary = re.sub(r'\(표\s*[=:]\s*[^)]+\)', '', summary, flags=re.IGNORECASE)
-        
-        # 출처 + 제목 + (사진=...) 형태 제거
-        summary = re.sub(r'\[.*\]\s*.*\(사진\s*[=:]\s*[^)]+\)', '', summary, flags=re.IGNORECASE)
-        
-        # /... 제공 패턴 제거 (예: /광주광역시 제공)
-        summary = re.sub(r'[/]\s*[가-힣a-zA-Z\s]+\s*제공', '', summary, flags=re.IGNORECASE)
-        
-        # /사진 제공=, 사진 제공= 패턴 제거
-        summary = re.sub(r'[/]?\s*사진\s*제공\s*[=:][^\n]*', '', summary, flags=re.IGNORECASE)
+        # 해시태그, 사진 = 연합뉴스 같은 패턴 제거 (괄호 없이)
+        summary = _apply_subs(summary, _INLINE_NOISE_SUBS)
         
-        # /제공= 패턴 제거
-        summary = re.sub(r'[/]?\s*제공\s*[=:][^\n]*', '', summary, flags=re.IGNORECASE)
-        
-        # 조감도, 사진 등의 설명 + /... 제공 패턴 제거
-        summary = re.sub(r'[가-힣\s]+(조감도|사진|그림|표|이미지)[\.]?\s*[/]\s*[가-힣a-zA-Z\s]+\s*제공', '', summary, flags=re.IGNORECASE)
-        summary = re.sub(r'[가-힣\s]+(조감도|사진|그림|표|이미지)[\.]?\s*[/]\s*[가-힣a-zA-Z\s]+', '', summary, flags=re.IGNORECASE)
-        
-        # [사진=...], [그림=...] 패턴 제거
-        summary = re.sub(r'\[(사진|그림|표|캡션|포토|이미지)[=:][^\]]*\]', '', summary, flags=re.IGNORECASE)
-        
-        # 인물 이름 + 직책 + /사진 제공= 패턴 제거
-        summary = re.sub(r'[가-힣a-zA-Z\s]+\s+(CEO|대표|회장|사장|이사|부장|차장|과장|팀장|실장|본부장|그룹장|총괄|책임|담당)\s*[/]?\s*사진\s*제공\s*[=:][^\n]*', '', summary, flags=re.IGNORECASE)
+        # [사진=...], (사진=...), [뉴시스], /사진 제공=, /... 제공 같은 캡션·출처 패턴 제거
+        summary = _apply_subs(summary, _SUMMARY_CAPTION_SUBS)
         
         # 기자 정보 제거
-        summary = re.sub(r'[가-힣]+\s*[=:]?\s*[가-힣]*\s*기자\s*[=:]', '', summary)
+        summary = _REPORTER_TAG_RE.sub('', summary)
         
-        # 연속된 공백 정리
-        summary = re.sub(r'\s+', ' ', summary)
-        # 과도한 줄바꿈 제거 (연속된 줄바꿈을 공백으로)
-        summary = re.sub(r'\n\s*\n+', ' ', summary)
-        summary = summary.strip()
+        # 연속된 공백 및 줄바꿈을 공백 하나로 정리
+        summary = _WHITESPACE_RE.sub(' ', summary).strip()
         
         # 빈 요약이나 의미 없는 요약 제거
         if len(summary) < 20:
@@ -1113,14 +1382,7 @@ class NaverNewsAPICrawler:
         # 완전한 문장으로 끝나도록 처리
         if len(text) > max_length:
             # 문장 부호 찾기 (우선순위: 마침표, 느낌표, 물음표)
-            last_punct = max(
-                summary.rfind('.'),
-                summary.rfind('!'),
-                summary.rfind('?'),
-                summary.rfind('。'),
-                summary.rfind('！'),
-                summary.rfind('？')
-            )
+            last_punct = _last_sentence_end(summary)
             
             # 문장 부호가 있으면 그 앞에서 자르기 (최소 50% 이상 위치)
             if last_punct > max_length * 0.5:
@@ -1131,14 +1393,7 @@ class NaverNewsAPICrawler:
                 if last_space > max_length * 0.7:  # 70% 이상 위치에 공백이 있으면
                     summary = summary[:last_space]
                     # 공백으로 끝나면 마지막 문장 부호 찾기
-                    last_punct_in_summary = max(
-                        summary.rfind('.'),
-                        summary.rfind('!'),
-                        summary.rfind('?'),
-                        summary.rfind('。'),
-                        summary.rfind('！'),
-                        summary.rfind('？')
-                    )
+                    last_punct_in_summary = _last_sentence_end(summary)
                     if last_punct_in_summary > len(summary) * 0.5:
                         summary = summary[:last_punct_in_summary + 1]
                     else:
@@ -1163,59 +1418,55 @@ class NaverNewsAPICrawler:
             return None
         
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-            
-            response = requests.get(link, headers=headers, timeout=10, allow_redirects=True)
-            response.raise_for_status()
-            
-            # 인코딩 자동 감지
-            if response.encoding is None or response.encoding == 'ISO-8859-1':
-                response.encoding = response.apparent_encoding or 'utf-8'
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 제목 선택자 (우선순위 순)
-            title_selectors = [
-                'meta[property="og:title"]',
-                'meta[name="twitter:title"]',
-                'title',
-                'h1.media_end_head_headline',
-                'h1.end_tit',
-                '.article_info h3',
-                '.article-header h1',
-                'h1.article-title',
-                'h1',
-            ]
-            
-            for selector in title_selectors:
-                try:
-                    if selector.startswith('meta'):
-                        elem = soup.select_one(selector)
-                        if elem and elem.get('content'):
-                            title = elem.get('content').strip()
-                            if title:
-                                return title
-                    else:
-                        elem = soup.select_one(selector)
-                        if elem:
-                            title = elem.get_text(strip=True)
-                            if title:
-                                return title
-                except:
-                    continue
-            
-            return None
+            content, encoding = self._fetch_html(link)
+            return self._extract_title_from_html(content, encoding)
         except Exception as e:
             print(f"제목 추출 실패 ({link}): {e}")
             return None
     
+    def _extract_title_from_html(self, content: bytes, encoding: str) -> Optional[str]:
+        """기사 페이지 HTML에서 제목을 추출합니다"""
+        # 빠른 경로: 대부분의 언론사는 <head>에 og:title을 넣으므로 DOM 생성 없이 추출
+        match = _OG_TITLE_RE.search(content, 0, _OG_TITLE_SCAN_SIZE)
+        if match:
+            title = unescape(match.group(2).decode(encoding, errors='replace')).strip()
+            if title:
+                return title
+        
+        soup = BeautifulSoup(content, 'lxml', from_encoding=encoding)
+        
+        # 제목 선택자 (우선순위 순)
+        title_selectors = [
+            'meta[property="og:title"]',
+            'meta[name="twitter:title"]',
+            'title',
+            'h1.media_end_head_headline',
+            'h1.end_tit',
+            '.article_info h3',
+            '.article-header h1',
+            'h1.article-title',
+            'h1',
+        ]
+        
+        for selector in title_selectors:
+            try:
+                if selector.startswith('meta'):
+                    elem = soup.select_one(selector)
+                    if elem and elem.get('content'):
+                        title = elem.get('content').strip()
+                        if title:
+                            return title
+                else:
+                    elem = soup.select_one(selector)
+                    if elem:
+                        title = elem.get_text(strip=True)
+                        if title:
+                            return title
+            except:
+                continue
+        
+        return None
+    
     def extract_full_text(self, link: str) -> Optional[str]:
         """
         API에서 받은 링크로 실제 기사 본문을 추출합니다.
@@ -1231,189 +1482,172 @@ class NaverNewsAPICrawler:
             return None
         
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
+            content, encoding = self._fetch_html(link)
+            return self._extract_body_from_html(content, encoding)
+        except (requests.exceptions.Timeout, requests.exceptions.RequestException):
+            return None
+        except Exception:
+            return None
+    
+    def _select_body_elem(self, content: bytes, encoding: str):
+        """전체 HTML을 파싱하여 선택자 우선순위대로 본문 컨테이너를 찾습니다"""
+        soup = BeautifulSoup(content, 'lxml', from_encoding=encoding)
+        
+        # newspaper3k는 일부 사이트에서 403 에러가 발생하므로 사용하지 않음
+        # BeautifulSoup으로 직접 추출
+        
+        # BeautifulSoup으로 직접 추출 (newspaper3k 실패 시)
+        # 고정 id/클래스 선택자는 한 번의 탐색으로 선택자별 첫 번째 일치 요소를 모아 둠
+        first_matches = {}
+        for elem in soup.select(_BODY_FAST_SELECTOR):
+            for selector in _matching_body_selectors(elem.get('id'), elem.get('class') or ()):
+                first_matches.setdefault(selector, elem)
+        
+        # 우선순위 순으로 시도
+        content_elem = None
+        for selector in _BODY_SELECTORS:
+            try:
+                if selector in _BODY_FAST_SELECTORS:
+                    content_elem = first_matches.get(selector)
+                else:
+                    content_elem = soup.select_one(selector)
+                
+                if content_elem:
+                    # 본문으로 보이는지 확인 (최소 길이 체크)
+                    text_preview = content_elem.get_text(strip=True)
+                    if text_preview and len(text_preview) > 200:  # 최소 200자 이상
+                        break
+                    else:
+                        content_elem = None
+            except:
+                continue
+        
+        return content_elem
+    
+    def _stream_body_elem(self, content: bytes, encoding: str):
+        """
+        HTML을 앞에서부터 스트리밍 파싱하며 고정 본문 선택자별 첫 번째 후보를 기록하고,
+        선택자 우선순위상 본문 컨테이너가 확정되는 즉시 반환합니다.
+        (우선순위가 높은 컨테이너가 먼저 확정되면 광고/댓글/관련기사 등 나머지 문서는 파싱하지 않음)
+        
+        Returns:
+            본문 컨테이너만 담은 BeautifulSoup 요소 또는 None
+        """
+        first_matches = {}  # 선택자 -> 문서 순서상 첫 번째 일치 요소
+        candidates = set()  # first_matches에 기록된 요소
+        long_enough = {}  # 닫힌 후보 요소 -> 본문 길이가 충분한지 여부
+        
+        def text_long_enough(elem) -> bool:
+            text_preview = ''.join(t.strip() for t in elem.itertext())
+            return len(text_preview) > 200  # 최소 200자 이상
+        
+        def pick(final: bool):
+            """우선순위 순으로 후보를 확인 (아직 결정할 수 없으면 False, 후보가 없으면 None)"""
+            for selector in _BODY_FAST_SELECTORS:
+                elem = first_matches.get(selector)
+                if elem is None:
+                    # 문서 뒤쪽에 나올 수 있으므로 끝까지 파싱하기 전에는 건너뛸 수 없음
+                    if not final:
+                        return False
+                    continue
+                if elem not in long_enough:
+                    if not final:
+                        return False
+                    long_enough[elem] = text_long_enough(elem)
+                if long_enough[elem]:
+                    return elem
+            return None
+        
+        def read_events(parser):
+            for event, elem in parser.read_events():
+                if event == 'start':
+                    for selector in _matching_body_selectors(elem.get('id'), (elem.get('class') or '').split()):
+                        if selector not in first_matches:
+                            first_matches[selector] = elem
+                            candidates.add(elem)
+                elif elem in candidates:
+                    long_enough[elem] = text_long_enough(elem)
+        
+        try:
+            parser = etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+            content_elem = False
+            for start in range(0, len(content), _STREAM_CHUNK_SIZE):
+                parser.feed(content[start:start + _STREAM_CHUNK_SIZE])
+                read_events(parser)
+                content_elem = pick(final=False)
+                if content_elem is not False:
+                    break
+            else:
+                parser.close()
+                read_events(parser)
+                content_elem = pick(final=True)
+            
+            if content_elem is not None:
+                fragment = etree.tostring(content_elem, encoding='unicode', method='html', with_tail=False)
+                return BeautifulSoup(fragment, 'lxml').find(content_elem.tag)
+        except (etree.LxmlError, LookupError, ValueError):
+            pass
+        return None
+    
+    def _extract_body_from_html(self, content: bytes, encoding: str) -> Optional[str]:
+        """기사 페이지 HTML에서 본문을 추출하고 정제합니다"""
+        # 빠른 경로: 알려진 본문 컨테이너가 있으면 전체 DOM을 만들지 않음
+        content_elem = self._stream_body_elem(content, encoding)
+        if content_elem is None:
+            content_elem = self._select_body_elem(content, encoding)
+        
+        if content_elem:
+            # 불필요한 태그 제거 (스크립트, 스타일 등)
+            for tag in content_elem.find_all(['script', 'style', 'iframe', 'noscript', 'svg', 'nav', 'header', 'footer']):
+                try:
+                    tag.decompose()
+                except (AttributeError, TypeError):
+                    continue
             
-            response = requests.get(link, headers=headers, timeout=15, allow_redirects=True)
-            response.raise_for_status()
+            # UI 요소 제거 (버튼, 링크, 메뉴 등)
+            # 클래스나 ID에 UI 키워드가 있는 태그는 CSS 선택자 한 번으로 찾아 제거
+            for tag in content_elem.select(_UI_ATTR_SELECTOR):
+                try:
+                    tag.decompose()
+                except (AttributeError, TypeError):
+                    continue
             
-            # 인코딩 자동 감지
-            if response.encoding is None or response.encoding == 'ISO-8859-1':
-                response.encoding = response.apparent_encoding or 'utf-8'
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # newspaper3k는 일부 사이트에서 403 에러가 발생하므로 사용하지 않음
-            # BeautifulSoup으로 직접 추출
-            
-            # BeautifulSoup으로 직접 추출 (newspaper3k 실패 시)
-            # 네이버 뉴스 및 주요 언론사 특화 선택자 (우선순위 순)
-            selectors = [
-                # 네이버 뉴스
-                '#newsct_article',
-                '#newsEndContents',
-                '.news_end_body_body',
-                '._article_body_contents',
-                '#articleBodyContents',
-                # 주요 언론사
-                '#article-view-content-div',
-                '.article-view-content',
-                '.article-body',
-                '.article_content',
-                '#article_content',
-                '.article-body-content',
-                '#article-body',
-                '.article-body-text',
-                # 일반적인 선택자
-                'article .content',
-                'article .body',
-                '[id*="article"][id*="body"]',
-                '[id*="article"][id*="content"]',
-                '[class*="article"][class*="body"]',
-                '[class*="article"][class*="content"]',
-                'article',
-                # 마지막 수단
-                '[id*="article"]',
-                '[class*="article-body"]',
-                '[class*="article-content"]',
-            ]
-            
-            content_elem = None
-            for selector in selectors:
+            # 남은 태그 중 텍스트 내용이 UI 요소인 태그 제거
+            for tag in content_elem.find_all(_UI_TAGS):
                 try:
-                    if selector.startswith('['):
-                        # 속성 선택자 처리
-                        if 'id*=' in selector and 'body' in selector:
-                            content_elem = soup.find('div', {'id': lambda x: x and 'article' in x.lower() and 'body' in x.lower()})
-                        elif 'id*=' in selector and 'content' in selector:
-                            content_elem = soup.find('div', {'id': lambda x: x and 'article' in x.lower() and 'content' in x.lower()})
-                        elif 'id*=' in selector:
-                            content_elem = soup.find('div', {'id': lambda x: x and 'article' in x.lower()})
-                        elif 'class*=' in selector and 'body' in selector:
-                            content_elem = soup.find('div', {'class': lambda x: x and ('article' in str(x).lower() and 'body' in str(x).lower())})
-                        elif 'class*=' in selector and 'content' in selector:
-                            content_elem = soup.find('div', {'class': lambda x: x and ('article' in str(x).lower() and 'content' in str(x).lower())})
-                        elif 'class*=' in selector:
-                            content_elem = soup.find('div', {'class': lambda x: x and ('article' in str(x).lower() or 'body' in str(x).lower())})
-                    else:
-                        content_elem = soup.select_one(selector)
+                    tag_text = tag.get_text(strip=True)
                     
-                    if content_elem:
-                        # 본문으로 보이는지 확인 (최소 길이 체크)
-                        text_preview = content_elem.get_text(strip=True)
-                        if text_preview and len(text_preview) > 200:  # 최소 200자 이상
-                            break
-                        else:
-                            content_elem = None
-                except:
+                    should_remove = (
+                        # "관련사진보기", "관련기사보기" 같은 패턴
+                        _RELATED_VIEW_RE.search(tag_text)
+                        # 짧고 UI 관련 키워드 포함
+                        or (len(tag_text) < 50 and _UI_TEXT_RE.search(tag_text))
+                        or (len(tag_text) < 30 and (
+                            # "보기", "클릭" 같은 UI 동사로 끝나는 짧은 텍스트
+                            _UI_VERB_END_RE.search(tag_text)
+                            # 날짜 패턴만 있는 짧은 텍스트 (예: "2025.12.11 01:51")
+                            or _DATE_PREFIX_RE.match(tag_text)
+                        ))
+                    )
+                    
+                    if should_remove:
+                        tag.decompose()
+                except (AttributeError, TypeError):
                     continue
             
-            if content_elem:
-                # 불필요한 태그 제거 (스크립트, 스타일 등)
-                for tag in content_elem.find_all(['script', 'style', 'iframe', 'noscript', 'svg', 'nav', 'header', 'footer']):
-                    try:
-                        tag.decompose()
-                    except (AttributeError, TypeError):
-                        continue
-                
-                # UI 요소 제거 (버튼, 링크, 메뉴 등)
-                ui_keywords = [
-                    'button', 'btn', 'menu', 'nav', 'header', 'footer', 
-                    'sidebar', 'aside', 'toolbar', 'tool-bar',
-                    'share', 'sns', 'social', 'comment', 'reply',
-                    'ad', 'advertisement', 'sponsor', 'promo', 'banner',
-                    'related', 'recommend', 'recommended', 'more', 'more-news',
-                    'current', 'location', 'breadcrumb', 'bread-crumb',
-                    'font-size', 'font-size-control', 'text-size',
-                    'copy', 'url-copy', 'clipboard',
-                    'print', 'email', 'facebook', 'twitter', 'kakao'
-                ]
-                
-                # UI 요소가 포함된 태그 제거
-                for tag in content_elem.find_all(['div', 'section', 'aside', 'span', 'a', 'button']):
-                    try:
-                        classes = tag.get('class', [])
-                        tag_id = tag.get('id', '')
-                        tag_text = tag.get_text(strip=True)
-                        
-                        if classes is None:
-                            classes = []
-                        elif not isinstance(classes, list):
-                            classes = [classes] if classes else []
-                        
-                        if tag_id is None:
-                            tag_id = ''
-                        
-                        classes_str = ' '.join(classes).lower() if classes else ''
-                        tag_id_str = str(tag_id).lower()
-                        tag_text_lower = tag_text.lower()
-                        
-                        # UI 키워드가 포함된 태그 제거
-                        should_remove = False
-                        
-                        # 클래스나 ID에 UI 키워드가 있는지 확인
-                        for keyword in ui_keywords:
-                            if keyword in classes_str or keyword in tag_id_str:
-                                should_remove = True
-                                break
-                        
-                        # 텍스트 내용이 UI 요소인지 확인 (짧고 UI 관련 키워드 포함)
-                        if not should_remove and len(tag_text) < 50:
-                            ui_text_patterns = [
-                                '현재위치', '지자체', '기자명', '입력', '바로가기', 
-                                '복사하기', '본문 글씨', 'SNS', '페이스북', '트위터',
-                                'URL복사', '기사보내기', '공유하기', '댓글', '좋아요',
-                                '관련기사', '관련사진', '관련사진보기', '관련기사보기',
-                                '관련영상', '관련영상보기', '추천기사', '추천기사보기',
-                                '댓글보기', '더보기', '전체보기', '더 읽기', '전체 읽기',
-                                '보기', '클릭', '확인', '이동'
-                            ]
-                            for pattern in ui_text_patterns:
-                                if pattern in tag_text:
-                                    should_remove = True
-                                    break
-                        
-                        # "관련사진보기", "관련기사보기" 같은 패턴 제거
-                        if not should_remove and re.search(r'관련(사진|기사|영상|뉴스)보기', tag_text, re.IGNORECASE):
-                            should_remove = True
-                        
-                        # "보기", "클릭" 같은 UI 동사로 끝나는 짧은 텍스트 제거
-                        if not should_remove and len(tag_text) < 30 and re.search(r'(보기|클릭|읽기|확인|이동|더보기|전체보기|관련보기)$', tag_text, re.IGNORECASE):
-                            should_remove = True
-                        
-                        # 날짜 패턴만 있는 짧은 텍스트 (예: "2025.12.11 01:51")
-                        if not should_remove and len(tag_text) < 30 and re.match(r'^\d{4}\.\d{2}\.\d{2}', tag_text):
-                            should_remove = True
-                        
-                        if should_remove:
-                            tag.decompose()
-                    except (AttributeError, TypeError):
-                        continue
-                
-                # 본문 텍스트 추출
-                text = content_elem.get_text(separator='\n', strip=True)
-                
-                # 기사 본문만 추출하도록 정제
-                text = self._clean_article_text(text)
-                
-                # 최소 길이 체크 (너무 짧으면 유효하지 않은 것으로 간주)
-                if len(text) < 50:
-                    return None
-                
-                return text
+            # 본문 텍스트 추출
+            text = content_elem.get_text(separator='\n', strip=True)
             
-            return None
+            # 기사 본문만 추출하도록 정제
+            text = self._clean_article_text(text)
             
-        except (requests.exceptions.Timeout, requests.exceptions.RequestException):
-            return None
-        except Exception:
-            return None
+            # 최소 길이 체크 (너무 짧으면 유효하지 않은 것으로 간주)
+            if len(text) < 50:
+                return None
+            
+            return text
+        
+        return None
     
     def crawl_news_with_full_text(
         self,
@@ -1443,41 +1677,102 @@ class NaverNewsAPICrawler:
                 'pubDate': str,
                 'originallink': str,
                 'view_count': int (조회수, 항상 추출),
-                'text': str (본문, include_full_text=True일 때만)
+                'text': str (본문 요약, 본문 추출 실패 시 description 요약),
+                'full_text': str (추출한 전체 본문, 본문 추출에 성공했을 때만)
             } 형태의 딕셔너리 리스트
+            (full_text가 없으면 감정 분석에는 description을 사용)
         """
         # 본문 추출 실패 시 대비하여 더 많은 기사를 수집 (최대 2배까지)
         # 실패한 기사를 제외하고도 충분한 수를 확보하기 위함
         items_to_fetch = max_results * 2 if include_full_text else max_results
         
+        results = list(islice(self.iter_news(
+            query=query,
+            max_items=items_to_fetch,
+            include_full_text=include_full_text,
+            date_from=date_from,
+            date_to=date_to,
+            sort_by=sort_by,
+            max_results=max_results
+        ), max_results))
+        
+        self._sort_results(results, sort_by)
+        return results
+    
+    def iter_news(
+        self,
+        query: str,
+        max_items: int = 100,
+        include_full_text: bool = True,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        sort_by: str = 'date',
+        exclude_english: bool = False,
+        max_results: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """
+        뉴스를 검색하고 기사를 하나씩 처리하여 반환합니다 (정렬하지 않음).
+        호출한 쪽이 필요한 만큼만 꺼내 쓰면 나머지 기사는 다운로드/요약하지 않습니다.
+        
+        Args:
+            query: 검색어
+            max_items: 검색 API에서 가져올 최대 기사 수
+            include_full_text: 본문 추출 여부 (True면 시간이 오래 걸림)
+            date_from: 시작 날짜 (YYYYMMDD)
+            date_to: 종료 날짜 (YYYYMMDD)
+            sort_by: 정렬 기준 ('date': 날짜순, 'view': 조회수순) - 검색 API 정렬에만 사용
+            exclude_english: True면 제목/설명으로 영어 기사로 판단되는 기사는 건너뜀
+            max_results: 호출한 쪽이 꺼내 쓸 기사 수 (미리 받아 둘 페이지 수를 남은 수로 제한, None이면 제한 없음)
+            
+        Yields:
+            crawl_news_with_full_text 결과와 같은 형태의 딕셔너리
+        """
         # sort_by를 sort로 변환 ('date' -> 'date', 'view' -> 'sim' 또는 'date')
         sort_param = 'date' if sort_by == 'date' else 'sim'
         
         items = self.get_all_news(
             query=query,
-            max_results=items_to_fetch,
+            max_results=max_items,
             date_from=date_from,
             date_to=date_to,
             sort=sort_param
         )
         
-        results = []
-        for item in items:
+        # 각 기사에서 사용할 링크 (원본 링크가 있으면 원본 링크, 없으면 네이버 링크)
+        links = [item.get('originallink') or item.get('link', '') for item in items]
+        
+        # 같은 본문/설명(여러 언론사에 실린 통신 기사 등)은 한 번만 요약
+        summaries: Dict[str, str] = {}
+        
+        yielded = 0
+        prefetched_until = 0  # 이 인덱스 전까지의 기사 페이지는 미리 받아 둠
+        for index, item in enumerate(items):
+            # 기사 페이지는 배치 단위로 동시에 미리 받아 둠 (조회수/제목/본문 추출은 캐시 사용)
+            # 배치 크기는 아직 필요한 기사 수를 넘지 않게 제한 (쓰지 않을 페이지는 받지 않음)
+            if index >= prefetched_until:
+                batch_size = _FETCH_BATCH_SIZE
+                if max_results is not None:
+                    batch_size = max(1, min(batch_size, max_results - yielded))
+                prefetched_until = index + batch_size
+                self._prefetch_html(links[index:prefetched_until])
+            
             # 날짜를 한국어 형식으로 변환
             pub_date = item.get('pubDate', '')
             pub_date_korean = self._format_date_korean(pub_date)
             
-            # 제목에서 해시태그 제거
-            title = item.get('title', '').replace('<b>', '').replace('</b>', '').strip()
-            # 해시태그 제거 (#으로 시작하는 단어들)
-            title = re.sub(r'#\S+', '', title).strip()
-            # 연속된 공백 정리
-            title = re.sub(r'\s+', ' ', title).strip()
+            # 제목에서 <b> 태그와 해시태그 제거 및 공백 정리
+            title = _clean_title(item.get('title', ''))
+            
+            description = _BOLD_TAG_RE.sub('', item.get('description', '')).strip()
+            
+            # 영어 기사는 조회수/본문 추출과 요약을 하기 전에 건너뜀 (요약이 가장 비싼 단계)
+            if exclude_english and self._is_english_article(title, description):
+                continue
             
             result = {
                 'title': title,
                 'link': item.get('link', ''),
-                'description': item.get('description', '').replace('<b>', '').replace('</b>', '').strip(),
+                'description': description,
                 'pubDate': pub_date_korean,  # 한국어 형식으로 변환된 날짜
                 'originallink': item.get('originallink', ''),
                 'source': self._extract_source_from_link(item.get('originallink', '')),
@@ -1490,17 +1785,12 @@ class NaverNewsAPICrawler:
                     full_title = self.extract_title_from_link(link_to_use)
                     if full_title:
                         # 해시태그 제거 및 정리
-                        full_title = full_title.replace('<b>', '').replace('</b>', '').strip()
-                        full_title = re.sub(r'#\S+', '', full_title).strip()
-                        full_title = re.sub(r'\s+', ' ', full_title).strip()
-                        result['title'] = full_title
+                        result['title'] = _clean_title(full_title)
             
             # 조회수 추출 (항상 추출)
             link_to_use = result['originallink'] or result['link']
             view_count = self.extract_view_count(link_to_use)
             result['view_count'] = view_count if view_count is not None else 0
-            if view_count is not None:
-                time.sleep(self.delay)  # 조회수 추출 시 추가 대기
             
             if include_full_text:
                 # 원본 링크가 있으면 원본 링크 사용, 없으면 네이버 링크 사용
@@ -1514,116 +1804,54 @@ class NaverNewsAPICrawler:
                     result['full_text'] = full_text
                     # 본문을 요약하여 저장 (3줄 요약, 화면 표시용)
                     print(f"[본문 추출] 요약 시작: 본문 길이={len(full_text)}자")
-                    result['text'] = self.summarize_text(full_text)
+                    result['text'] = self._summarize_once(full_text, summaries)
                     print(f"[본문 추출] 요약 완료: 결과 길이={len(result.get('text', ''))}자")
-                    # 성공한 기사만 결과에 추가
-                    results.append(result)
                 else:
                     # 본문 추출 실패 시 description으로 요약 생성
                     description = result.get('description', '')
                     print(f"[본문 추출] 본문 추출 실패, description으로 요약 시도: 길이={len(description)}자")
+                    # (full_text는 설정하지 않음 - 감정 분석은 description을 그대로 사용)
                     if description:
-                        result['text'] = self.summarize_text(description)
-                        result['full_text'] = description  # 감정 분석용으로 description 사용
+                        result['text'] = self._summarize_once(description, summaries)
                         print(f"[본문 추출] description 요약 완료: 결과 길이={len(result.get('text', ''))}자")
                     else:
                         result['text'] = ''
-                        result['full_text'] = ''
                         print(f"[본문 추출] description도 없음, 빈 텍스트 설정")
-                    # 본문 추출 실패해도 결과에 포함 (description으로 요약)
-                    results.append(result)
-                time.sleep(self.delay)  # 본문 추출 시 추가 대기
             else:
                 # 본문 추출을 하지 않아도 description을 요약 (8GB 플랜)
                 description = result.get('description', '')
                 if description:
-                    result['text'] = self.summarize_text(description)
-                    result['full_text'] = description  # 감정 분석용으로 description 사용
+                    result['text'] = self._summarize_once(description, summaries)
                 else:
                     result['text'] = ''
-                    result['full_text'] = ''
-                results.append(result)
             
-            # 이미 충분한 수를 확보했으면 중단
-            if len(results) >= max_results:
-                break
-        
-        # 정렬 처리
+            # 본문 추출에 실패해도 description으로 요약하여 결과에 포함
+            yielded += 1
+            yield result
+    
+    def _sort_results(self, results: List[Dict], sort_by: str):
+        """결과 리스트를 정렬 기준에 맞게 제자리 정렬합니다"""
+        # 정렬 처리 (view_count, pubDate는 모든 결과에 항상 들어 있음)
         if sort_by == 'view':
             # 조회수 순으로 정렬 (내림차순)
-            results.sort(key=lambda x: x.get('view_count', 0), reverse=True)
+            results.sort(key=itemgetter('view_count'), reverse=True)
         elif sort_by == 'date':
             # 날짜 순으로 정렬 (내림차순 - 최신순)
-            results.sort(key=lambda x: x.get('pubDate', ''), reverse=True)
-        
-        return results
+            results.sort(key=itemgetter('pubDate'), reverse=True)
     
     def _extract_source_from_link(self, link: str) -> str:
         """링크에서 출처 추출"""
         if not link:
             return "알 수 없음"
         
-        try:
-            from urllib.parse import urlparse
-            domain = urlparse(link).netloc
-            # www. 제거
-            domain = domain.replace('www.', '')
-            return domain
-        except:
-            return "알 수 없음"
+        return _source_from_link(link)
     
     def _format_date_korean(self, date_str: str) -> str:
         """
         날짜 문자열을 한국어 형식으로 변환합니다.
         예: "Thu, 11 Dec 2025 00:23:00 +0900" -> "2025년 12월 11일 00:23"
         """
-        if not date_str:
-            return "알 수 없음"
-        
-        try:
-            # 여러 날짜 형식 시도
-            date_formats = [
-                "%a, %d %b %Y %H:%M:%S %z",  # "Thu, 11 Dec 2025 00:23:00 +0900"
-                "%a, %d %b %Y %H:%M:%S",     # "Thu, 11 Dec 2025 00:23:00"
-                "%Y-%m-%d %H:%M:%S",         # "2025-12-11 00:23:00"
-                "%Y-%m-%d",                  # "2025-12-11"
-            ]
-            
-            parsed_date = None
-            for fmt in date_formats:
-                try:
-                    parsed_date = datetime.strptime(date_str.strip(), fmt)
-                    break
-                except ValueError:
-                    continue
-            
-            if parsed_date is None:
-                # 마지막 시도: 공백 제거 후 다시 시도
-                date_str_clean = date_str.strip()
-                # "+0900" 같은 타임존 제거 후 시도
-                if '+' in date_str_clean or date_str_clean.endswith('00'):
-                    date_str_clean = re.sub(r'\s*[+-]\d{4}$', '', date_str_clean)
-                    try:
-                        parsed_date = datetime.strptime(date_str_clean, "%a, %d %b %Y %H:%M:%S")
-                    except ValueError:
-                        pass
-            
-            if parsed_date is None:
-                return date_str
-            
-            # 한국어 형식으로 변환: "2025년 12월 11일 00:23"
-            formatted = parsed_date.strftime("%Y년 %m월 %d일 %H:%M")
-            
-            # 월 앞의 0 제거 (예: "01월" -> "1월")
-            formatted = re.sub(r'0(\d)월', r'\1월', formatted)
-            # 일 앞의 0 제거 (예: "01일" -> "1일")
-            formatted = re.sub(r'0(\d)일', r'\1일', formatted)
-            
-            return formatted
-        except Exception as e:
-            # 파싱 실패 시 원본 반환
-            print(f"날짜 파싱 오류: {e}, 원본: {date_str}")
-            return date_str
+        return _format_date_korean_cached(date_str)
     
     def _is_english_article(self, title: str, description: str = '', text: str = '') -> bool:
         """
@@ -1637,28 +1865,30 @@ class NaverNewsAPICrawler:
         Returns:
             영어 기사면 True, 아니면 False
         """
-        # 제목, 설명, 본문을 합쳐서 분석
-        content = f"{title} {description} {text}".strip()
-        
-        if not content:
-            return False
-        
         # 한글이 포함되어 있으면 영어 기사가 아님
-        if re.search(r'[가-힣]', content):
-            return False
-        
-        # 영어 문자 비율 계산
-        total_chars = len(re.findall(r'[a-zA-Z]', content))
-        total_words = len(content.split())
-        
-        if total_words == 0:
+        # (대부분 제목에서 바로 판단되므로 긴 본문을 합치거나 훑지 않음)
+        for part in (title, description, text):
+            if part and _HANGUL_RE.search(part):
+                return False
+        
+        # 제목, 설명, 본문을 합치지 않고 차례로 훑어서 분석
+        # 영어 문자 비율 계산 (공백을 제외한 글자 중 영문자 비율, 한 번의 순회로 계산)
+        total_chars = 0
+        non_space_chars = 0
+        for ch in chain(title, description, text):
+            if ch != ' ':
+                non_space_chars += 1
+                if ch in _ASCII_LETTERS:
+                    total_chars += 1
+        
+        if non_space_chars == 0:
             return False
         
         # 영어 비율이 70% 이상이면 영어 기사로 판단
-        english_ratio = total_chars / len(content.replace(' ', '')) if len(content.replace(' ', '')) > 0 else 0
+        english_ratio = total_chars / non_space_chars
         
         # 제목만 영어이고 설명/본문이 없으면 영어 기사로 판단
-        if english_ratio > 0.7 and not re.search(r'[가-힣]', content):
+        if english_ratio > 0.7:
             return True
         
         return False
@@ -1684,36 +1914,46 @@ class NaverNewsAPICrawler:
         Returns:
             기사 정보 리스트
         """
-        date_to = datetime.now().strftime('%Y%m%d')
-        date_from = (datetime.now() - timedelta(days=days)).strftime('%Y%m%d')
+        today = datetime.now().date()
+        date_to = today.isoformat().replace('-', '')
+        date_from = (today - timedelta(days=days)).isoformat().replace('-', '')
+        
+        if not exclude_english:
+            return self.crawl_news_with_full_text(
+                query=query,
+                max_results=max_results,
+                include_full_text=True,
+                date_from=date_from,
+                date_to=date_to,
+                sort_by=sort_by
+            )
         
-        results = self.crawl_news_with_full_text(
+        # 영어 뉴스 제외: 기사를 하나씩 처리하면서 바로 거르고, 필요한 수를 채우면 중단
+        # (남은 기사는 다운로드/요약하지 않음)
+        filtered_results = []
+        for result in self.iter_news(
             query=query,
-            max_results=max_results * 2 if exclude_english else max_results,  # 영어 제외 시 더 많이 수집
+            max_items=max_results * 4,  # 영어 기사와 본문 추출 실패를 대비해 넉넉히 검색
             include_full_text=True,
             date_from=date_from,
             date_to=date_to,
-            sort_by=sort_by
-        )
-        
-        # 영어 뉴스 제외
-        if exclude_english:
-            filtered_results = []
-            for result in results:
-                title = result.get('title', '')
-                description = result.get('description', '')
-                text = result.get('text', '')
+            sort_by=sort_by,
+            exclude_english=True,
+            max_results=max_results
+        ):
+            title = result.get('title', '')
+            description = result.get('description', '')
+            text = result.get('text', '')
+            
+            if not self._is_english_article(title, description, text):
+                filtered_results.append(result)
                 
-                if not self._is_english_article(title, description, text):
-                    filtered_results.append(result)
-                    
-                    # 필요한 수만큼 수집했으면 중단
-                    if len(filtered_results) >= max_results:
-                        break
-            
-            return filtered_results
+                # 필요한 수만큼 수집했으면 중단
+                if len(filtered_results) >= max_results:
+                    break
         
-        return results
+        self._sort_results(filtered_results, sort_by)
+        return filtered_results
 
 
 def crawl_naver_news_api(
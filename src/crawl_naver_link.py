@@ -4,14 +4,154 @@
 """
 
 import requests
-from bs4 import BeautifulSoup
-from newspaper import Article
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
+from newspaper import Article, Config
+from typing import Dict, List, Optional, Tuple
 import re
+import codecs
+import sys
+import argparse
 from datetime import datetime, timedelta
-import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import feedparser
-from urllib.parse import urlparse, quote
+from urllib.parse import urlparse, quote, unquote_plus
+
+from src.http_utils import _STREAM_CHUNK_SIZE, _HostRateLimiter, _sniff_charset
+
+
+def _class_xpath(class_name: str) -> str:
+    """CSS 클래스 선택자(.class)에 해당하는 XPath 조건식"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+# 네이버 뉴스 기사 페이지 선택자 (CSS 선택자 목록과 같은 순서의 XPath 합집합, 문서 순서로 반환)
+# #title_area, .media_end_head_headline h2, h2.end_tit
+_TITLE_XPATH = etree.XPath(
+    f"//*[@id='title_area'] | //*[{_class_xpath('media_end_head_headline')}]//h2 | //h2[{_class_xpath('end_tit')}]"
+)
+# #newsct_article, .news_end_body_body, ._article_body_contents
+_BODY_XPATH = etree.XPath(
+    f"//*[@id='newsct_article'] | //*[{_class_xpath('news_end_body_body')}] | //*[{_class_xpath('_article_body_contents')}]"
+)
+# div[id*="article" i]: 본문 선택자가 모두 실패했을 때의 대체 선택자
+_ARTICLE_ID_DIV_XPATH = etree.XPath("//div[contains(translate(@id, 'ARTICLE', 'article'), 'article')]")
+# .media_end_head_info_datestamp_time, ._ARTICLE_DATE_TIME
+_DATE_XPATH = etree.XPath(
+    f"//*[{_class_xpath('media_end_head_info_datestamp_time')}] | //*[{_class_xpath('_ARTICLE_DATE_TIME')}]"
+)
+# .media_end_head_top_logo img, .press_logo img
+_PRESS_LOGO_XPATH = etree.XPath(
+    f"//*[{_class_xpath('media_end_head_top_logo')}]//img | //*[{_class_xpath('press_logo')}]//img"
+)
+# .byline, ._ARTICLE_BYLINE
+_BYLINE_XPATH = etree.XPath(f"//*[{_class_xpath('byline')}] | //*[{_class_xpath('_ARTICLE_BYLINE')}]")
+
+# 본문 텍스트 노드 (BeautifulSoup get_text처럼 script/style/template/rt/rp 안의 문자열과 주석은 제외)
+_TEXT_NODES_XPATH = etree.XPath(
+    './/text()[not(ancestor::script or ancestor::style or ancestor::template or ancestor::rt or ancestor::rp)]'
+)
+
+# 기사 링크 후보(a[href*="/article/"], a[href*="news.naver.com"])만 파서 단계에서 한 번에 선택
+# 검색 결과의 제목/정보 링크(a.news_tit, a.info, .news_area a 등)도 기사 링크라면 모두 여기에 포함됨
+_ARTICLE_ANCHOR_XPATH = etree.XPath("//a[contains(@href, '/article/') or contains(@href, 'news.naver.com')]")
+
+# 자주 쓰는 정규식 (링크마다 반복 호출되므로 모듈 로드 시 한 번만 컴파일)
+_ARTICLE_RE = re.compile(r'article/(\d+)/(\d+)')
+_SOURCE_RE = re.compile(r'/article/(\d+)/')
+_DOUBLE_NL_RE = re.compile(r'\n\s*\n')
+_GOOGLE_URL_RE = re.compile(r'[?&]url=([^&#]+)')
+
+# 응답 본문 최대 크기 (비정상적으로 큰 페이지는 앞부분만 파싱)
+_MAX_CONTENT_BYTES = 1024 * 1024
+
+# 여러 기사를 동시에 가져올 때의 최대 작업자 수 (호스트별 요청 간격은 _HostRateLimiter가 작업자 간에 공유해 지킴)
+_CRAWL_WORKERS = 8
+
+# 기사 날짜 형식 (출현 빈도 순)
+_DATE_PATTERNS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y.%m.%d %H:%M',
+    '%Y-%m-%dT%H:%M:%S',
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[str]:
+    """날짜 문자열 파싱 (같은 문자열은 캐시된 결과 반환)"""
+    try:
+        # 다양한 날짜 형식 처리
+        for pattern in _DATE_PATTERNS:
+            try:
+                dt = datetime.strptime(date_str, pattern)
+                return dt.strftime('%Y-%m-%d %H:%M:%S')
+            except:
+                continue
+        
+        # ISO 형식
+        if 'T' in date_str:
+            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            return dt.strftime('%Y-%m-%d %H:%M:%S')
+        
+    except Exception:
+        pass
+    
+    return date_str
+
+
+def _first_match(xpath: etree.XPath, doc) -> Optional[etree._Element]:
+    """XPath 결과 중 문서상 첫 번째 요소 (없으면 None)"""
+    matches = xpath(doc)
+    return matches[0] if matches else None
+
+
+def _element_text(elem, separator: str = '') -> str:
+    """요소 안의 텍스트 조각을 양끝 공백을 제거해 이어 붙임 (빈 조각 제외)"""
+    return separator.join(piece for piece in (text.strip() for text in _TEXT_NODES_XPATH(elem)) if piece)
+
+
+def _parse_html(content: bytes, encoding: str):
+    """
+    HTML 바이트를 lxml로 파싱합니다.
+    UTF-8은 libxml2가 바이트를 직접 디코딩하고, 그 외 인코딩(EUC-KR 등)만 파이썬 코덱으로 디코딩합니다.
+    """
+    if codecs.lookup(encoding).name == 'utf-8':
+        return lxml_html.fromstring(content, parser=lxml_html.HTMLParser(encoding='utf-8'))
+    return lxml_html.fromstring(content.decode(encoding, 'replace'))
+
+
+@lru_cache(maxsize=8192)
+def _normalize_naver_url(href: str) -> Optional[str]:
+    """
+    링크를 네이버 뉴스 기사 URL로 정규화합니다.
+    
+    Returns:
+        https://n.news.naver.com/mnews/article/{매체}/{기사} 형태의 URL 또는 None (기사 링크가 아닌 경우)
+    """
+    # 네이버 뉴스 기사 링크 패턴 찾기
+    if '/article/' not in href and 'news.naver.com' not in href:
+        return None
+    
+    # 상대 경로를 절대 경로로 변환
+    if href.startswith('//'):
+        href = 'https:' + href
+    elif href.startswith('/'):
+        href = 'https://news.naver.com' + href
+    elif not href.startswith('http'):
+        return None
+    
+    # 네이버 뉴스 링크 정규화
+    if 'n.news.naver.com' not in href:
+        match = _ARTICLE_RE.search(href)
+        if match:
+            href = f"https://n.news.naver.com/mnews/article/{match.group(1)}/{match.group(2)}"
+    
+    # 유효한 네이버 뉴스 링크인지 확인 (댓글 페이지나 기타 페이지 제외)
+    if 'news.naver.com' not in href or '/article/' not in href or '/comment/' in href:
+        return None
+    return href
 
 
 class NaverNewsLinkCrawler:
@@ -27,6 +167,64 @@ class NaverNewsLinkCrawler:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        
+        # 같은 호스트(naver.com)에 반복 요청하므로 keep-alive 연결을 재사용
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # 요청 간격 제한 (파싱에 쓴 시간도 대기 시간으로 인정)
+        self._rate_limiter = _HostRateLimiter(delay)
+        
+        # newspaper3k 설정 (HTML은 self.session으로 받아 넘겨주므로 직접 요청하지 않음)
+        self.newspaper_config = Config()
+        self.newspaper_config.browser_user_agent = self.headers['User-Agent']
+        self.newspaper_config.request_timeout = 10
+    
+    def _download(self, url: str) -> Tuple[bytes, str]:
+        """
+        호스트별 요청 간격을 지켜 세션으로 GET 요청합니다.
+        
+        Returns:
+            (디코딩하지 않은 본문 바이트(최대 _MAX_CONTENT_BYTES), 인코딩)
+        """
+        self._rate_limiter.acquire(urlparse(url).netloc)
+        chunks = []
+        size = 0
+        with self.session.get(url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            encoding = response.encoding
+            for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= _MAX_CONTENT_BYTES:
+                    break
+        content = b''.join(chunks)
+        
+        # HTTP 헤더에 charset이 없으면 문서의 charset 선언, 그것도 없으면 UTF-8 (네이버 기본값)
+        if encoding is None or encoding == 'ISO-8859-1':
+            encoding = _sniff_charset(content) or 'utf-8'
+        else:
+            try:
+                codecs.lookup(encoding)
+            except LookupError:
+                encoding = 'utf-8'
+        return content, encoding
+    
+    def _parse_feed(self, feed_url: str) -> feedparser.FeedParserDict:
+        """세션으로 RSS 피드를 받아 파싱 (요청 실패 시 빈 피드)"""
+        try:
+            content, _ = self._download(feed_url)
+            return feedparser.parse(content)
+        except requests.RequestException as e:
+            print(f"RSS 피드 요청 오류 ({feed_url}): {e}")
+            return feedparser.FeedParserDict(entries=[])
     
     def extract_from_url(self, url: str) -> Optional[Dict]:
         """
@@ -45,15 +243,28 @@ class NaverNewsLinkCrawler:
                 'author': str (optional)
             } 또는 None (실패 시)
         """
+        content = None
+        encoding = 'utf-8'
+        bs4_tried = False
         try:
+            # 연결 풀을 재사용하도록 세션으로 한 번만 다운로드
+            content, encoding = self._download(url)
+            
+            # 구조를 알고 있는 네이버 뉴스 기사는 lxml 선택자로 먼저 추출
+            if 'n.news.naver.com' in url:
+                bs4_tried = True
+                result = self._extract_with_bs4(url, content, encoding)
+                if result:
+                    return result
+            
             # newspaper3k 사용
-            article = Article(url, language='ko')
-            article.download()
+            article = Article(url, language='ko', config=self.newspaper_config)
+            article.set_html(content)
             article.parse()
             
             if not article.text or len(article.text) < 100:
-                # newspaper3k 실패 시 BeautifulSoup으로 재시도
-                return self._extract_with_bs4(url)
+                # newspaper3k 실패 시 받아둔 HTML로 선택자 추출 재시도
+                return None if bs4_tried else self._extract_with_bs4(url, content, encoding)
             
             result = {
                 'title': article.title or '',
@@ -64,62 +275,63 @@ class NaverNewsLinkCrawler:
                 'author': article.authors[0] if article.authors else None
             }
             
-            time.sleep(self.delay)
             return result
             
         except Exception as e:
             print(f"Error extracting from {url}: {e}")
-            # BeautifulSoup으로 재시도
-            return self._extract_with_bs4(url)
+            # 선택자 추출로 재시도 (다운로드에 실패했으면 다시 요청)
+            return None if bs4_tried else self._extract_with_bs4(url, content, encoding)
     
-    def _extract_with_bs4(self, url: str) -> Optional[Dict]:
-        """BeautifulSoup을 사용한 대체 추출 방법"""
+    def _extract_with_bs4(
+        self,
+        url: str,
+        content: Optional[bytes] = None,
+        encoding: str = 'utf-8'
+    ) -> Optional[Dict]:
+        """lxml 선택자를 사용한 대체 추출 방법 (content가 있으면 다시 요청하지 않음)"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            if content is None:
+                content, encoding = self._download(url)
+            doc = _parse_html(content, encoding)
             
             # 네이버 뉴스 구조에 맞춘 선택자
-            title_elem = soup.select_one('#title_area, .media_end_head_headline h2, h2.end_tit')
-            title = title_elem.get_text(strip=True) if title_elem else ''
+            title_elem = _first_match(_TITLE_XPATH, doc)
+            title = _element_text(title_elem) if title_elem is not None else ''
             
             # 본문 추출
-            content_elem = soup.select_one('#newsct_article, .news_end_body_body, ._article_body_contents')
-            if not content_elem:
+            content_elem = _first_match(_BODY_XPATH, doc)
+            if content_elem is None:
                 # 다른 가능한 선택자들
-                content_elem = soup.find('div', {'id': re.compile('.*article.*', re.I)})
+                content_elem = _first_match(_ARTICLE_ID_DIV_XPATH, doc)
             
-            if content_elem:
-                # 불필요한 태그 제거
-                for tag in content_elem.find_all(['script', 'style', 'iframe', 'div[class*="ad"]']):
-                    tag.decompose()
-                text = content_elem.get_text(separator='\n', strip=True)
+            if content_elem is not None:
+                # 불필요한 태그 비우기 (뒤따르는 텍스트는 별도 조각으로 유지)
+                for tag in list(content_elem.iter('script', 'style', 'iframe')):
+                    tag.clear(keep_tail=True)
+                text = _element_text(content_elem, '\n')
                 # 연속된 공백 정리
-                text = re.sub(r'\n\s*\n', '\n\n', text)
+                text = _DOUBLE_NL_RE.sub('\n\n', text)
             else:
                 text = ''
             
             # 날짜 추출
-            date_elem = soup.select_one('.media_end_head_info_datestamp_time, ._ARTICLE_DATE_TIME')
+            date_elem = _first_match(_DATE_XPATH, doc)
             published = None
-            if date_elem:
-                date_text = date_elem.get('data-date-time') or date_elem.get_text(strip=True)
+            if date_elem is not None:
+                date_text = date_elem.get('data-date-time') or _element_text(date_elem)
                 published = self._parse_date(date_text)
             
             # 출처 추출
-            source_elem = soup.select_one('.media_end_head_top_logo img, .press_logo img')
-            source = source_elem.get('alt', '') if source_elem else self._extract_source_from_url(url)
+            source_elem = _first_match(_PRESS_LOGO_XPATH, doc)
+            source = source_elem.get('alt', '') if source_elem is not None else self._extract_source_from_url(url)
             
             # 작성자 추출
-            author_elem = soup.select_one('.byline, ._ARTICLE_BYLINE')
-            author = author_elem.get_text(strip=True) if author_elem else None
+            author_elem = _first_match(_BYLINE_XPATH, doc)
+            author = _element_text(author_elem) if author_elem is not None else None
             
             if not title or not text or len(text) < 100:
                 return None
             
-            time.sleep(self.delay)
             return {
                 'title': title,
                 'text': text.strip(),
@@ -130,13 +342,13 @@ class NaverNewsLinkCrawler:
             }
             
         except Exception as e:
-            print(f"Error with BS4 extraction from {url}: {e}")
+            print(f"Error with lxml extraction from {url}: {e}")
             return None
     
     def _extract_source_from_url(self, url: str) -> str:
         """URL에서 출처 추출"""
         # 네이버 뉴스 URL 패턴: https://n.news.naver.com/mnews/article/{media_code}/...
-        match = re.search(r'/article/(\d+)/', url)
+        match = _SOURCE_RE.search(url)
         if match:
             # 미디어 코드를 출처로 사용 (실제 매체명은 별도 매핑 필요)
             return f"media_{match.group(1)}"
@@ -146,35 +358,11 @@ class NaverNewsLinkCrawler:
         """날짜 문자열 파싱"""
         if not date_str:
             return None
-        
-        try:
-            # 다양한 날짜 형식 처리
-            patterns = [
-                '%Y-%m-%d %H:%M:%S',
-                '%Y.%m.%d %H:%M',
-                '%Y-%m-%dT%H:%M:%S',
-            ]
-            
-            for pattern in patterns:
-                try:
-                    dt = datetime.strptime(date_str, pattern)
-                    return dt.strftime('%Y-%m-%d %H:%M:%S')
-                except:
-                    continue
-            
-            # ISO 형식
-            if 'T' in date_str:
-                dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                return dt.strftime('%Y-%m-%d %H:%M:%S')
-            
-        except Exception:
-            pass
-        
-        return date_str
+        return _parse_date_cached(date_str)
     
     def crawl_multiple(self, urls: List[str]) -> List[Dict]:
         """
-        여러 URL을 순차적으로 크롤링합니다.
+        여러 URL을 동시에 크롤링합니다. 결과는 입력 순서를 유지합니다.
         
         Args:
             urls: 네이버 뉴스 URL 리스트
@@ -182,16 +370,17 @@ class NaverNewsLinkCrawler:
         Returns:
             추출된 기사 정보 리스트
         """
-        results = []
-        for url in urls:
-            if not url or not url.startswith('http'):
-                continue
-            
-            result = self.extract_from_url(url)
-            if result:
-                results.append(result)
+        valid_urls = [url for url in urls if url and url.startswith('http')]
+        if not valid_urls:
+            return []
+        
+        if len(valid_urls) == 1:
+            result = self.extract_from_url(valid_urls[0])
+            return [result] if result else []
         
-        return results
+        # 대부분의 시간이 네트워크 대기와 lxml 파싱(GIL 해제)이므로 스레드로 요청을 겹쳐서 처리
+        with ThreadPoolExecutor(max_workers=min(_CRAWL_WORKERS, len(valid_urls))) as executor:
+            return [result for result in executor.map(self.extract_from_url, valid_urls) if result]
     
     def get_news_urls_by_keyword(
         self,
@@ -215,58 +404,18 @@ class NaverNewsLinkCrawler:
             # 네이버 뉴스 검색 URL
             search_url = f"https://search.naver.com/search.naver?where=news&query={quote(keyword)}&sm=tab_jum&sort=1"
             
-            response = requests.get(search_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 네이버 뉴스 검색 결과에서 링크 추출
-            # 여러 가능한 선택자 시도
-            link_selectors = [
-                'a.news_tit',  # 네이버 뉴스 검색 결과의 제목 링크
-                'a.info',      # 정보 링크
-                'a[href*="news.naver.com"]',
-                'a[href*="/article/"]',
-                '.news_area a',
-                '.api_subject_bx a',
-            ]
-            
-            for selector in link_selectors:
-                links = soup.select(selector)
-                for link in links:
-                    if len(urls) >= max_items:
-                        break
-                    
-                    href = link.get('href', '')
-                    if not href:
-                        continue
-                    
-                    # 네이버 뉴스 기사 링크 패턴 찾기
-                    if '/article/' in href or 'n.news.naver.com' in href or 'news.naver.com' in href:
-                        # 상대 경로를 절대 경로로 변환
-                        if href.startswith('/'):
-                            href = 'https://news.naver.com' + href
-                        elif href.startswith('//'):
-                            href = 'https:' + href
-                        elif not href.startswith('http'):
-                            continue
-                        
-                        # 네이버 뉴스 링크 정규화
-                        if 'n.news.naver.com' not in href:
-                            match = re.search(r'article/(\d+)/(\d+)', href)
-                            if match:
-                                href = f"https://n.news.naver.com/mnews/article/{match.group(1)}/{match.group(2)}"
-                        
-                        # 유효한 네이버 뉴스 링크인지 확인
-                        if ('n.news.naver.com' in href or 'news.naver.com' in href) and '/article/' in href:
-                            # 댓글 페이지나 기타 페이지 제외
-                            if '/comment/' not in href and href not in found_links:
-                                found_links.add(href)
-                                urls.append(href)
-                
+            # 링크 속성만 필요하므로 BeautifulSoup 트리 없이 lxml로 직접 파싱
+            tree = _parse_html(*self._download(search_url))
+            
+            # 네이버 뉴스 검색 결과에서 링크 추출 (문서를 한 번만 순회)
+            for link in _ARTICLE_ANCHOR_XPATH(tree):
                 if len(urls) >= max_items:
                     break
+                
+                href = _normalize_naver_url(link.get('href', ''))
+                if href and href not in found_links:
+                    found_links.add(href)
+                    urls.append(href)
             
             # 검색 결과가 부족하면 추가 페이지 시도
             if len(urls) < max_items:
@@ -276,33 +425,16 @@ class NaverNewsLinkCrawler:
                     
                     page_url = f"https://search.naver.com/search.naver?where=news&query={quote(keyword)}&sm=tab_jum&sort=1&start={((page-1)*10)+1}"
                     try:
-                        page_response = requests.get(page_url, headers=self.headers, timeout=10)
-                        page_response.raise_for_status()
-                        page_response.encoding = 'utf-8'
-                        page_soup = BeautifulSoup(page_response.text, 'html.parser')
+                        page_tree = _parse_html(*self._download(page_url))
                         
-                        for selector in link_selectors:
-                            links = page_soup.select(selector)
-                            for link in links:
-                                if len(urls) >= max_items:
-                                    break
-                                
-                                href = link.get('href', '')
-                                if href and ('/article/' in href or 'n.news.naver.com' in href):
-                                    if href.startswith('/'):
-                                        href = 'https://news.naver.com' + href
-                                    elif href.startswith('//'):
-                                        href = 'https:' + href
-                                    
-                                    if 'n.news.naver.com' not in href:
-                                        match = re.search(r'article/(\d+)/(\d+)', href)
-                                        if match:
-                                            href = f"https://n.news.naver.com/mnews/article/{match.group(1)}/{match.group(2)}"
-                                    
-                                    if ('n.news.naver.com' in href or 'news.naver.com' in href) and '/article/' in href:
-                                        if '/comment/' not in href and href not in found_links:
-                                            found_links.add(href)
-                                            urls.append(href)
+                        for link in _ARTICLE_ANCHOR_XPATH(page_tree):
+                            if len(urls) >= max_items:
+                                break
+                            
+                            href = _normalize_naver_url(link.get('href', ''))
+                            if href and href not in found_links:
+                                found_links.add(href)
+                                urls.append(href)
                     except Exception as e:
                         print(f"추가 페이지 크롤링 오류 (페이지 {page}): {e}")
                         break
@@ -351,15 +483,16 @@ class NaverNewsLinkCrawler:
         
         rss_url = rss_urls.get(category.lower(), rss_urls['all'])
         urls = []
+        found_links = set()
         
         try:
-            feed = feedparser.parse(rss_url)
+            feed = self._parse_feed(rss_url)
             
             if not feed.entries:
                 # 네이버 RSS 실패 시 Google News RSS 시도
                 print("네이버 RSS 피드가 비어있습니다. Google News RSS를 시도합니다...")
                 google_rss_url = google_rss_urls.get(category.lower(), google_rss_urls['all'])
-                feed = feedparser.parse(google_rss_url)
+                feed = self._parse_feed(google_rss_url)
             
             for entry in feed.entries[:max_items]:
                 link = entry.get('link', '')
@@ -368,22 +501,20 @@ class NaverNewsLinkCrawler:
                 
                 # Google News 링크인 경우 원본 링크 추출
                 if 'news.google.com' in link:
-                    # Google News 링크에서 원본 URL 추출
-                    if 'url=' in link:
-                        import urllib.parse
-                        parsed = urllib.parse.urlparse(link)
-                        params = urllib.parse.parse_qs(parsed.query)
-                        if 'url' in params:
-                            link = params['url'][0]
+                    # Google News 링크에서 원본 URL 추출 (url 쿼리 파라미터만 필요)
+                    match = _GOOGLE_URL_RE.search(link)
+                    if match:
+                        link = unquote_plus(match.group(1))
                 
                 if link and 'news.naver.com' in link:
                     # 네이버 뉴스 링크 정규화
                     if 'n.news.naver.com' not in link:
                         # 구형 링크를 신형으로 변환 시도
-                        match = re.search(r'article/(\d+)/(\d+)', link)
+                        match = _ARTICLE_RE.search(link)
                         if match:
                             link = f"https://n.news.naver.com/mnews/article/{match.group(1)}/{match.group(2)}"
-                    if link not in urls:
+                    if link not in found_links:
+                        found_links.add(link)
                         urls.append(link)
             
             print(f"RSS에서 {len(urls)}개의 기사 링크를 가져왔습니다.")
@@ -421,44 +552,17 @@ class NaverNewsLinkCrawler:
                 break
                 
             try:
-                response = requests.get(page_url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                response.encoding = 'utf-8'
+                tree = _parse_html(*self._download(page_url))
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # 모든 링크 찾기
-                all_links = soup.find_all('a', href=True)
-                
-                for link in all_links:
+                # 기사 링크 후보만 찾기
+                for link in _ARTICLE_ANCHOR_XPATH(tree):
                     if len(urls) >= max_items:
                         break
                         
-                    href = link.get('href', '')
-                    if not href:
-                        continue
-                    
-                    # 네이버 뉴스 기사 링크 패턴 찾기
-                    if '/article/' in href or 'n.news.naver.com' in href:
-                        # 상대 경로를 절대 경로로 변환
-                        if href.startswith('/'):
-                            href = 'https://news.naver.com' + href
-                        elif href.startswith('//'):
-                            href = 'https:' + href
-                        elif not href.startswith('http'):
-                            continue
-                        
-                        # 네이버 뉴스 링크 정규화
-                        if 'n.news.naver.com' not in href:
-                            match = re.search(r'article/(\d+)/(\d+)', href)
-                            if match:
-                                href = f"https://n.news.naver.com/mnews/article/{match.group(1)}/{match.group(2)}"
-                        
-                        # 유효한 네이버 뉴스 링크인지 확인
-                        if 'n.news.naver.com' in href or 'news.naver.com' in href:
-                            if href not in found_links and '/article/' in href:
-                                found_links.add(href)
-                                urls.append(href)
+                    href = _normalize_naver_url(link.get('href', ''))
+                    if href and href not in found_links:
+                        found_links.add(href)
+                        urls.append(href)
                 
             except Exception as e:
                 print(f"페이지 크롤링 오류 ({page_url}): {e}")
@@ -541,9 +645,6 @@ def crawl_naver_news_from_links(urls: List[str], delay: float = 1.0) -> List[Dic
 
 
 if __name__ == '__main__':
-    import sys
-    import argparse
-    
     parser = argparse.ArgumentParser(description='네이버 뉴스 크롤링 도구')
     parser.add_argument('urls', nargs='*', help='크롤링할 네이버 뉴스 URL 또는 검색 키워드 (선택사항)')
     parser.add_argument('--keyword', '-k', type=str, help='검색할 키워드')
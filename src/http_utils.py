@@ -0,0 +1,62 @@
+"""
+크롤러 공용 HTTP 유틸리티 모듈
+검색 API 크롤러와 링크 크롤러가 함께 쓰는 응답 처리/요청 간격 제한 도구입니다. (ML 라이브러리 의존성 없음)
+"""
+
+import re
+import time
+import codecs
+import threading
+from typing import Dict, Optional, Tuple
+
+
+# 스트리밍 다운로드/파싱 시 한 번에 다룰 바이트 길이
+_STREAM_CHUNK_SIZE = 65536
+
+# <meta charset="..."> / <meta http-equiv content="...; charset=..."> 선언
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+# charset 선언을 찾을 응답 본문 앞부분 길이
+_CHARSET_SCAN_SIZE = 1024
+
+
+def _sniff_charset(content: bytes) -> Optional[str]:
+    """HTML 앞부분의 <meta> charset 선언을 읽어 반환합니다. 없거나 알 수 없는 인코딩이면 None"""
+    match = _META_CHARSET_RE.search(content, 0, _CHARSET_SCAN_SIZE)
+    if not match:
+        return None
+    encoding = match.group(1).decode('ascii')
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        return None
+    return encoding
+
+
+class _HostRateLimiter:
+    """호스트별 토큰 버킷 요청 간격 제한기 (스레드 간 공유)"""
+    
+    def __init__(self, interval: float, capacity: int = 2):
+        """
+        Args:
+            interval: 같은 호스트에 대한 평균 요청 간격(초)
+            capacity: 쉬지 않고 보낼 수 있는 최대 요청 수
+        """
+        self.interval = interval
+        self.capacity = capacity
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # 호스트 -> (남은 토큰, 마지막 갱신 시각)
+        self._lock = threading.Lock()
+    
+    def acquire(self, host: str) -> None:
+        """토큰이 없으면 마지막 요청 이후 부족한 시간만큼만 대기"""
+        if self.interval <= 0:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(host, (self.capacity, now))
+            # 경과 시간만큼 토큰을 채우고 하나를 예약 (부족하면 음수로 남겨 다음 요청이 이어서 대기)
+            tokens = min(self.capacity, tokens + (now - last) / self.interval) - 1
+            self._buckets[host] = (tokens, now)
+        
+        if tokens < 0:
+            time.sleep(-tokens * self.interval)
@@ -6,7 +6,18 @@ OpenAI API를 사용한 감정 분석도 지원
 import os
 import re
 import json
-from typing import Dict, Optional
+import logging
+import asyncio
+import hashlib
+import traceback
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
 try:
     from PIL import Image, ImageDraw, ImageFont
     PIL_AVAILABLE = True
@@ -18,53 +29,377 @@ try:
     from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
     import torch
     import torch.nn.functional as F
+    import numpy as np
     TRANSFORMERS_AVAILABLE = True
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
     print("경고: transformers가 설치되지 않았습니다. pip install transformers를 실행하세요.")
 
 try:
-    from openai import OpenAI
+    # 선택 사항: CPU에서 ONNX Runtime INT8 모델 사용 (pip install optimum[onnxruntime])
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    ORT_AVAILABLE = True
+except ImportError:
+    ORT_AVAILABLE = False
+
+try:
+    from openai import OpenAI, AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     print("경고: openai가 설치되지 않았습니다. pip install openai를 실행하세요.")
 
-# GPU 사용 가능 여부 확인
+# GPU 사용 가능 여부 (모듈 로드 시 한 번만 확인)
+_IS_CUDA = TRANSFORMERS_AVAILABLE and torch.cuda.is_available()
+_DEVICE_NAME = torch.cuda.get_device_name(0) if _IS_CUDA else "cpu"
+
+
 def get_device():
     """사용 가능한 디바이스를 반환합니다 (GPU 우선)"""
-    try:
-        import torch
-        if torch.cuda.is_available():
-            print(f"GPU 사용 가능: {torch.cuda.get_device_name(0)}")
-            return 0  # GPU 사용
-        else:
-            print("GPU를 사용할 수 없습니다. CPU를 사용합니다.")
-            return -1  # CPU 사용
-    except ImportError:
-        print("PyTorch가 설치되지 않았습니다. CPU를 사용합니다.")
-        return -1  # CPU 사용
+    if _IS_CUDA:
+        print(f"GPU 사용 가능: {_DEVICE_NAME}")
+        return 0  # GPU 사용
+    print("GPU를 사용할 수 없습니다. CPU를 사용합니다.")
+    return -1  # CPU 사용
+
+
+# 감정 레이블과 결과 이미지 경로 (모듈 상수로 한 번만 만들어 모든 결과가 같은 문자열 객체를 공유)
+_LABEL_NEG, _LABEL_NEU, _LABEL_POS = '부정적', '보통', '긍정적'
+_IMAGE_NEG, _IMAGE_NEU, _IMAGE_POS = 'static/1.png', 'static/2.png', 'static/3.png'
+
+
+class _KeywordCounter:
+    """
+    키워드 목록 중 텍스트에 포함된 키워드 수를 셉니다 (키워드마다 최대 1회, 목록의 중복 항목은 각각 계산).
+    
+    키워드 수만큼 부분 문자열 검색을 반복하는 대신 하나의 정규식으로 텍스트를 한 번 훑습니다.
+    다른 키워드의 매칭에 가려질 수 있는 키워드(다른 키워드의 일부이거나 앞뒤로 겹치는 키워드)만
+    따로 확인하므로 결과는 키워드별 `keyword in text`와 같습니다.
+    """
+    
+    def __init__(self, keywords):
+        self.keywords = tuple(keywords)
+        unique = sorted(set(self.keywords), key=len, reverse=True)
+        self._regex = re.compile('|'.join(map(re.escape, unique)))
+        self._shadowed = tuple(
+            keyword for keyword in unique
+            if any(
+                keyword in other or any(other.endswith(keyword[:i]) for i in range(1, len(keyword)))
+                for other in unique if other != keyword
+            )
+        )
+    
+    def count(self, text: str) -> int:
+        found = set(self._regex.findall(text))
+        found.update(keyword for keyword in self._shadowed if keyword not in found and keyword in text)
+        return sum(1 for keyword in self.keywords if keyword in found)
+
+
+# 파인튜닝된 모델의 클래스 -> 라벨
+_LABEL_MAP = {0: _LABEL_NEG, 1: _LABEL_NEU, 2: _LABEL_POS}
+
+# 점수 구간 인덱스(0: 부정, 1: 보통, 2: 긍정) -> (감정 레이블, 이미지 경로)
+_LABELS = (
+    (_LABEL_NEG, _IMAGE_NEG),
+    (_LABEL_NEU, _IMAGE_NEU),
+    (_LABEL_POS, _IMAGE_POS),
+)
+
+# 감정 레이블 -> 이미지 경로
+_SENTIMENT_IMAGES = dict(_LABELS)
+
+
+def _score_index(score: float, high: float = 0.7, low: float = 0.3) -> int:
+    """점수를 _LABELS 인덱스로 변환합니다 (high 이상: 2, low 이하: 0, 그 외: 1)."""
+    return (score >= high) - (score <= low) + 1
+
+
+def _score_to_temperature(score: float) -> int:
+    """점수(0.0~1.0)를 온도(0~100도)로 변환합니다."""
+    return min(100, max(0, int(score * 100)))
+
+# 기본 모델(pipeline) 출력 라벨 판별용 키워드 (모델별 라벨 형식 대응)
+_POSITIVE_LABEL_KEYWORDS = ('positive', '긍정', '5 star', '5star', '4 star', '4star')
+_NEGATIVE_LABEL_KEYWORDS = ('negative', '부정', '1 star', '1star', '2 star', '2star')
+_NEUTRAL_LABEL_KEYWORDS = ('neutral', '보통', '3 star', '3star', '중립')
+
+# 뉴스 긍정 키워드 (파인튜닝된 모델 보정용)
+_POSITIVE_KEYWORDS = (
+    '완승', '성공', '승리', '발전', '성장', '증가', '개선', '혁신', '확대', '상승',
+    '향상', '도약', '기대', '긍정', '호재', '호조', '확장', '투자', '협력',
+    '파트너십', '기술', '개발', '출시', '수상', '인정', '평가', '우수', '최고',
+    '1위', '선두', '돌파', '기록', '최대', '최고치', '상승세', '호전', '개선세'
+)
+
+# 뉴스 일반 부정 키워드 (파인튜닝된 모델 보정용)
+_NEGATIVE_KEYWORDS = (
+    '감소', '하락', '위기', '문제', '사고', '부정', '부실', '실패', '폐쇄',
+    '도산', '파산', '손실', '적자', '축소', '감원', '해고', '실업', '불안',
+    '우려', '경고', '위험', '부상', '피해', '비리', '의혹', '논란',
+    '조롱', '비난', '하락세', '악화', '쇠퇴', '후퇴', '실적부진', '부진'
+)
+
+# 뉴스 긍정 키워드 (기본 모델 보정용: 발전, 성장, 증가, 개선, 혁신, 성공, 확대 등)
+_BASE_POSITIVE_KEYWORDS = (
+    '발전', '성장', '증가', '개선', '혁신', '성공', '확대', '상승',
+    '향상', '도약', '기대', '긍정', '호재', '호조', '확대', '확장',
+    '투자', '협력', '파트너십', '기술', '혁신', '개발', '출시',
+    '수상', '인정', '평가', '우수', '최고', '1위', '선두'
+)
+
+# 뉴스 부정 키워드 (기본 모델 보정용: 감소, 하락, 위기, 문제, 사고, 부정, 부실 등)
+_BASE_NEGATIVE_KEYWORDS = (
+    '감소', '하락', '위기', '문제', '사고', '부정', '부실', '실패',
+    '폐쇄', '도산', '파산', '손실', '적자', '감소', '축소', '감원',
+    '해고', '실업', '불안', '우려', '경고', '위험', '사고', '사망',
+    '부상', '피해', '손실', '비리', '부정', '비리', '의혹', '논란','조롱', '비난'
+)
+
+# 강한 부정 키워드 (사망, 사고 등) - 모델 출력과 관계없이 강제 부정 분류
+_STRONG_NEGATIVE_KEYWORDS = (
+    '숨지', '사망', '사고로', '사고로 인해', '사고로 사망', '방치', '유기',
+    '살인', '폭행', '강도', '강간', '성폭행', '학대', '폭력', '테러',
+    '폭발', '화재', '붕괴', '추락', '충돌', '교통사고', '교통사고로',
+    '사고로 숨지', '사고로 사망', '사고로 부상', '사고로 다쳐',
+    '비극', '참사', '재난', '재해', '피해자', '희생자', '부상자'
+)
+
+_POSITIVE_KEYWORD_COUNTER = _KeywordCounter(_POSITIVE_KEYWORDS)
+_NEGATIVE_KEYWORD_COUNTER = _KeywordCounter(_NEGATIVE_KEYWORDS)
+_STRONG_NEGATIVE_KEYWORD_COUNTER = _KeywordCounter(_STRONG_NEGATIVE_KEYWORDS)
+_BASE_POSITIVE_KEYWORD_COUNTER = _KeywordCounter(_BASE_POSITIVE_KEYWORDS)
+_BASE_NEGATIVE_KEYWORD_COUNTER = _KeywordCounter(_BASE_NEGATIVE_KEYWORDS)
+
+# 부정적인 문맥 패턴 (직접적인 부정 단어 없이도 부정적 의미를 나타내는 패턴)
+# 호출마다 re 캐시를 조회하지 않도록 모듈 로드 시 한 번만 컴파일 (원본 패턴 문자열은 로그 출력용)
+_NEGATIVE_PATTERNS = tuple(
+    (pattern, re.compile(pattern)) for pattern in (
+        # 강한 부정 패턴 (사망, 사고 관련)
+        r'숨지',  # "숨졌다", "숨져"
+        r'사망\s*했다',  # "사망했다"
+        r'방치',  # "방치했다", "방치"
+        r'유기',  # "유기했다"
+        r'차에\s*방치',  # "차에 방치"
+        r'차량에\s*방치',  # "차량에 방치"
+        r'차에\s*남겨',  # "차에 남겨둔다"
+        r'차량에\s*남겨',  # "차량에 남겨둔다"
+        r'사고로\s*숨지',  # "사고로 숨졌다"
+        r'사고로\s*사망',  # "사고로 사망했다"
+        r'사고로\s*인해',  # "사고로 인해"
+        r'교통사고',  # "교통사고"
+        r'교통사고로',  # "교통사고로"
+        # 일반 부정 패턴
+        r'하지\s*못',  # "하지 못했다", "하지 못함"
+        r'못\s*했다',  # "못했다", "못함"
+        r'실패\s*했다',  # "실패했다"
+        r'보다\s*낮',  # "보다 낮다", "보다 낮음"
+        r'보다\s*못',  # "보다 못하다"
+        r'못\s*미친',  # "못 미친다", "못 미침"
+        r'에\s*못\s*미친',  # "에 못 미친다"
+        r'에\s*실패',  # "에 실패했다"
+        r'하지\s*않',  # "하지 않았다" (부정적 맥락에서)
+        r'없\s*었다',  # "없었다"
+        r'없\s*었음',  # "없었음"
+        r'없\s*어',  # "없어"
+        r'부족',  # "부족하다"
+        r'부족\s*했다',  # "부족했다"
+        r'미달',  # "미달했다"
+        r'미달\s*했다',  # "미달했다"
+        r'기대\s*에\s*못\s*미친',  # "기대에 못 미쳤다"
+        r'기대\s*이하',  # "기대 이하"
+        r'예상\s*보다\s*낮',  # "예상보다 낮다"
+        r'예상\s*보다\s*못',  # "예상보다 못하다"
+        r'전년\s*대비\s*감소',  # "전년 대비 감소"
+        r'전년\s*대비\s*하락',  # "전년 대비 하락"
+        r'전년\s*대비\s*줄어',  # "전년 대비 줄어"
+        r'전년\s*대비\s*떨어',  # "전년 대비 떨어졌다"
+        r'전분기\s*대비\s*감소',  # "전분기 대비 감소"
+        r'전분기\s*대비\s*하락',  # "전분기 대비 하락"
+        r'목표\s*에\s*못\s*미친',  # "목표에 못 미쳤다"
+        r'목표\s*이하',  # "목표 이하"
+        r'목표\s*미달',  # "목표 미달"
+        r'기록\s*보다\s*낮',  # "기록보다 낮다"
+        r'기록\s*보다\s*못',  # "기록보다 못하다"
+        r'이전\s*보다\s*나빠',  # "이전보다 나빠졌다"
+        r'이전\s*보다\s*떨어',  # "이전보다 떨어졌다"
+        r'이전\s*보다\s*줄어',  # "이전보다 줄어들었다"
+        r'에도\s*불구하고',  # "~에도 불구하고" (부정적 맥락)
+        r'임에도\s*불구',  # "~임에도 불구하고"
+        r'그럼에도\s*불구',  # "그럼에도 불구하고"
+        r'그러나',  # "그러나" (대조/부정적 맥락)
+        r'하지만',  # "하지만" (대조/부정적 맥락)
+        r'다만',  # "다만" (제한/부정적 맥락)
+        r'아쉽게도',  # "아쉽게도"
+        r'안타깝게도',  # "안타깝게도"
+        r'유감스럽게도',  # "유감스럽게도"
+        r'아쉽',  # "아쉽다"
+        r'안타깝',  # "안타깝다"
+        r'유감',  # "유감이다"
+        r'우려\s*된다',  # "우려된다"
+        r'우려\s*가',  # "우려가 있다"
+        r'걱정\s*된다',  # "걱정된다"
+        r'걱정\s*이',  # "걱정이 있다"
+        r'불안\s*하다',  # "불안하다"
+        r'불안\s*감',  # "불안감"
+        r'위험\s*하다',  # "위험하다"
+        r'위험\s*이',  # "위험이 있다"
+        r'문제\s*가\s*있다',  # "문제가 있다"
+        r'문제\s*가\s*발생',  # "문제가 발생했다"
+        r'문제\s*가\s*나타나',  # "문제가 나타났다"
+        r'어려움',  # "어려움이 있다"
+        r'어려움\s*을\s*겪',  # "어려움을 겪고 있다"
+        r'난관',  # "난관에 봉착했다"
+        r'난관\s*에',  # "난관에"
+        r'장애',  # "장애가 있다"
+        r'장애\s*물',  # "장애물"
+        r'제약',  # "제약이 있다"
+        r'제약\s*이',  # "제약이"
+        r'한계',  # "한계가 있다"
+        r'한계\s*를',  # "한계를 보인다"
+        r'부족\s*하다',  # "부족하다"
+        r'부족\s*한',  # "부족한"
+        r'부족\s*함',  # "부족함"
+        r'미흡',  # "미흡하다"
+        r'미흡\s*하다',  # "미흡하다"
+        r'미흡\s*한',  # "미흡한"
+        r'아쉬움',  # "아쉬움이 있다"
+        r'아쉬움\s*을',  # "아쉬움을 남겼다"
+        r'아쉬운',  # "아쉬운 점"
+        r'아쉬운\s*점',  # "아쉬운 점"
+        r'아쉬운\s*부분',  # "아쉬운 부분"
+    )
+)
+
+
+# 같은 기사를 다시 분석할 때 재사용할 결과 캐시 크기
+_RESULT_CACHE_SIZE = 4096
+
+# 파인튜닝된 모델 경로 (우선순위 순: 증류한 소형 모델이 있으면 먼저 사용)
+_FINETUNED_MODEL_PATHS = ("./sentiment_model_small", "./sentiment_model")
+
+# export_onnx_int8()로 생성한 ONNX Runtime INT8 모델 경로
+_ONNX_MODEL_PATH = "./sentiment_model_onnx_int8"
+_ONNX_MODEL_FILE = "model_quantized.onnx"
+
+# 로컬 모델 입력 최대 토큰 수 (글자 수로 자르지 않고 토크나이저가 자름)
+_MAX_SEQ_LENGTH = 512
+
+# 키워드/문맥 패턴 보정에 사용할 본문 범위 (긴 본문은 앞부분 + 뒷부분만 사용, 점수 기준이 이 범위에 맞춰져 있음)
+_KEYWORD_WINDOW_MAX_CHARS = 2000
+_KEYWORD_HEAD_CHARS = 1500
+_KEYWORD_TAIL_CHARS = 500
+
+# OpenAI API에 보낼 본문 최대 길이 (자)
+_OPENAI_MAX_CHARS = 6000
+
+# 여러 기사를 분석할 때 OpenAI API 동시 요청 수 (요청 한도 고려)
+_OPENAI_CONCURRENCY = 10
+
+_OPENAI_SYSTEM_PROMPT = """당신은 뉴스 기사 감정 분석 전문가입니다. 주어진 뉴스 기사를 분석하여 감정을 평가해주세요.
+
+다음 형식으로 JSON 응답을 해주세요:
+{
+    "label": "긍정적" 또는 "보통" 또는 "부정적",
+    "score": 0.0부터 1.0까지의 숫자 (0.0: 매우 부정적, 0.5: 중립적, 1.0: 매우 긍정적)
+}
+
+감정 판단 기준:
+- 긍정적: 성장, 발전, 성공, 개선, 혁신, 투자, 협력, 수상, 인정, 긍정적인 전망 등
+- 부정적: 감소, 하락, 위기, 문제, 사고, 실패, 손실, 우려, 경고, 부정적인 전망 등
+- 보통: 사실 전달 위주, 중립적인 내용, 명확한 감정이 없는 경우
+
+점수 기준:
+- 0.0~0.3: 부정적
+- 0.4~0.6: 보통
+- 0.7~1.0: 긍정적
+
+반드시 유효한 JSON 형식으로만 응답해주세요."""
+
+
+def _keyword_window(text: str) -> str:
+    """키워드 보정에 사용할 본문 범위를 소문자로 반환합니다 (앞부분: 주요 내용, 뒷부분: 결론/요약)."""
+    if len(text) > _KEYWORD_WINDOW_MAX_CHARS:
+        text = text[:_KEYWORD_HEAD_CHARS] + " " + text[-_KEYWORD_TAIL_CHARS:]
+    return text.lower()
+
+
+def _text_hash(text: str) -> str:
+    """캐시 키로 사용할 텍스트 해시를 반환합니다."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class _LRUCache:
+    """스레드 안전한 간단한 LRU 캐시"""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+@dataclass(slots=True)
+class SentimentResult:
+    """감정 분석 결과 (JSON 응답에는 dataclasses.asdict()로 변환해 사용)"""
+    label: str  # '부정적' | '보통' | '긍정적'
+    score: float  # 0.0 ~ 1.0
+    temperature: int  # 0 ~ 100도
+    image_path: str  # 이미지 파일 경로
 
 
 class SentimentAnalyzer:
     """한글 감정 분석 클래스"""
     
-    def __init__(self, openai_api_key: Optional[str] = None, use_openai: bool = False):
+    def __init__(
+        self,
+        openai_api_key: Optional[str] = None,
+        use_openai: bool = False,
+        quantize_cpu: bool = True,
+        compile_gpu: bool = True
+    ):
         """
-        감정 분석 파이프라인 초기화
+        감정 분석 파이프라인 초기화 (로컬 모델은 첫 분석 시 로드)
         
         Args:
             openai_api_key: OpenAI API 키 (OpenAI API 사용 시 필요)
             use_openai: OpenAI API 사용 여부 (True면 OpenAI API 사용, False면 로컬 모델 사용)
+            quantize_cpu: CPU에서 파인튜닝된 모델의 Linear 층을 INT8 동적 양자화할지 여부
+            compile_gpu: GPU에서 파인튜닝된 모델을 torch.compile(mode="reduce-overhead")로 컴파일할지 여부
         """
         self.classifier = None
         self.model = None
         self.tokenizer = None
         self.use_finetuned_model = False
         self.device = None
+        # torch.compile된 모델은 입력 길이를 고정해 형태가 바뀔 때마다 재컴파일되지 않도록 함
+        self._pad_to_max_length = False
         self.openai_api_key = openai_api_key
         self.use_openai = use_openai
         self.openai_client = None
+        # 로컬 모델은 생성 시가 아니라 처음 분석할 때 로드 (_ensure_local_model)
+        self._quantize_cpu = quantize_cpu
+        self._compile_gpu = compile_gpu
+        self._local_model_loaded = False
+        self._load_lock = threading.Lock()
+        # CUDA graph(torch.compile)는 고정 버퍼를 재사용하므로 여러 스레드에서 동시에 실행하지 않도록 보호
+        self._forward_lock = threading.Lock()
+        # 텍스트 해시 -> 분석 결과 (OpenAI 응답 / 모델 클래스 확률)
+        self._openai_cache = _LRUCache(_RESULT_CACHE_SIZE)
+        self._probability_cache = _LRUCache(_RESULT_CACHE_SIZE)
         
         # OpenAI 클라이언트 초기화
         if use_openai and openai_api_key and OPENAI_AVAILABLE:
@@ -77,96 +412,142 @@ class SentimentAnalyzer:
         elif use_openai and not OPENAI_AVAILABLE:
             print("경고: openai 패키지가 설치되지 않았습니다. 로컬 모델을 사용합니다.")
             self.use_openai = False
+    
+    def preload(self):
+        """로컬 모델을 미리 로드합니다 (서버 시작 시 호출하면 첫 분석 요청의 모델 로드 지연을 없앰)."""
+        self._ensure_local_model()
+    
+    def _ensure_local_model(self):
+        """로컬 모델을 처음 필요할 때 한 번만 로드합니다 (여러 스레드에서 호출해도 한 번만 로드)."""
+        if self._local_model_loaded:
+            return
+        with self._load_lock:
+            if not self._local_model_loaded:
+                self._load_local_model()
+                self._local_model_loaded = True
+    
+    def _load_local_model(self):
+        """로컬 감정 분석 모델을 로드합니다 (ONNX INT8 -> 파인튜닝된 모델 -> pipeline 순)."""
+        if not TRANSFORMERS_AVAILABLE:
+            return
+        
+        # GPU 사용 가능 여부 확인
+        device_id = get_device()
+        self.device = "cuda" if device_id >= 0 else "cpu"
+        if device_id >= 0:
+            # 입력 크기별로 가장 빠른 cuDNN 커널을 골라 재사용
+            torch.backends.cudnn.benchmark = True
+        
+        # CPU에서는 ONNX Runtime INT8 모델이 있으면 우선 사용 (그래프 최적화 + INT8 연산)
+        if device_id < 0 and ORT_AVAILABLE and os.path.isdir(_ONNX_MODEL_PATH):
+            try:
+                print("ONNX Runtime INT8 감정 분석 모델 로드 시도 중...")
+                self.tokenizer = self._load_tokenizer(_ONNX_MODEL_PATH)
+                self.model = ORTModelForSequenceClassification.from_pretrained(
+                    _ONNX_MODEL_PATH,
+                    file_name=_ONNX_MODEL_FILE
+                )
+                self.use_finetuned_model = True
+                print("✅ ONNX Runtime INT8 모델 로드 완료 (CPU 사용 중)")
+            except Exception as e:
+                print(f"❌ ONNX Runtime 모델 로드 실패, PyTorch 모델 사용: {e}")
+                self.model = None
+                self.tokenizer = None
+        
+        # 파인튜닝된 모델이 있으면 우선 사용
+        model_path = next((path for path in _FINETUNED_MODEL_PATHS if os.path.isdir(path)), None)
+        if not self.use_finetuned_model and model_path:
+            try:
+                print(f"파인튜닝된 뉴스 감정 분석 모델 로드 시도 중... ({model_path})")
+                print(f"디바이스: {'GPU (CUDA)' if device_id >= 0 else 'CPU'}")
+                
+                # 모델과 토크나이저 직접 로드
+                self.tokenizer = self._load_tokenizer(model_path)
+                # GPU에서는 반정밀도(BF16 지원 시 BF16, 아니면 FP16)로 로드해 메모리와 추론 시간 절약
+                if device_id >= 0:
+                    model_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                else:
+                    model_dtype = torch.float32
+                self.model = AutoModelForSequenceClassification.from_pretrained(
+                    model_path,
+                    torch_dtype=model_dtype
+                )
+                
+                # GPU로 이동
+                if device_id >= 0:
+                    self.model = self.model.to(self.device)
+                    print(f"✅ 파인튜닝된 모델 로드 완료 (GPU: {_DEVICE_NAME} 사용 중)")
+                else:
+                    print("✅ 파인튜닝된 모델 로드 완료 (CPU 사용 중)")
+                    if self._quantize_cpu:
+                        # CPU에서는 Linear 층을 INT8로 동적 양자화 (가중치 크기 약 1/4, 추론 속도 향상)
+                        # 양자화 scale/zero_point는 양자화된 모듈에 포함되므로 state_dict로 저장/로드 가능
+                        try:
+                            self.model = torch.quantization.quantize_dynamic(
+                                self.model, {torch.nn.Linear}, dtype=torch.qint8
+                            )
+                            print("✅ INT8 동적 양자화 적용 완료")
+                        except Exception as e:
+                            print(f"⚠️ INT8 동적 양자화 실패, FP32 모델 사용: {e}")
+                
+                self.model.eval()  # 평가 모드로 설정
+                self.use_finetuned_model = True
+                
+                if device_id >= 0 and self._compile_gpu and hasattr(torch, "compile"):
+                    self._compile_model()
+                
+            except Exception as e:
+                print(f"❌ 파인튜닝된 모델 로드 실패: {e}")
+                traceback.print_exc()
+                self.model = None
+                self.tokenizer = None
         
-        if TRANSFORMERS_AVAILABLE:
-            # GPU 사용 가능 여부 확인
-            device_id = get_device()
-            self.device = "cuda" if device_id >= 0 else "cpu"
+        # 파인튜닝된 모델이 없거나 실패한 경우 pipeline 사용
+        if not self.use_finetuned_model:
+            # 한글 감정 분석 모델 시도 (우선순위 순)
+            models_to_try = [
+                ("matthewburke/korean_sentiment", "한국어 감정 분석 모델"),
+                ("nlptown/bert-base-multilingual-uncased-sentiment", "다국어 감정 분석 모델"),
+            ]
             
-            # 파인튜닝된 모델이 있으면 우선 사용
-            if os.path.exists("./sentiment_model") and os.path.isdir("./sentiment_model"):
+            for model_name, model_desc in models_to_try:
                 try:
-                    print("파인튜닝된 뉴스 감정 분석 모델 로드 시도 중...")
+                    print(f"{model_desc} 로드 시도 중... ({model_name})")
                     print(f"디바이스: {'GPU (CUDA)' if device_id >= 0 else 'CPU'}")
-                    
-                    # 모델과 토크나이저 직접 로드
-                    self.tokenizer = AutoTokenizer.from_pretrained("./sentiment_model")
-                    self.model = AutoModelForSequenceClassification.from_pretrained("./sentiment_model")
-                    
-                    # GPU로 이동
+                    self.classifier = pipeline(
+                        "sentiment-analysis",
+                        model=model_name,
+                        device=device_id,
+                        torch_dtype="auto" if device_id >= 0 else None
+                    )
+                    # GPU 사용 확인
                     if device_id >= 0:
-                        self.model = self.model.to(self.device)
-                        if torch.cuda.is_available():
-                            print(f"✅ 파인튜닝된 모델 로드 완료 (GPU: {torch.cuda.get_device_name(0)} 사용 중)")
-                        else:
-                            print("✅ 파인튜닝된 모델 로드 완료 (CPU 사용 중)")
+                        print(f"✅ {model_desc} 로드 완료 (GPU: {_DEVICE_NAME} 사용 중)")
                     else:
-                        print("✅ 파인튜닝된 모델 로드 완료 (CPU 사용 중)")
-                    
-                    self.model.eval()  # 평가 모드로 설정
-                    self.use_finetuned_model = True
-                    
+                        print(f"✅ {model_desc} 로드 완료 (CPU 사용 중)")
+                    break
                 except Exception as e:
-                    print(f"❌ 파인튜닝된 모델 로드 실패: {e}")
-                    import traceback
+                    print(f"❌ {model_desc} 로드 실패: {e}")
                     traceback.print_exc()
-                    self.model = None
-                    self.tokenizer = None
+                    continue
             
-            # 파인튜닝된 모델이 없거나 실패한 경우 pipeline 사용
-            if not self.use_finetuned_model:
-                # 한글 감정 분석 모델 시도 (우선순위 순)
-                models_to_try = [
-                    ("matthewburke/korean_sentiment", "한국어 감정 분석 모델"),
-                    ("nlptown/bert-base-multilingual-uncased-sentiment", "다국어 감정 분석 모델"),
-                ]
-                
-                for model_name, model_desc in models_to_try:
-                    try:
-                        print(f"{model_desc} 로드 시도 중... ({model_name})")
-                        print(f"디바이스: {'GPU (CUDA)' if device_id >= 0 else 'CPU'}")
-                        self.classifier = pipeline(
-                            "sentiment-analysis",
-                            model=model_name,
-                            device=device_id,
-                            torch_dtype="auto" if device_id >= 0 else None
-                        )
-                        # GPU 사용 확인
-                        if device_id >= 0:
-                            if torch.cuda.is_available():
-                                print(f"✅ {model_desc} 로드 완료 (GPU: {torch.cuda.get_device_name(0)} 사용 중)")
-                            else:
-                                print(f"✅ {model_desc} 로드 완료 (CPU 사용 중)")
-                        else:
-                            print(f"✅ {model_desc} 로드 완료 (CPU 사용 중)")
-                        break
-                    except Exception as e:
-                        print(f"❌ {model_desc} 로드 실패: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        continue
-                
-                # 모든 모델 실패 시 기본 모델 시도
-                if self.classifier is None:
-                    try:
-                        print("기본 감정 분석 모델 로드 시도 중...")
-                        print(f"디바이스: {'GPU (CUDA)' if device_id >= 0 else 'CPU'}")
-                        self.classifier = pipeline(
-                            "sentiment-analysis", 
-                            device=device_id,
-                            torch_dtype="auto" if device_id >= 0 else None
-                        )
-                        if device_id >= 0:
-                            if torch.cuda.is_available():
-                                print(f"기본 감정 분석 모델 로드 완료 (GPU: {torch.cuda.get_device_name(0)} 사용 중)")
-                            else:
-                                print("기본 감정 분석 모델 로드 완료 (CPU 사용 중)")
-                        else:
-                            print("기본 감정 분석 모델 로드 완료 (CPU 사용 중)")
-                    except Exception as e2:
-                        print(f"기본 모델 로드도 실패: {e2}")
-                        import traceback
-                        traceback.print_exc()
+            # 모든 모델 실패 시 기본 모델 시도
+            if self.classifier is None:
+                try:
+                    print("기본 감정 분석 모델 로드 시도 중...")
+                    print(f"디바이스: {'GPU (CUDA)' if device_id >= 0 else 'CPU'}")
+                    self.classifier = pipeline(
+                        "sentiment-analysis", 
+                        device=device_id,
+                        torch_dtype="auto" if device_id >= 0 else None
+                    )
+                    if device_id >= 0:
+                        print(f"기본 감정 분석 모델 로드 완료 (GPU: {_DEVICE_NAME} 사용 중)")
+                    else:
+                        print("기본 감정 분석 모델 로드 완료 (CPU 사용 중)")
+                except Exception as e2:
+                    print(f"기본 모델 로드도 실패: {e2}")
+                    traceback.print_exc()
     
     def _analyze_with_openai(self, text: str) -> Dict:
         """
@@ -184,94 +565,458 @@ class SentimentAnalyzer:
         if not self.openai_client:
             raise ValueError("OpenAI 클라이언트가 초기화되지 않았습니다.")
         
-        # 텍스트가 너무 길면 앞부분과 뒷부분을 결합하여 사용
-        if len(text) > 3000:
-            text_for_analysis = text[:2000] + " " + text[-1000:]
-            print(f"[OpenAI 감정 분석] 긴 텍스트 감지: {len(text)}자 -> {len(text_for_analysis)}자로 축약")
-        else:
-            text_for_analysis = text
+        text_for_analysis = self._openai_text(text)
+        
+        # 같은 텍스트는 API를 다시 호출하지 않고 캐시된 결과 사용
+        cache_key = _text_hash(text_for_analysis)
+        cached = self._openai_cache.get(cache_key)
+        if cached is not None:
+            print(f"[OpenAI 감정 분석] 캐시 사용 - 라벨: {cached['label']}, 점수: {cached['score']:.3f}")
+            return dict(cached)
         
+        result_text = None
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",  # 비용 효율적인 모델 사용
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """당신은 뉴스 기사 감정 분석 전문가입니다. 주어진 뉴스 기사를 분석하여 감정을 평가해주세요.
-
-다음 형식으로 JSON 응답을 해주세요:
-{
-    "label": "긍정적" 또는 "보통" 또는 "부정적",
-    "score": 0.0부터 1.0까지의 숫자 (0.0: 매우 부정적, 0.5: 중립적, 1.0: 매우 긍정적)
-}
-
-감정 판단 기준:
-- 긍정적: 성장, 발전, 성공, 개선, 혁신, 투자, 협력, 수상, 인정, 긍정적인 전망 등
-- 부정적: 감소, 하락, 위기, 문제, 사고, 실패, 손실, 우려, 경고, 부정적인 전망 등
-- 보통: 사실 전달 위주, 중립적인 내용, 명확한 감정이 없는 경우
-
-점수 기준:
-- 0.0~0.3: 부정적
-- 0.4~0.6: 보통
-- 0.7~1.0: 긍정적
-
-반드시 유효한 JSON 형식으로만 응답해주세요."""
-                    },
-                    {
-                        "role": "user",
-                        "content": f"다음 뉴스 기사를 분석하여 감정을 평가해주세요:\n\n{text_for_analysis}"
-                    }
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.3,
-                max_tokens=200
-            )
-            
+            response = self.openai_client.chat.completions.create(**self._openai_request(text_for_analysis))
             result_text = response.choices[0].message.content.strip()
-            result_json = json.loads(result_text)
-            
-            label = result_json.get('label', '보통')
-            score = float(result_json.get('score', 0.5))
-            
-            # 점수 범위 제한
-            score = max(0.0, min(1.0, score))
-            
-            # 라벨 정규화
-            if label not in ['긍정적', '보통', '부정적']:
-                # 라벨을 점수 기반으로 변환
-                if score >= 0.7:
-                    label = '긍정적'
-                elif score <= 0.3:
-                    label = '부정적'
-                else:
-                    label = '보통'
-            
-            print(f"[OpenAI 감정 분석] 라벨: {label}, 점수: {score:.3f}")
+            return self._parse_openai_response(result_text, cache_key)
             
+        except json.JSONDecodeError as e:
+            print(f"OpenAI API 응답 JSON 파싱 오류: {e}")
+            print(f"응답 내용: {result_text}")
+            # 기본값 반환
             return {
-                'label': label,
-                'score': score
+                'label': _LABEL_NEU,
+                'score': 0.5
             }
+        except Exception as e:
+            print(f"OpenAI API 감정 분석 오류: {e}")
+            traceback.print_exc()
+            # 기본값 반환
+            return {
+                'label': _LABEL_NEU,
+                'score': 0.5
+            }
+    
+    async def _analyze_with_openai_async(self, client: 'AsyncOpenAI', semaphore: asyncio.Semaphore, text: str) -> Dict:
+        """_analyze_with_openai의 비동기 버전 (동시 요청 수는 semaphore로 제한)"""
+        text_for_analysis = self._openai_text(text)
+        
+        cache_key = _text_hash(text_for_analysis)
+        cached = self._openai_cache.get(cache_key)
+        if cached is not None:
+            print(f"[OpenAI 감정 분석] 캐시 사용 - 라벨: {cached['label']}, 점수: {cached['score']:.3f}")
+            return dict(cached)
+        
+        result_text = None
+        try:
+            async with semaphore:
+                response = await client.chat.completions.create(**self._openai_request(text_for_analysis))
+            result_text = response.choices[0].message.content.strip()
+            return self._parse_openai_response(result_text, cache_key)
             
         except json.JSONDecodeError as e:
             print(f"OpenAI API 응답 JSON 파싱 오류: {e}")
             print(f"응답 내용: {result_text}")
-            # 기본값 반환
             return {
-                'label': '보통',
+                'label': _LABEL_NEU,
                 'score': 0.5
             }
         except Exception as e:
             print(f"OpenAI API 감정 분석 오류: {e}")
-            import traceback
             traceback.print_exc()
-            # 기본값 반환
             return {
-                'label': '보통',
+                'label': _LABEL_NEU,
                 'score': 0.5
             }
     
-    def analyze(self, text: str, article_id: Optional[int] = None) -> Dict:
+    async def _analyze_many_with_openai_async(self, texts: List[str]) -> List[Dict]:
+        """여러 텍스트를 OpenAI API에 동시에 요청합니다 (최대 _OPENAI_CONCURRENCY개)."""
+        semaphore = asyncio.Semaphore(_OPENAI_CONCURRENCY)
+        # 비동기 클라이언트는 이벤트 루프에 묶이므로 호출마다 만들고 닫음
+        async with AsyncOpenAI(api_key=self.openai_api_key) as client:
+            return await asyncio.gather(*[
+                self._analyze_with_openai_async(client, semaphore, text) for text in texts
+            ])
+    
+    def _analyze_many_with_openai(self, texts: List[str]) -> List[Dict]:
+        """
+        OpenAI API로 여러 텍스트의 감정을 동시에 분석합니다.
+        요청이 끝날 때까지 블로킹되므로 이벤트 루프 안(async 핸들러)에서는 run_in_threadpool 등으로 호출해야 합니다.
+        
+        Returns:
+            _analyze_with_openai()와 같은 형식의 결과 리스트 (입력 순서 유지)
+        """
+        if not self.openai_client:
+            raise ValueError("OpenAI 클라이언트가 초기화되지 않았습니다.")
+        return asyncio.run(self._analyze_many_with_openai_async(texts))
+    
+    def _openai_text(self, text: str) -> str:
+        """텍스트가 너무 길면 앞부분만 사용 (gpt-4o-mini는 긴 문맥도 처리 가능)"""
+        if len(text) > _OPENAI_MAX_CHARS:
+            text_for_analysis = text[:_OPENAI_MAX_CHARS]
+            print(f"[OpenAI 감정 분석] 긴 텍스트 감지: {len(text)}자 -> {len(text_for_analysis)}자로 축약")
+            return text_for_analysis
+        return text
+    
+    def _openai_request(self, text_for_analysis: str) -> Dict:
+        """chat.completions.create()에 넘길 요청 인자를 만듭니다."""
+        return {
+            'model': "gpt-4o-mini",  # 비용 효율적인 모델 사용
+            'messages': [
+                {
+                    "role": "system",
+                    "content": _OPENAI_SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": f"다음 뉴스 기사를 분석하여 감정을 평가해주세요:\n\n{text_for_analysis}"
+                }
+            ],
+            'response_format': {"type": "json_object"},
+            'temperature': 0.3,
+            'max_tokens': 200
+        }
+    
+    def _parse_openai_response(self, result_text: str, cache_key: str) -> Dict:
+        """OpenAI 응답(JSON)을 라벨/점수로 변환하고 캐시에 저장합니다."""
+        result_json = json.loads(result_text)
+        
+        label = result_json.get('label', _LABEL_NEU)
+        score = float(result_json.get('score', 0.5))
+        
+        # 점수 범위 제한
+        score = max(0.0, min(1.0, score))
+        
+        # 라벨 정규화
+        if label not in [_LABEL_POS, _LABEL_NEU, _LABEL_NEG]:
+            # 라벨을 점수 기반으로 변환
+            label = _LABELS[_score_index(score)][0]
+        
+        print(f"[OpenAI 감정 분석] 라벨: {label}, 점수: {score:.3f}")
+        
+        # 정상 응답만 캐시 (오류 시 기본값은 캐시하지 않음)
+        self._openai_cache.put(cache_key, {'label': label, 'score': score})
+        
+        return {
+            'label': label,
+            'score': score
+        }
+    
+    def _openai_final_result(self, openai_result: Dict) -> SentimentResult:
+        """OpenAI 분석 결과(라벨/점수)에 온도와 이미지 경로를 붙여 최종 결과를 만듭니다."""
+        label = openai_result['label']
+        score = openai_result['score']
+        
+        # 온도 계산: 점수를 0~100도 범위로 변환
+        temperature = _score_to_temperature(score)
+        
+        # 이미지 경로 결정 (static 폴더 사용)
+        image_filename = _SENTIMENT_IMAGES.get(label, _IMAGE_NEU)
+        
+        logger.debug("[감정 분석] 최종 결과: %s, 점수: %.3f, 온도: %d도, 이미지: %s", label, score, temperature, image_filename)
+        
+        return SentimentResult(label, score, temperature, image_filename)
+
+    def _load_tokenizer(self, model_path: str):
+        """Rust 기반 fast 토크나이저를 로드합니다 (slow 토크나이저면 경고)."""
+        tokenizer = AutoTokenizer.from_pretrained(model_path, use_fast=True)
+        if not tokenizer.is_fast:
+            print(f"⚠️ fast 토크나이저를 사용할 수 없어 느린 Python 토크나이저를 사용합니다: {model_path}")
+        return tokenizer
+    
+    def _compile_model(self):
+        """
+        GPU 모델을 torch.compile(mode="reduce-overhead")로 컴파일합니다.
+        (연산 융합 + CUDA graph로 작은 배치의 커널 실행 오버헤드 감소)
+        컴파일은 첫 호출 시 일어나므로 더미 입력으로 미리 실행하고, 실패하면 원래 모델을 사용합니다.
+        """
+        eager_model = self.model
+        try:
+            print("torch.compile로 모델 컴파일 중 (첫 실행은 시간이 걸릴 수 있음)...")
+            self.model = torch.compile(eager_model, mode="reduce-overhead", fullgraph=False, dynamic=False)
+            self._pad_to_max_length = True
+            
+            # 워밍업: 고정 길이(512) 더미 입력으로 컴파일과 CUDA graph 기록을 미리 수행
+            inputs = self.tokenizer(
+                [""],
+                return_tensors="pt",
+                truncation=True,
+                max_length=_MAX_SEQ_LENGTH,
+                padding="max_length"
+            )
+            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+            with torch.inference_mode():
+                self.model(**inputs)
+            print("✅ torch.compile 적용 완료")
+        except Exception as e:
+            print(f"⚠️ torch.compile 실패, 컴파일 없이 사용: {e}")
+            self.model = eager_model
+            self._pad_to_max_length = False
+    
+    def _forward_batch(self, texts: List[str]) -> 'np.ndarray':
+        """
+        파인튜닝된 모델로 여러 텍스트를 한 번의 forward로 추론합니다.
+        이전에 분석한 텍스트는 캐시된 확률을 사용하고 나머지만 추론합니다.
+        
+        Returns:
+            (텍스트 수, 3) 크기의 클래스 확률 배열 (0: 부정, 1: 중립, 2: 긍정)
+        """
+        cache_keys = [_text_hash(text) for text in texts]
+        probabilities = [self._probability_cache.get(key) for key in cache_keys]
+        missing = [i for i, probs in enumerate(probabilities) if probs is None]
+        if not missing:
+            return np.stack(probabilities)
+        
+        # 토크나이징 (배치 안에서 가장 긴 텍스트에 맞춰 패딩, 한 건이면 패딩 불필요)
+        # 컴파일된 모델은 재컴파일을 피하기 위해 최대 길이로 고정
+        if self._pad_to_max_length:
+            padding = "max_length"
+        elif len(missing) > 1:
+            padding = "longest"
+        else:
+            padding = False
+        inputs = self.tokenizer(
+            [texts[i] for i in missing],
+            return_tensors="pt",
+            truncation=True,
+            max_length=_MAX_SEQ_LENGTH,
+            padding=padding
+        )
+        
+        # GPU로 이동 (고정 메모리에서 비동기 복사, 결과는 .cpu()에서 동기화됨)
+        if self.device == "cuda":
+            inputs = {k: v.pin_memory().to(self.device, non_blocking=True) for k, v in inputs.items()}
+        else:
+            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        
+        # 추론
+        with torch.inference_mode():
+            if self._pad_to_max_length:
+                with self._forward_lock:
+                    logits = self.model(**inputs).logits.clone()
+            else:
+                logits = self.model(**inputs).logits
+            # 반정밀도 모델이어도 softmax는 FP32로 계산해 점수 보정 유지
+            batch_probabilities = F.softmax(logits.float(), dim=-1)
+        
+        for i, probs in zip(missing, batch_probabilities.cpu().numpy()):
+            probabilities[i] = probs
+            self._probability_cache.put(cache_keys[i], probs)
+        
+        return np.stack(probabilities)
+    
+    def _strong_negative_result(self, text: str) -> Optional[SentimentResult]:
+        """
+        강한 부정 키워드가 있으면 모델 추론 없이 강제 부정 결과를 반환합니다.
+        (모델 출력과 관계없이 부정으로 분류되므로 forward를 생략)
+        
+        Returns:
+            강한 부정 키워드가 없으면 None
+        """
+        text_lower = _keyword_window(text)
+        strong_negative_count = _STRONG_NEGATIVE_KEYWORD_COUNTER.count(text_lower)
+        if strong_negative_count == 0:
+            return None
+        
+        logger.debug("[감정 분석] 텍스트 길이: %d자", len(text))
+        print(f"[강한 부정 감지] 강한 부정 키워드 {strong_negative_count}개 감지 - 강제 부정 분류")
+        sentiment = _LABEL_NEG
+        image_filename = _IMAGE_NEG
+        # 강한 부정 키워드가 있으면 점수를 매우 낮게 설정 (0.0~0.2)
+        adjusted_score = max(0.0, 0.2 - (strong_negative_count * 0.1))
+        temperature = min(20, _score_to_temperature(adjusted_score))  # 강한 부정은 최대 20도
+        logger.debug("[감정 분석] 최종 결과: %s, 점수: %.3f, 온도: %d도, 이미지: %s", sentiment, adjusted_score, temperature, image_filename)
+        return SentimentResult(sentiment, adjusted_score, temperature, image_filename)
+    
+    def _finetuned_results(self, texts: List[str], probabilities: 'np.ndarray') -> List[SentimentResult]:
+        """
+        여러 텍스트의 클래스 확률에서 예측 클래스와 점수를 한 번에(벡터 연산으로) 계산한 뒤
+        텍스트별로 키워드 보정을 적용합니다.
+        
+        Args:
+            texts: 분석한 텍스트 리스트
+            probabilities: (텍스트 수, 3) 크기의 클래스 확률 (0: 부정, 1: 중립, 2: 긍정)
+        """
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        
+        # 결과 파싱 (0: 부정, 1: 중립, 2: 긍정)
+        predicted_classes = probabilities.argmax(axis=1)
+        
+        # 점수 계산: 확률 분포를 기반으로 0.0~1.0 범위의 점수로 변환
+        # 방법: (긍정 확률 - 부정 확률)을 0.5를 중심으로 변환
+        # score = 0.5 + (prob_positive - prob_negative) * 0.5
+        # 이렇게 하면:
+        # - 부정만 높으면: 0.0~0.5 (낮은 점수)
+        # - 중립만 높으면: 0.5 근처
+        # - 긍정만 높으면: 0.5~1.0 (높은 점수)
+        # - 혼합된 경우: 확률 차이에 비례
+        # 점수 범위 제한 (0.0~1.0)
+        scores = np.clip(0.5 + (probabilities[:, 2] - probabilities[:, 0]) * 0.5, 0.0, 1.0)
+        
+        return [
+            self._finetuned_result(text, probs, int(predicted_class), float(score))
+            for text, probs, predicted_class, score in zip(texts, probabilities, predicted_classes, scores)
+        ]
+    
+    def _finetuned_result(self, text: str, probabilities: 'np.ndarray', predicted_class: int, score: float) -> SentimentResult:
+        """
+        파인튜닝된 모델의 클래스 확률에 키워드 보정을 적용하여 최종 결과를 만듭니다.
+        
+        Args:
+            text: 분석한 텍스트 (키워드 분석에도 사용)
+            probabilities: 클래스 확률 (0: 부정, 1: 중립, 2: 긍정)
+            predicted_class: 예측 클래스
+            score: 모델 점수 (0.0~1.0)
+        """
+        confidence = float(probabilities[predicted_class])
+        
+        # 각 클래스의 확률
+        prob_negative = float(probabilities[0])  # 부정 확률
+        prob_neutral = float(probabilities[1])   # 중립 확률
+        prob_positive = float(probabilities[2])  # 긍정 확률
+        
+        # 라벨 매핑
+        label = _LABEL_MAP.get(predicted_class, _LABEL_NEU)
+        
+        # 디버깅: 실제 확률 값 출력
+        print(f"[모델 출력] 부정: {prob_negative:.3f}, 중립: {prob_neutral:.3f}, 긍정: {prob_positive:.3f} -> 예측: {label} (신뢰도: {confidence:.3f}, 점수: {score:.3f})")
+        
+        logger.debug("[감정 분석] 텍스트 길이: %d자", len(text))
+        
+        # 파인튜닝된 모델 출력 + 키워드 기반 보정
+        # 본문 앞부분 + 뒷부분을 사용하여 키워드 분석 (모델 입력은 토크나이저가 따로 자름)
+        text_lower = _keyword_window(text)
+        
+        # 키워드 기반 점수 보정
+        positive_count = _POSITIVE_KEYWORD_COUNTER.count(text_lower)
+        negative_count = _NEGATIVE_KEYWORD_COUNTER.count(text_lower)
+        
+        # 문맥 패턴 기반 부정 감지 (한 번의 순회로 감지된 패턴을 모두 수집)
+        detected_patterns = [pattern for pattern, regex in _NEGATIVE_PATTERNS if regex.search(text_lower)]
+        context_negative_count = len(detected_patterns)
+        
+        # 문맥 패턴이 감지되면 부정 점수 추가
+        if context_negative_count > 0:
+            negative_count += context_negative_count
+            # 감지된 패턴 출력 (처음 3개만)
+            if detected_patterns:
+                print(f"[문맥 분석] 부정적 문맥 패턴 {context_negative_count}개 감지: {', '.join(detected_patterns[:3])}")
+        
+        # 키워드 보정 점수 (-0.4 ~ +0.4)
+        # 문맥 패턴은 더 강한 가중치 적용
+        keyword_bias = 0.0
+        if positive_count > 0:
+            keyword_bias = min(0.4, positive_count * 0.1)  # 최대 +0.4
+        if negative_count > 0:
+            # 문맥 패턴이 있으면 더 강한 부정 가중치
+            if context_negative_count > 0:
+                keyword_bias = max(-0.4, -(negative_count * 0.12))  # 문맥 패턴 있으면 더 강하게
+            else:
+                keyword_bias = max(-0.3, -(negative_count * 0.1))  # 최대 -0.3
+        
+        # 보정된 점수 계산
+        adjusted_score = score + keyword_bias
+        adjusted_score = max(0.0, min(1.0, adjusted_score))
+        
+        # 보정된 점수 기반으로 감정 재판단 (긍정 기준 0.65, 부정 기준 0.35)
+        score_index = _score_index(adjusted_score, high=0.65, low=0.35)
+        if score_index != 1:
+            sentiment, image_filename = _LABELS[score_index]
+        else:
+            # 키워드가 강하면 키워드 우선
+            if positive_count >= 2 and positive_count > negative_count:
+                sentiment = _LABEL_POS
+                image_filename = _IMAGE_POS
+                adjusted_score = min(1.0, 0.65 + (positive_count * 0.1))
+            elif negative_count >= 2 and negative_count > positive_count:
+                sentiment = _LABEL_NEG
+                image_filename = _IMAGE_NEG
+                adjusted_score = max(0.0, 0.35 - (negative_count * 0.1))
+            else:
+                sentiment = label  # 모델 예측 유지
+                image_filename = _SENTIMENT_IMAGES[sentiment]
+        
+        # 온도 계산: 보정된 점수를 0~100도 범위로 변환
+        temperature = _score_to_temperature(adjusted_score)
+        
+        # 디버깅 출력
+        if positive_count > 0 or negative_count > 0:
+            print(f"[키워드 보정] 긍정: {positive_count}, 부정: {negative_count}, 보정: {keyword_bias:.2f}, 원점수: {score:.3f} -> 보정점수: {adjusted_score:.3f}")
+        
+        logger.debug("[감정 분석] 최종 결과: %s, 점수: %.3f, 온도: %d도, 이미지: %s", sentiment, score, temperature, image_filename)
+        
+        return SentimentResult(sentiment, score, temperature, image_filename)
+    
+    def analyze_batch(self, texts: List[str], batch_size: int = 16) -> List[SentimentResult]:
+        """
+        여러 텍스트의 감정을 분석합니다.
+        OpenAI API는 요청을 동시에 보내고, 파인튜닝된 모델은 batch_size개씩 묶어 한 번에 추론하며,
+        그 외에는 analyze()를 차례로 호출합니다.
+        
+        Args:
+            texts: 분석할 텍스트 리스트
+            batch_size: 한 번의 forward에 넣을 최대 텍스트 수 (메모리 사용량 제한)
+            
+        Returns:
+            analyze()와 같은 형식의 결과 리스트 (입력 순서 유지)
+        """
+        if self.use_openai and self.openai_client:
+            try:
+                openai_results = self._analyze_many_with_openai(texts)
+            except Exception as e:
+                print(f"OpenAI API 동시 감정 분석 실패, 개별 분석으로 전환: {e}")
+                return [self.analyze(text) for text in texts]
+            return [self._openai_final_result(openai_result) for openai_result in openai_results]
+        
+        self._ensure_local_model()
+        if not (self.use_finetuned_model and self.model and self.tokenizer):
+            return [self.analyze(text) for text in texts]
+        
+        # 강한 부정 키워드가 있는 텍스트는 추론 대상에서 제외
+        results = [self._strong_negative_result(text) for text in texts]
+        
+        # 길이가 비슷한 텍스트끼리 묶어 패딩 낭비를 줄임
+        pending = [i for i, result in enumerate(results) if result is None]
+        order = sorted(pending, key=lambda i: len(texts[i]))
+        probabilities = [None] * len(texts)
+        try:
+            for start in range(0, len(order), batch_size):
+                indices = order[start:start + batch_size]
+                batch_probabilities = self._forward_batch([texts[i] for i in indices])
+                for i, probs in zip(indices, batch_probabilities):
+                    probabilities[i] = probs
+        except Exception as e:
+            # 배치 추론 실패 시 (메모리 부족 등) 한 건씩 분석
+            print(f"배치 감정 분석 오류, 개별 분석으로 전환: {e}")
+            return [self.analyze(text) for text in texts]
+        
+        pending_results = self._finetuned_results(
+            [texts[i] for i in pending],
+            np.stack([probabilities[i] for i in pending]) if pending else np.empty((0, 3))
+        )
+        for i, result in zip(pending, pending_results):
+            results[i] = result
+        return results
+    
+    def analyze_many(self, texts: List[str], max_workers: int = 4) -> List[SentimentResult]:
+        """
+        여러 텍스트를 스레드 풀에서 동시에 analyze()로 분석합니다.
+        모델 추론(GPU)과 OpenAI 요청 대기 중에는 GIL이 풀리므로 다른 기사의 토크나이징/후처리와 겹쳐 실행됩니다.
+        
+        Args:
+            texts: 분석할 텍스트 리스트
+            max_workers: 최대 동시 분석 수
+            
+        Returns:
+            analyze()와 같은 형식의 결과 리스트 (입력 순서 유지)
+        """
+        if len(texts) <= 1:
+            return [self.analyze(text) for text in texts]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(texts))) as executor:
+            return list(executor.map(self.analyze, texts))
+    
+    def analyze(self, text: str, article_id: Optional[int] = None) -> SentimentResult:
         """
         텍스트의 감정을 분석합니다.
         
@@ -280,487 +1025,115 @@ class SentimentAnalyzer:
             article_id: 기사 ID (이미지 파일명에 사용, None이면 해시값 사용)
             
         Returns:
-            {
-                'label': '부정적' | '보통' | '긍정적',
-                'score': float (0.0 ~ 1.0),
-                'temperature': int (0 ~ 100도),
-                'image_path': str (이미지 파일 경로)
-            }
+            SentimentResult(label, score, temperature, image_path)
         """
         # OpenAI API 사용 시
         if self.use_openai and self.openai_client:
             try:
-                openai_result = self._analyze_with_openai(text)
-                label = openai_result['label']
-                score = openai_result['score']
-                
-                # 온도 계산: 점수를 0~100도 범위로 변환
-                temperature = int(score * 100)
-                temperature = max(0, min(100, temperature))
-                
-                # 이미지 경로 결정 (static 폴더 사용)
-                if label == '긍정적':
-                    image_filename = 'static/3.png'
-                elif label == '부정적':
-                    image_filename = 'static/1.png'
-                else:
-                    image_filename = 'static/2.png'
-                
-                print(f"[감정 분석] 최종 결과: {label}, 점수: {score:.3f}, 온도: {temperature}도, 이미지: {image_filename}")
-                
-                return {
-                    'label': label,
-                    'score': score,
-                    'temperature': temperature,
-                    'image_path': image_filename
-                }
+                return self._openai_final_result(self._analyze_with_openai(text))
             except Exception as e:
                 print(f"OpenAI API 감정 분석 실패, 로컬 모델로 폴백: {e}")
                 # 폴백: 로컬 모델 사용
         
+        self._ensure_local_model()
         if not self.classifier and not self.use_finetuned_model:
             # 모델이 없으면 기본값 반환
-            return {
-                'label': '보통',
-                'score': 0.5,
-                'temperature': 50,
-                'image_path': 'static/2.png'
-            }
-        
-        # 전체 본문이 너무 길면 앞부분과 뒷부분을 결합하여 사용
-        # (앞부분: 주요 내용, 뒷부분: 결론/요약)
-        if len(text) > 2000:
-            # 앞부분 1500자 + 뒷부분 500자
-            text_for_analysis = text[:1500] + " " + text[-500:]
-            print(f"[감정 분석] 긴 텍스트 감지: {len(text)}자 -> {len(text_for_analysis)}자로 축약")
-        else:
-            text_for_analysis = text
+            return SentimentResult(_LABEL_NEU, 0.5, 50, _IMAGE_NEU)
         
         try:
             # 파인튜닝된 모델 사용
             if self.use_finetuned_model and self.model and self.tokenizer:
-                # 토크나이징
-                inputs = self.tokenizer(
-                    text_for_analysis,
-                    return_tensors="pt",
-                    truncation=True,
-                    max_length=512,
-                    padding=True
-                )
-                
-                # GPU로 이동
-                inputs = {k: v.to(self.device) for k, v in inputs.items()}
-                
-                # 추론
-                with torch.no_grad():
-                    outputs = self.model(**inputs)
-                    logits = outputs.logits
-                    probabilities = F.softmax(logits, dim=-1)
-                
-                # 결과 파싱 (0: 부정, 1: 중립, 2: 긍정)
-                predicted_class = torch.argmax(probabilities, dim=-1).item()
-                confidence = probabilities[0][predicted_class].item()
+                # 강한 부정 키워드가 있으면 모델 추론 생략
+                strong_negative_result = self._strong_negative_result(text)
+                if strong_negative_result:
+                    return strong_negative_result
                 
-                # 각 클래스의 확률
-                prob_negative = probabilities[0][0].item()  # 부정 확률
-                prob_neutral = probabilities[0][1].item()    # 중립 확률
-                prob_positive = probabilities[0][2].item() # 긍정 확률
-                
-                # 라벨 매핑
-                label_map = {0: '부정적', 1: '보통', 2: '긍정적'}
-                label = label_map.get(predicted_class, '보통')
-                
-                # 점수 계산: 확률 분포를 기반으로 0.0~1.0 범위의 점수로 변환
-                # 방법: (긍정 확률 - 부정 확률)을 0.5를 중심으로 변환
-                # score = 0.5 + (prob_positive - prob_negative) * 0.5
-                # 이렇게 하면:
-                # - 부정만 높으면: 0.0~0.5 (낮은 점수)
-                # - 중립만 높으면: 0.5 근처
-                # - 긍정만 높으면: 0.5~1.0 (높은 점수)
-                # - 혼합된 경우: 확률 차이에 비례
-                score = 0.5 + (prob_positive - prob_negative) * 0.5
-                
-                # 점수 범위 제한 (0.0~1.0)
-                score = max(0.0, min(1.0, score))
-                
-                # 디버깅: 실제 확률 값 출력
-                print(f"[모델 출력] 부정: {prob_negative:.3f}, 중립: {prob_neutral:.3f}, 긍정: {prob_positive:.3f} -> 예측: {label} (신뢰도: {confidence:.3f}, 점수: {score:.3f})")
-                
-            else:
-                # pipeline 사용 (기본 모델)
-                result = self.classifier(text_for_analysis)
-                
-                # 결과 파싱
-                if isinstance(result, list) and len(result) > 0:
-                    result = result[0]
-                
-                label = result.get('label', '')
-                score = result.get('score', 0.5)
+                return self._finetuned_results([text], self._forward_batch([text]))[0]
             
-            # 디버깅: 모델 출력 확인 (파인튜닝된 모델의 경우 위에서 이미 출력됨)
-            if not self.use_finetuned_model:
-                print(f"[감정 분석] 텍스트 길이: {len(text)}자 -> 분석용: {len(text_for_analysis)}자")
-                print(f"[감정 분석] 원본 라벨: {label}, 원본 점수: {score:.3f}")
-            else:
-                print(f"[감정 분석] 텍스트 길이: {len(text)}자 -> 분석용: {len(text_for_analysis)}자")
+            # pipeline 사용 (기본 모델, 긴 본문은 토크나이저가 최대 길이로 자름)
+            result = self.classifier(text, truncation=True)
             
-            # 파인튜닝된 모델의 경우 직접 사용, 기본 모델의 경우 추가 처리
-            if self.use_finetuned_model:
-                # 파인튜닝된 모델 출력 + 키워드 기반 보정
-                # 전체 본문을 사용하여 키워드 분석 (text_for_analysis 사용)
-                text_lower = text_for_analysis.lower()
-                
-                # 뉴스 긍정 키워드
-                positive_keywords = [
-                    '완승', '성공', '승리', '발전', '성장', '증가', '개선', '혁신', '확대', '상승',
-                    '향상', '도약', '기대', '긍정', '호재', '호조', '확장', '투자', '협력',
-                    '파트너십', '기술', '개발', '출시', '수상', '인정', '평가', '우수', '최고',
-                    '1위', '선두', '돌파', '기록', '최대', '최고치', '상승세', '호전', '개선세'
-                ]
-                
-                # 뉴스 부정 키워드
-                # 강한 부정 키워드 (사망, 사고 등) - 강제 부정 분류
-                strong_negative_keywords = [
-                    '숨지', '사망', '사고로', '사고로 인해', '사고로 사망', '방치', '유기',
-                    '살인', '폭행', '강도', '강간', '성폭행', '학대', '폭력', '테러',
-                    '폭발', '화재', '붕괴', '추락', '충돌', '교통사고', '교통사고로',
-                    '사고로 숨지', '사고로 사망', '사고로 부상', '사고로 다쳐',
-                    '비극', '참사', '재난', '재해', '피해자', '희생자', '부상자'
-                ]
-                
-                # 일반 부정 키워드
-                negative_keywords = [
-                    '감소', '하락', '위기', '문제', '사고', '부정', '부실', '실패', '폐쇄',
-                    '도산', '파산', '손실', '적자', '축소', '감원', '해고', '실업', '불안',
-                    '우려', '경고', '위험', '부상', '피해', '비리', '의혹', '논란',
-                    '조롱', '비난', '하락세', '악화', '쇠퇴', '후퇴', '실적부진', '부진'
-                ]
-                
-                # 부정적인 문맥 패턴 (직접적인 부정 단어 없이도 부정적 의미를 나타내는 패턴)
-                negative_patterns = [
-                    # 강한 부정 패턴 (사망, 사고 관련)
-                    r'숨지',  # "숨졌다", "숨져"
-                    r'사망\s*했다',  # "사망했다"
-                    r'방치',  # "방치했다", "방치"
-                    r'유기',  # "유기했다"
-                    r'차에\s*방치',  # "차에 방치"
-                    r'차량에\s*방치',  # "차량에 방치"
-                    r'차에\s*남겨',  # "차에 남겨둔다"
-                    r'차량에\s*남겨',  # "차량에 남겨둔다"
-                    r'사고로\s*숨지',  # "사고로 숨졌다"
-                    r'사고로\s*사망',  # "사고로 사망했다"
-                    r'사고로\s*인해',  # "사고로 인해"
-                    r'교통사고',  # "교통사고"
-                    r'교통사고로',  # "교통사고로"
-                    # 일반 부정 패턴
-                    r'하지\s*못',  # "하지 못했다", "하지 못함"
-                    r'못\s*했다',  # "못했다", "못함"
-                    r'실패\s*했다',  # "실패했다"
-                    r'보다\s*낮',  # "보다 낮다", "보다 낮음"
-                    r'보다\s*못',  # "보다 못하다"
-                    r'못\s*미친',  # "못 미친다", "못 미침"
-                    r'에\s*못\s*미친',  # "에 못 미친다"
-                    r'에\s*실패',  # "에 실패했다"
-                    r'하지\s*않',  # "하지 않았다" (부정적 맥락에서)
-                    r'없\s*었다',  # "없었다"
-                    r'없\s*었음',  # "없었음"
-                    r'없\s*어',  # "없어"
-                    r'부족',  # "부족하다"
-                    r'부족\s*했다',  # "부족했다"
-                    r'미달',  # "미달했다"
-                    r'미달\s*했다',  # "미달했다"
-                    r'기대\s*에\s*못\s*미친',  # "기대에 못 미쳤다"
-                    r'기대\s*이하',  # "기대 이하"
-                    r'예상\s*보다\s*낮',  # "예상보다 낮다"
-                    r'예상\s*보다\s*못',  # "예상보다 못하다"
-                    r'전년\s*대비\s*감소',  # "전년 대비 감소"
-                    r'전년\s*대비\s*하락',  # "전년 대비 하락"
-                    r'전년\s*대비\s*줄어',  # "전년 대비 줄어"
-                    r'전년\s*대비\s*떨어',  # "전년 대비 떨어졌다"
-                    r'전분기\s*대비\s*감소',  # "전분기 대비 감소"
-                    r'전분기\s*대비\s*하락',  # "전분기 대비 하락"
-                    r'목표\s*에\s*못\s*미친',  # "목표에 못 미쳤다"
-                    r'목표\s*이하',  # "목표 이하"
-                    r'목표\s*미달',  # "목표 미달"
-                    r'기록\s*보다\s*낮',  # "기록보다 낮다"
-                    r'기록\s*보다\s*못',  # "기록보다 못하다"
-                    r'이전\s*보다\s*나빠',  # "이전보다 나빠졌다"
-                    r'이전\s*보다\s*떨어',  # "이전보다 떨어졌다"
-                    r'이전\s*보다\s*줄어',  # "이전보다 줄어들었다"
-                    r'에도\s*불구하고',  # "~에도 불구하고" (부정적 맥락)
-                    r'임에도\s*불구',  # "~임에도 불구하고"
-                    r'그럼에도\s*불구',  # "그럼에도 불구하고"
-                    r'그러나',  # "그러나" (대조/부정적 맥락)
-                    r'하지만',  # "하지만" (대조/부정적 맥락)
-                    r'다만',  # "다만" (제한/부정적 맥락)
-                    r'아쉽게도',  # "아쉽게도"
-                    r'안타깝게도',  # "안타깝게도"
-                    r'유감스럽게도',  # "유감스럽게도"
-                    r'아쉽',  # "아쉽다"
-                    r'안타깝',  # "안타깝다"
-                    r'유감',  # "유감이다"
-                    r'우려\s*된다',  # "우려된다"
-                    r'우려\s*가',  # "우려가 있다"
-                    r'걱정\s*된다',  # "걱정된다"
-                    r'걱정\s*이',  # "걱정이 있다"
-                    r'불안\s*하다',  # "불안하다"
-                    r'불안\s*감',  # "불안감"
-                    r'위험\s*하다',  # "위험하다"
-                    r'위험\s*이',  # "위험이 있다"
-                    r'문제\s*가\s*있다',  # "문제가 있다"
-                    r'문제\s*가\s*발생',  # "문제가 발생했다"
-                    r'문제\s*가\s*나타나',  # "문제가 나타났다"
-                    r'어려움',  # "어려움이 있다"
-                    r'어려움\s*을\s*겪',  # "어려움을 겪고 있다"
-                    r'난관',  # "난관에 봉착했다"
-                    r'난관\s*에',  # "난관에"
-                    r'장애',  # "장애가 있다"
-                    r'장애\s*물',  # "장애물"
-                    r'제약',  # "제약이 있다"
-                    r'제약\s*이',  # "제약이"
-                    r'한계',  # "한계가 있다"
-                    r'한계\s*를',  # "한계를 보인다"
-                    r'부족\s*하다',  # "부족하다"
-                    r'부족\s*한',  # "부족한"
-                    r'부족\s*함',  # "부족함"
-                    r'미흡',  # "미흡하다"
-                    r'미흡\s*하다',  # "미흡하다"
-                    r'미흡\s*한',  # "미흡한"
-                    r'아쉬움',  # "아쉬움이 있다"
-                    r'아쉬움\s*을',  # "아쉬움을 남겼다"
-                    r'아쉬운',  # "아쉬운 점"
-                    r'아쉬운\s*점',  # "아쉬운 점"
-                    r'아쉬운\s*부분',  # "아쉬운 부분"
-                ]
-                
-                # 키워드 기반 점수 보정
-                positive_count = sum(1 for keyword in positive_keywords if keyword in text_lower)
-                negative_count = sum(1 for keyword in negative_keywords if keyword in text_lower)
-                
-                # 강한 부정 키워드 감지 (강제 부정 분류)
-                strong_negative_count = sum(1 for keyword in strong_negative_keywords if keyword in text_lower)
-                
-                # 문맥 패턴 기반 부정 감지
-                context_negative_count = 0
-                for pattern in negative_patterns:
-                    if re.search(pattern, text_lower):
-                        context_negative_count += 1
-                
-                # 문맥 패턴이 감지되면 부정 점수 추가
-                if context_negative_count > 0:
-                    negative_count += context_negative_count
-                    # 감지된 패턴 출력 (처음 3개만)
-                    detected_patterns = []
-                    for pattern in negative_patterns:
-                        if re.search(pattern, text_lower):
-                            detected_patterns.append(pattern)
-                            if len(detected_patterns) >= 3:
-                                break
-                    if detected_patterns:
-                        print(f"[문맥 분석] 부정적 문맥 패턴 {context_negative_count}개 감지: {', '.join(detected_patterns[:3])}")
-                
-                # 강한 부정 키워드가 있으면 강제로 부정 분류
-                if strong_negative_count > 0:
-                    print(f"[강한 부정 감지] 강한 부정 키워드 {strong_negative_count}개 감지 - 강제 부정 분류")
-                    sentiment = '부정적'
-                    image_filename = 'static/1.png'
-                    # 강한 부정 키워드가 있으면 점수를 매우 낮게 설정 (0.0~0.2)
-                    adjusted_score = max(0.0, 0.2 - (strong_negative_count * 0.1))
-                    temperature = int(adjusted_score * 100)
-                    temperature = max(0, min(20, temperature))  # 강한 부정은 최대 20도
-                    print(f"[감정 분석] 최종 결과: {sentiment}, 점수: {adjusted_score:.3f}, 온도: {temperature}도, 이미지: {image_filename}")
-                    return {
-                        'label': sentiment,
-                        'score': adjusted_score,
-                        'temperature': temperature,
-                        'image_path': image_filename
-                    }
-                
-                # 키워드 보정 점수 (-0.4 ~ +0.4)
-                # 문맥 패턴은 더 강한 가중치 적용
-                keyword_bias = 0.0
-                if positive_count > 0:
-                    keyword_bias = min(0.4, positive_count * 0.1)  # 최대 +0.4
-                if negative_count > 0:
-                    # 문맥 패턴이 있으면 더 강한 부정 가중치
-                    if context_negative_count > 0:
-                        keyword_bias = max(-0.4, -(negative_count * 0.12))  # 문맥 패턴 있으면 더 강하게
-                    else:
-                        keyword_bias = max(-0.3, -(negative_count * 0.1))  # 최대 -0.3
-                
-                # 보정된 점수 계산
-                adjusted_score = score + keyword_bias
-                adjusted_score = max(0.0, min(1.0, adjusted_score))
-                
-                # 보정된 점수 기반으로 감정 재판단
-                if adjusted_score >= 0.65:  # 긍정 기준
-                    sentiment = '긍정적'
-                    image_filename = 'static/3.png'
-                elif adjusted_score <= 0.35:  # 부정 기준
-                    sentiment = '부정적'
-                    image_filename = 'static/1.png'
-                else:
-                    # 키워드가 강하면 키워드 우선
-                    if positive_count >= 2 and positive_count > negative_count:
-                        sentiment = '긍정적'
-                        image_filename = 'static/3.png'
-                        adjusted_score = min(1.0, 0.65 + (positive_count * 0.1))
-                    elif negative_count >= 2 and negative_count > positive_count:
-                        sentiment = '부정적'
-                        image_filename = 'static/1.png'
-                        adjusted_score = max(0.0, 0.35 - (negative_count * 0.1))
-                    else:
-                        sentiment = label  # 모델 예측 유지
-                        if sentiment == '긍정적':
-                            image_filename = 'static/3.png'
-                        elif sentiment == '부정적':
-                            image_filename = 'static/1.png'
-                        else:
-                            image_filename = 'static/2.png'
-                
-                # 온도 계산: 보정된 점수를 0~100도 범위로 변환
-                temperature = int(adjusted_score * 100)
-                
-                # 온도 범위 제한 (0~100도)
-                temperature = max(0, min(100, temperature))
-                
-                # 디버깅 출력
-                if positive_count > 0 or negative_count > 0:
-                    print(f"[키워드 보정] 긍정: {positive_count}, 부정: {negative_count}, 보정: {keyword_bias:.2f}, 원점수: {score:.3f} -> 보정점수: {adjusted_score:.3f}")
+            # 결과 파싱
+            if isinstance(result, list) and len(result) > 0:
+                result = result[0]
+            
+            label = result.get('label', '')
+            score = result.get('score', 0.5)
+            
+            # 디버깅: 모델 출력 확인
+            logger.debug("[감정 분석] 텍스트 길이: %d자", len(text))
+            logger.debug("[감정 분석] 원본 라벨: %s, 원본 점수: %.3f", label, score)
+            
+            # 기본 모델의 경우 기존 로직 사용
+            # 뉴스 요약에 특화된 감정 분석
+            # 1단계: 모델 출력 기반 초기 감정 판단
+            label_lower = str(label).lower()
+            
+            # 모델별 라벨 매핑
+            is_positive_label = any(keyword in label_lower for keyword in _POSITIVE_LABEL_KEYWORDS)
+            is_negative_label = any(keyword in label_lower for keyword in _NEGATIVE_LABEL_KEYWORDS)
+            is_neutral_label = any(keyword in label_lower for keyword in _NEUTRAL_LABEL_KEYWORDS)
+            
+            # 2단계: 뉴스 도메인 키워드 기반 감정 보정
+            # 본문 앞부분 + 뒷부분을 사용하여 키워드 분석 (모델 입력은 토크나이저가 따로 자름)
+            text_lower = _keyword_window(text)
+            
+            # 키워드 기반 점수 계산
+            positive_count = _BASE_POSITIVE_KEYWORD_COUNTER.count(text_lower)
+            negative_count = _BASE_NEGATIVE_KEYWORD_COUNTER.count(text_lower)
+            
+            # 키워드 기반 보정 점수 (-1.0 ~ 1.0)
+            keyword_bias = 0.0
+            if positive_count > 0:
+                keyword_bias = min(0.3, positive_count * 0.1)  # 최대 +0.3
+            if negative_count > 0:
+                keyword_bias = max(-0.3, -negative_count * 0.1)  # 최대 -0.3
+            
+            # 3단계: 최종 감정 판단 (모델 출력 + 키워드 보정)
+            # 긍정 비율 조정: 긍정 판단 기준을 더 엄격하게 설정 (0.7 이상)
+            if is_positive_label:
+                # 모델이 긍정으로 판단한 경우
+                adjusted_score = min(1.0, score + keyword_bias)
+                # 긍정 기준을 0.5에서 0.7로 상향 조정, 부정 기준도 명확히 설정 (0.3 이하)
+                sentiment, image_filename = _LABELS[_score_index(adjusted_score)]
+                if sentiment == _LABEL_NEU:
+                    image_filename = 'temp/2.png'
+            elif is_negative_label:
+                # 모델이 부정으로 판단한 경우
+                adjusted_score = max(0.0, score - abs(keyword_bias))
+                sentiment, image_filename = _LABELS[_score_index(adjusted_score)]
+                if sentiment == _LABEL_NEU:
+                    image_filename = 'temp/2.png'
             else:
-                # 기본 모델의 경우 기존 로직 사용
-                # 뉴스 요약에 특화된 감정 분석
-                # 1단계: 모델 출력 기반 초기 감정 판단
-                label_lower = str(label).lower()
-                
-                # 모델별 라벨 매핑
-                is_positive_label = any(keyword in label_lower for keyword in [
-                    'positive', '긍정', '5 star', '5star', '4 star', '4star'
-                ])
-                
-                is_negative_label = any(keyword in label_lower for keyword in [
-                    'negative', '부정', '1 star', '1star', '2 star', '2star'
-                ])
-                
-                is_neutral_label = any(keyword in label_lower for keyword in [
-                    'neutral', '보통', '3 star', '3star', '중립'
-                ])
-                
-                # 2단계: 뉴스 도메인 키워드 기반 감정 보정
-                # 전체 본문을 사용하여 키워드 분석
-                text_lower = text_for_analysis.lower()
-                
-                # 뉴스 긍정 키워드 (발전, 성장, 증가, 개선, 혁신, 성공, 확대 등)
-                positive_keywords = [
-                    '발전', '성장', '증가', '개선', '혁신', '성공', '확대', '상승',
-                    '향상', '도약', '기대', '긍정', '호재', '호조', '확대', '확장',
-                    '투자', '협력', '파트너십', '기술', '혁신', '개발', '출시',
-                    '수상', '인정', '평가', '우수', '최고', '1위', '선두'
-                ]
-                
-                # 뉴스 부정 키워드 (감소, 하락, 위기, 문제, 사고, 부정, 부실 등)
-                negative_keywords = [
-                    '감소', '하락', '위기', '문제', '사고', '부정', '부실', '실패',
-                    '폐쇄', '도산', '파산', '손실', '적자', '감소', '축소', '감원',
-                    '해고', '실업', '불안', '우려', '경고', '위험', '사고', '사망',
-                    '부상', '피해', '손실', '비리', '부정', '비리', '의혹', '논란','조롱', '비난'
-                ]
-                
-                # 키워드 기반 점수 계산
-                positive_count = sum(1 for keyword in positive_keywords if keyword in text_lower)
-                negative_count = sum(1 for keyword in negative_keywords if keyword in text_lower)
-                
-                # 키워드 기반 보정 점수 (-1.0 ~ 1.0)
-                keyword_bias = 0.0
-                if positive_count > 0:
-                    keyword_bias = min(0.3, positive_count * 0.1)  # 최대 +0.3
-                if negative_count > 0:
-                    keyword_bias = max(-0.3, -negative_count * 0.1)  # 최대 -0.3
-                
-                # 3단계: 최종 감정 판단 (모델 출력 + 키워드 보정)
-                # 긍정 비율 조정: 긍정 판단 기준을 더 엄격하게 설정 (0.7 이상)
-                if is_positive_label:
-                    # 모델이 긍정으로 판단한 경우
-                    adjusted_score = min(1.0, score + keyword_bias)
-                    if adjusted_score >= 0.7:  # 긍정 기준을 0.5에서 0.7로 상향 조정
-                        sentiment = '긍정적'
-                        image_filename = 'static/3.png'
-                    elif adjusted_score <= 0.3:  # 부정 기준도 명확히 설정
-                        sentiment = '부정적'
-                        image_filename = 'static/1.png'
-                    else:
-                        sentiment = '보통'
-                        image_filename = 'temp/2.png'
-                elif is_negative_label:
-                    # 모델이 부정으로 판단한 경우
-                    adjusted_score = max(0.0, score - abs(keyword_bias))
-                    if adjusted_score <= 0.3:
-                        sentiment = '부정적'
-                        image_filename = 'static/1.png'
-                    elif adjusted_score >= 0.7:
-                        sentiment = '긍정적'
-                        image_filename = 'static/3.png'
-                    else:
-                        sentiment = '보통'
-                        image_filename = 'temp/2.png'
+                # 모델이 중립이거나 알 수 없는 경우
+                # 키워드 기반으로 판단
+                final_score = score + keyword_bias
+                if positive_count > negative_count and positive_count > 2:  # 긍정 키워드가 2개 이상일 때만 긍정 판단
+                    sentiment = _LABEL_POS
+                    image_filename = _IMAGE_POS
+                    # 키워드 기반 점수 계산 (0.7~1.0 범위)
+                    final_score = min(1.0, 0.7 + (min(positive_count, 5) * 0.06))
+                elif negative_count > positive_count and negative_count > 0:
+                    sentiment = _LABEL_NEG
+                    image_filename = _IMAGE_NEG
+                    # 키워드 기반 점수 계산 (0.0~0.3 범위)
+                    final_score = max(0.0, 0.3 - (min(negative_count, 5) * 0.06))
                 else:
-                    # 모델이 중립이거나 알 수 없는 경우
-                    # 키워드 기반으로 판단
-                    final_score = score + keyword_bias
-                    if positive_count > negative_count and positive_count > 2:  # 긍정 키워드가 2개 이상일 때만 긍정 판단
-                        sentiment = '긍정적'
-                        image_filename = 'static/3.png'
-                        # 키워드 기반 점수 계산 (0.7~1.0 범위)
-                        final_score = min(1.0, 0.7 + (min(positive_count, 5) * 0.06))
-                    elif negative_count > positive_count and negative_count > 0:
-                        sentiment = '부정적'
-                        image_filename = 'static/1.png'
-                        # 키워드 기반 점수 계산 (0.0~0.3 범위)
-                        final_score = max(0.0, 0.3 - (min(negative_count, 5) * 0.06))
-                    else:
-                        # 키워드가 없거나 균형인 경우 score 기반 판단
-                        if final_score >= 0.7:  # 긍정 기준 상향
-                            sentiment = '긍정적'
-                            image_filename = 'static/3.png'
-                        elif final_score <= 0.3:  # 부정 기준 하향
-                            sentiment = '부정적'
-                            image_filename = 'static/1.png'
-                        else:
-                            sentiment = '보통'
-                            image_filename = 'static/2.png'
-                
-                # 점수와 온도를 같게 설정 (score * 100)
-                temperature = int(score * 100)
+                    # 키워드가 없거나 균형인 경우 score 기반 판단 (긍정 0.7 이상, 부정 0.3 이하)
+                    sentiment, image_filename = _LABELS[_score_index(final_score)]
             
-            # 온도 범위 제한
-            temperature = max(0, min(100, temperature))
+            # 점수와 온도를 같게 설정 (score * 100, 0~100도로 제한)
+            temperature = _score_to_temperature(score)
             
-            # 디버깅 출력 (파인튜닝된 모델과 기본 모델 구분)
-            if self.use_finetuned_model:
-                # 파인튜닝된 모델의 경우 위에서 이미 키워드 보정 출력이 있음
-                print(f"[감정 분석] 최종 결과: {sentiment}, 점수: {score:.3f}, 온도: {temperature}도, 이미지: {image_filename}")
-            else:
-                print(f"[감정 분석] 키워드 분석 - 긍정: {positive_count}, 부정: {negative_count}, 보정: {keyword_bias:.2f}")
-                print(f"[감정 분석] 최종 결과: {sentiment}, 점수: {score:.3f}, 온도: {temperature}도, 이미지: {image_filename}")
+            logger.debug("[감정 분석] 키워드 분석 - 긍정: %d, 부정: %d, 보정: %.2f", positive_count, negative_count, keyword_bias)
+            logger.debug("[감정 분석] 최종 결과: %s, 점수: %.3f, 온도: %d도, 이미지: %s", sentiment, score, temperature, image_filename)
             
-            return {
-                'label': sentiment,
-                'score': score,
-                'temperature': temperature,
-                'image_path': image_filename
-            }
+            return SentimentResult(sentiment, score, temperature, image_filename)
             
         except Exception as e:
-            print(f"감정 분석 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("감정 분석 오류: %s", e)
             # 오류 시 기본값 반환
-            return {
-                'label': '보통',
-                'score': 0.5,
-                'temperature': 50,
-                'image_path': 'static/2.png'
-            }
+            return SentimentResult(_LABEL_NEU, 0.5, 50, _IMAGE_NEU)
     
     def _create_sentiment_image(self, sentiment: str, temperature: int, image_path: str):
         """
@@ -829,7 +1202,38 @@ class SentimentAnalyzer:
         print(f"이미지 저장 완료: {image_path}")
 
 
+def export_onnx_int8(model_path: str = "./sentiment_model", output_path: str = _ONNX_MODEL_PATH):
+    """
+    파인튜닝된 모델을 ONNX로 변환하고 INT8 동적 양자화하여 저장합니다 (최초 1회 실행).
+    저장된 모델은 CPU에서 SentimentAnalyzer가 자동으로 우선 사용합니다.
+    
+    Args:
+        model_path: 파인튜닝된 모델 경로
+        output_path: ONNX INT8 모델을 저장할 경로
+    """
+    if not ORT_AVAILABLE:
+        raise ImportError("optimum이 설치되지 않았습니다. pip install optimum[onnxruntime]를 실행하세요.")
+    
+    print(f"ONNX 변환 중: {model_path}")
+    ort_model = ORTModelForSequenceClassification.from_pretrained(model_path, export=True)
+    
+    print("INT8 동적 양자화 중...")
+    quantizer = ORTQuantizer.from_pretrained(ort_model)
+    quantization_config = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=output_path, quantization_config=quantization_config)
+    
+    # 토크나이저도 함께 저장 (로드 시 같은 경로 사용)
+    AutoTokenizer.from_pretrained(model_path).save_pretrained(output_path)
+    print(f"✅ ONNX INT8 모델 저장 완료: {output_path}")
+
+
 if __name__ == '__main__':
+    import sys
+    if len(sys.argv) > 1 and sys.argv[1] == '--export-onnx':
+        # python src/sentiment_analyzer.py --export-onnx
+        export_onnx_int8()
+        sys.exit(0)
+    
     # 테스트
     analyzer = SentimentAnalyzer()
     result = analyzer.analyze("오늘은 정말 좋은 날입니다!")
@@ -44,9 +44,30 @@ print("📍 API 문서: http://localhost:8000/docs")
 print("=" * 60)
 print("\n⏹️  서버를 종료하려면 Ctrl+C를 누르세요.\n")
 
+# 워커 수 (기본 1개)
+# 로그인 세션이 프로세스별 dict(app.sessions)에 저장되고 워커마다 감정 분석/요약 모델을 따로 로드하므로,
+# 세션을 공유 저장소로 옮기기 전까지는 WORKERS를 지정했을 때만 여러 워커로 실행
+workers = int(os.getenv('WORKERS', 1))
+
+# uvloop/httptools가 설치되어 있으면 사용 (uvloop는 Windows 미지원)
+try:
+    import uvloop  # noqa: F401
+    loop = "uvloop"
+except ImportError:
+    loop = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    http = "httptools"
+except ImportError:
+    http = "h11"
+
+print(f"   워커 수: {workers}, 이벤트 루프: {loop}, HTTP: {http}\n")
+
 try:
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000, reload=False)
+    # 워커가 여러 개일 때는 "모듈:앱" 문자열로 전달해야 함
+    uvicorn.run("app:app", host="127.0.0.1", port=8000, workers=workers, loop=loop, http=http)
 except KeyboardInterrupt:
     print("\n\n서버가 종료되었습니다.")
 except Exception as e: